@@ -0,0 +1,19 @@
+"""
+Shared event loop helper for the async scripts
+"""
+
+import asyncio
+
+def run(main):
+    """
+    Run a coroutine to completion, like asyncio.run
+
+    Uses the faster uvloop event loop when it is installed (it ships with
+    uvicorn[standard]).
+    """
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    return asyncio.run(main)
@@ -0,0 +1,74 @@
+"""
+Shared HTTP helpers for the API test scripts
+"""
+
+import functools
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_BASE_URL = "http://localhost:8000"
+HEALTH_TIMEOUT = 2.0
+
+# Process-wide keep-alive session for scripts that import these helpers; after
+# login() it also carries the Authorization header.
+# No default Content-Type: json=/data=/files= each set the right one.
+# Connection failures are retried with a short backoff; urllib3 never
+# re-sends a POST once the server has read it.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+def api_url(path: str) -> str:
+    """Return the absolute URL for an API path"""
+    return f"{API_BASE_URL}{path}"
+
+@functools.lru_cache(maxsize=1)
+def api_health_status() -> int:
+    """
+    Return the status code of the health endpoint
+
+    The API is probed once per process, so scripts run together share a
+    single request. Connection errors propagate and are not cached.
+    """
+    return SESSION.get(api_url("/api/v1/health"), timeout=HEALTH_TIMEOUT).status_code
+
+def health() -> bool:
+    """Test if the API is running"""
+    try:
+        status_code = api_health_status()
+        if status_code == 200:
+            print("✅ API is running and healthy")
+            return True
+        else:
+            print(f"❌ Health check failed: {status_code}")
+            return False
+    except Exception as e:
+        print(f"❌ Cannot connect to API: {e}")
+        return False
+
+def login(email: str, password: str):
+    """
+    Log in through the form-based JWT endpoint
+
+    On success the session sends the bearer token with every later request.
+    Returns the raw response so callers can report failures.
+    """
+    response = SESSION.post(
+        api_url("/api/v1/auth/jwt/login"),
+        data={"username": email, "password": password}  # FastAPI Users uses 'username'
+    )
+    if response.status_code == 200:
+        token = orjson.loads(response.content)["access_token"]
+        SESSION.headers["Authorization"] = f"Bearer {token}"
+    return response
+
+def authed_get(path: str):
+    """GET a protected endpoint with the session's bearer token"""
+    return SESSION.get(api_url(path))
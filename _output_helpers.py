@@ -0,0 +1,48 @@
+"""
+Shared stdout capture for scripts that run their checks concurrently
+"""
+
+import contextlib
+import contextvars
+import io
+import sys
+
+# Buffer the current check prints into; each thread and asyncio task sees its own
+_output_buffer = contextvars.ContextVar('_output_buffer', default=None)
+
+class TaskOutput(io.TextIOBase):
+    """stdout proxy that sends each running check's prints to its own buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        return (_output_buffer.get() or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+@contextlib.contextmanager
+def buffered_stdout():
+    """Route prints through TaskOutput until the block exits"""
+    real_stdout = sys.stdout
+    sys.stdout = TaskOutput(real_stdout)
+    try:
+        yield
+    finally:
+        sys.stdout = real_stdout
+
+@contextlib.contextmanager
+def captured_output():
+    """
+    Collect the current thread's or task's prints into a fresh buffer
+
+    Only takes effect inside buffered_stdout(); yields the StringIO so the
+    caller can print its contents once the check is done.
+    """
+    buffer = io.StringIO()
+    token = _output_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _output_buffer.reset(token)
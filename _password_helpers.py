@@ -0,0 +1,16 @@
+"""
+Shared password hashing for the user management scripts
+"""
+
+import os
+
+from fastapi_users.password import PasswordHelper
+from passlib.context import CryptContext
+
+# bcrypt cost factor; each step down halves hashing time (passlib default is 12)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Shared password helper, configured once per process
+PASSWORD_HELPER = PasswordHelper(
+    CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+)
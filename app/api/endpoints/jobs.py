@@ -96,6 +96,8 @@ async def match_jobs(
     Returns:
         Task ID and status for tracking the job matching process
     """
+    file_path = None
+    task = None
     try:
         # Parse and validate parameters
         parsed_similarity_threshold = parse_float_param(similarity_threshold)
@@ -141,10 +143,10 @@ async def match_jobs(
         # Validate file
         file_service.validate_file(file)
         
-        # Read file content
-        file_content = await file.read()
+        # Stream the upload to disk; the worker reads it from the shared upload dir
+        file_path, file_size = await file_service.save_upload(file)
         
-        if len(file_content) == 0:
+        if file_size == 0:
             raise HTTPException(
                 status_code=400,
                 detail="Empty file uploaded"
@@ -182,7 +184,7 @@ async def match_jobs(
         
         # Trigger Celery task
         task = process_resume_and_match_jobs.delay(
-            file_content=file_content,
+            file_path=file_path,
             filename=file.filename,
             content_type=file.content_type,
             user_id=user.id if user else None,
@@ -211,8 +213,12 @@ async def match_jobs(
         )
         
     except HTTPException:
+        if file_path and task is None:
+            file_service.remove_upload(file_path)
         raise
     except Exception as e:
+        if file_path and task is None:
+            file_service.remove_upload(file_path)
         logger.error(f"Error in match_jobs endpoint: {str(e)}")
         raise HTTPException(
             status_code=500,
@@ -2,96 +2,169 @@
 Task management endpoints
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+import asyncio
 import logging
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional
 
+import redis.asyncio as aioredis
+from celery.backends.redis import RedisBackend
+
+from app.core.config import settings
 from app.models import TaskStatusResponse, TaskStatus, JobDetail
 from app.core.celery_app import celery_app
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Seconds between backend checks while a status request is long-polling;
+# the interval doubles up to the maximum the longer the task runs
+LONG_POLL_MIN_INTERVAL = 0.25
+LONG_POLL_MAX_INTERVAL = 2.0
+
+# Seconds of silence after which an event stream sends a keep-alive comment
+EVENT_KEEPALIVE = 15
+
+# Seconds between status reads when the result backend has no pub/sub
+# channel to wait on; the interval doubles up to the maximum while the
+# status stays the same
+EVENT_POLL_MIN_INTERVAL = 0.5
+EVENT_POLL_MAX_INTERVAL = 5.0
+
+# States after which a task's status no longer changes
+FINAL_STATES = {TaskStatus.SUCCESS, TaskStatus.FAILURE, TaskStatus.REVOKED}
+
+
+def _result_channel(task_id: str) -> Optional[bytes]:
+    """
+    Return the pub/sub channel the result backend publishes a task's updates
+    on, or None when the backend does not publish them
+    """
+    backend = celery_app.backend
+    if isinstance(backend, RedisBackend):
+        return backend.get_key_for_task(task_id)
+    return None
+
+
+async def _wait_until_ready(task_id: str, wait: float) -> None:
+    """
+    Wait until a task finishes or `wait` seconds pass
+    
+    Each readiness check is a blocking result-backend read, so it runs in
+    the threadpool; checks start every LONG_POLL_MIN_INTERVAL seconds and
+    back off to LONG_POLL_MAX_INTERVAL.
+    """
+    task_result = celery_app.AsyncResult(task_id)
+    deadline = time.monotonic() + wait
+    delay = LONG_POLL_MIN_INTERVAL
+    
+    while not await run_in_threadpool(task_result.ready):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, LONG_POLL_MAX_INTERVAL)
+
+
+def _build_task_status(task_id: str) -> TaskStatusResponse:
+    """
+    Read a task's state from the result backend and build its status response
+    
+    Blocking; async callers run it in the threadpool.
+    """
+    task_result = celery_app.AsyncResult(task_id)
+    
+    if task_result.state == 'PENDING':
+        return TaskStatusResponse(
+            task_id=task_id,
+            status=TaskStatus.PENDING,
+            progress="Task is waiting to be processed...",
+            progress_percentage=0
+        )
+    
+    elif task_result.state == 'STARTED':
+        progress_info = task_result.info if task_result.info else {}
+        progress = progress_info.get('progress', 'Processing...')
+        percentage = progress_info.get('percentage', 10)
+        
+        return TaskStatusResponse(
+            task_id=task_id,
+            status=TaskStatus.STARTED,
+            progress=progress,
+            progress_percentage=percentage,
+            started_at=progress_info.get('started_at')
+        )
+    
+    elif task_result.state == 'SUCCESS':
+        result_data = task_result.result
+        
+        # Convert matched jobs to JobDetail objects
+        matched_jobs = []
+        if 'matched_jobs' in result_data:
+            for job_data in result_data['matched_jobs']:
+                job_detail = JobDetail(**job_data)
+                matched_jobs.append(job_detail)
+        
+        return TaskStatusResponse(
+            task_id=task_id,
+            status=TaskStatus.SUCCESS,
+            result=matched_jobs,
+            progress="Job matching completed successfully",
+            progress_percentage=100,
+            processing_time_seconds=result_data.get('processing_time_seconds'),
+            metadata={
+                'total_jobs_found': result_data.get('total_jobs_found', 0),
+                'matched_jobs_count': result_data.get('matched_jobs_count', 0),
+                'extracted_skills': result_data.get('extracted_skills', {})
+            }
+        )
+    
+    elif task_result.state == 'FAILURE':
+        error_info = task_result.info if task_result.info else {}
+        error_msg = error_info.get('error', str(task_result.info)) if task_result.info else "Unknown error occurred"
+        
+        return TaskStatusResponse(
+            task_id=task_id,
+            status=TaskStatus.FAILURE,
+            error=error_msg,
+            progress="Task failed",
+            progress_percentage=0
+        )
+    
+    else:
+        return TaskStatusResponse(
+            task_id=task_id,
+            status=TaskStatus(task_result.state),
+            progress=f"Task state: {task_result.state}",
+            progress_percentage=50
+        )
+
 
 @router.get("/{task_id}/status", response_model=TaskStatusResponse)
-async def get_task_status(task_id: str):
+async def get_task_status(
+    task_id: str,
+    wait: float = Query(0, ge=0, le=30, description="Seconds to hold the request until the task finishes")
+):
     """
     Get the status of a job matching task.
     
     Args:
         task_id: The task ID returned from the match-jobs endpoint
+        wait: Optional long-poll budget; 0 answers immediately
         
     Returns:
         Task status and results (if completed)
     """
     try:
-        # Get task result
-        task_result = celery_app.AsyncResult(task_id)
-        
-        if task_result.state == 'PENDING':
-            return TaskStatusResponse(
-                task_id=task_id,
-                status=TaskStatus.PENDING,
-                progress="Task is waiting to be processed...",
-                progress_percentage=0
-            )
-        
-        elif task_result.state == 'STARTED':
-            progress_info = task_result.info if task_result.info else {}
-            progress = progress_info.get('progress', 'Processing...')
-            percentage = progress_info.get('percentage', 10)
-            
-            return TaskStatusResponse(
-                task_id=task_id,
-                status=TaskStatus.STARTED,
-                progress=progress,
-                progress_percentage=percentage,
-                started_at=progress_info.get('started_at')
-            )
-        
-        elif task_result.state == 'SUCCESS':
-            result_data = task_result.result
-            
-            # Convert matched jobs to JobDetail objects
-            matched_jobs = []
-            if 'matched_jobs' in result_data:
-                for job_data in result_data['matched_jobs']:
-                    job_detail = JobDetail(**job_data)
-                    matched_jobs.append(job_detail)
-            
-            return TaskStatusResponse(
-                task_id=task_id,
-                status=TaskStatus.SUCCESS,
-                result=matched_jobs,
-                progress="Job matching completed successfully",
-                progress_percentage=100,
-                processing_time_seconds=result_data.get('processing_time_seconds'),
-                metadata={
-                    'total_jobs_found': result_data.get('total_jobs_found', 0),
-                    'matched_jobs_count': result_data.get('matched_jobs_count', 0),
-                    'extracted_skills': result_data.get('extracted_skills', {})
-                }
-            )
+        # Long-poll: answer as soon as the task finishes or the budget runs out
+        if wait:
+            await _wait_until_ready(task_id, wait)
         
-        elif task_result.state == 'FAILURE':
-            error_info = task_result.info if task_result.info else {}
-            error_msg = error_info.get('error', str(task_result.info)) if task_result.info else "Unknown error occurred"
-            
-            return TaskStatusResponse(
-                task_id=task_id,
-                status=TaskStatus.FAILURE,
-                error=error_msg,
-                progress="Task failed",
-                progress_percentage=0
-            )
-        
-        else:
-            return TaskStatusResponse(
-                task_id=task_id,
-                status=TaskStatus(task_result.state),
-                progress=f"Task state: {task_result.state}",
-                progress_percentage=50
-            )
+        # Result backend reads block, so keep them off the event loop
+        return await run_in_threadpool(_build_task_status, task_id)
             
     except Exception as e:
         logger.error(f"Error getting task status for {task_id}: {str(e)}")
@@ -101,6 +174,84 @@ async def get_task_status(task_id: str):
         )
 
 
+@router.get("/{task_id}/events")
+async def stream_task_status(
+    task_id: str,
+    timeout: float = Query(300, ge=1, le=600, description="Seconds before the stream closes")
+):
+    """
+    Stream the status of a job matching task as Server-Sent Events.
+    
+    Each event carries the same payload as the status endpoint and is sent
+    whenever it changes; the stream ends once the task finishes or the
+    timeout passes.
+    """
+    async def events():
+        deadline = time.monotonic() + timeout
+        last_payload = None
+        last_sent = time.monotonic()
+        delay = EVENT_POLL_MIN_INTERVAL
+        
+        # The Redis result backend publishes every state update on the task's
+        # key, so the status is only re-read when something was published.
+        # Subscribe before the first read so no update is missed in between.
+        channel = _result_channel(task_id)
+        client = pubsub = None
+        if channel is not None:
+            client = aioredis.from_url(settings.CELERY_RESULT_BACKEND)
+            pubsub = client.pubsub()
+        
+        try:
+            if pubsub is not None:
+                await pubsub.subscribe(channel)
+            
+            while time.monotonic() < deadline:
+                status = await run_in_threadpool(_build_task_status, task_id)
+                
+                payload = status.model_dump_json()
+                if payload != last_payload:
+                    yield f"data: {payload}\n\n"
+                    last_payload = payload
+                    last_sent = time.monotonic()
+                    delay = EVENT_POLL_MIN_INTERVAL
+                    if status.status in FINAL_STATES:
+                        return
+                elif time.monotonic() - last_sent >= EVENT_KEEPALIVE:
+                    yield ": keep-alive\n\n"
+                    last_sent = time.monotonic()
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                
+                if pubsub is not None:
+                    # Wake on the next published update, or in time for a keep-alive
+                    keepalive_due = EVENT_KEEPALIVE - (time.monotonic() - last_sent)
+                    await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=max(min(keepalive_due, remaining), 0.1)
+                    )
+                else:
+                    await asyncio.sleep(min(delay, remaining))
+                    delay = min(delay * 2, EVENT_POLL_MAX_INTERVAL)
+        
+        except Exception as e:
+            logger.error(f"Error streaming task status for {task_id}: {str(e)}")
+            yield f"event: error\ndata: Error retrieving task status: {str(e)}\n\n"
+        
+        finally:
+            if pubsub is not None:
+                await pubsub.reset()
+            if client is not None:
+                await client.aclose()
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @router.delete("/{task_id}")
 async def cancel_task(task_id: str):
     """
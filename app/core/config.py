@@ -54,6 +54,7 @@ class Settings(BaseSettings):
     CELERY_RESULT_BACKEND: Optional[str] = None
     CELERY_TASK_TIME_LIMIT: int = 30 * 60  # 30 minutes
     CELERY_TASK_SOFT_TIME_LIMIT: int = 25 * 60  # 25 minutes
+    CELERY_RESULT_EXPIRES: int = 24 * 60 * 60  # 1 day
     
     @validator("CELERY_BROKER_URL", pre=True)
     def assemble_celery_broker(cls, v: Optional[str], values: dict) -> str:
@@ -89,6 +90,11 @@ class Settings(BaseSettings):
     SCRAPING_MIN_DELAY: float = 1.0  # Minimum delay between requests (seconds)
     SCRAPING_MAX_DELAY: float = 3.0  # Maximum delay between requests (seconds)
     SCRAPING_MAX_RETRIES: int = 3    # Maximum retries for failed requests
+    # Seconds a source's results are reused; off by default because a worker
+    # process keeps one scraper, so cached listings would be shared (and
+    # stale) across every user's task that searches the same query
+    SCRAPING_CACHE_TTL: int = 0
+    SCRAPING_CACHE_MAX_ENTRIES: int = 256  # Cached (source, query, location) results kept per process
     
     # Free job board settings
     ENABLE_REMOTEOK: bool = True
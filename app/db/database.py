@@ -3,6 +3,7 @@ Database connection and session management
 """
 
 from typing import AsyncGenerator
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -14,6 +15,18 @@ engine = create_async_engine(
     future=True
 )
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Use write-ahead logging with NORMAL sync: commits no longer fsync the
+        rollback journal, and readers don't block the writer
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 # Create async session factory
 async_session_maker = sessionmaker(
     engine,
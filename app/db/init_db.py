@@ -3,28 +3,31 @@ Database initialization script
 """
 
 import asyncio
-from sqlalchemy.ext.asyncio import create_async_engine
-from app.core.config import settings
+from app.db.database import engine as default_engine
 from app.models.user import Base
 
-async def init_db():
+async def init_db(engine=None):
     """
     Initialize database tables
+    
+    Args:
+        engine: Async engine to use (defaults to the shared application engine,
+            so setup scripts don't each build and warm up their own)
     """
-    # Create engine for initialization
-    engine = create_async_engine(
-        settings.DATABASE_URL,
-        echo=settings.DB_ECHO,
-    )
+    engine = engine or default_engine
     
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    # Close engine
-    await engine.dispose()
-    
     print("Database tables created successfully!")
 
+async def _main():
+    """Create the tables, then release the engine's connections"""
+    try:
+        await init_db()
+    finally:
+        await default_engine.dispose()
+
 if __name__ == "__main__":
-    asyncio.run(init_db())
\ No newline at end of file
+    asyncio.run(_main())
\ No newline at end of file
@@ -3,10 +3,13 @@ File handling service
 """
 
 import io
+import os
+import tempfile
 import pdfplumber
 from fastapi import UploadFile, HTTPException
-from typing import Tuple
+from typing import Tuple, Union
 import logging
+import mmap
 
 from app.core.config import settings
 
@@ -21,6 +24,8 @@ class FileService:
     def __init__(self):
         self.max_file_size = settings.MAX_FILE_SIZE_MB * 1024 * 1024  # Convert to bytes
         self.allowed_types = settings.ALLOWED_FILE_TYPES
+        self.upload_dir = settings.UPLOAD_DIR
+        self.chunk_size = 64 * 1024
     
     def validate_file(self, file: UploadFile) -> None:
         """
@@ -47,12 +52,108 @@ class FileService:
                 detail=f"File size too large. Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
             )
     
-    def extract_text_from_pdf(self, file_content: bytes) -> str:
+    def _create_upload_file(self, filename: str) -> Tuple[int, str]:
+        """
+        Create a uniquely named file in the upload directory
+        
+        Args:
+            filename: Original filename, used for the extension
+            
+        Returns:
+            Tuple of (file descriptor, file path)
+        """
+        os.makedirs(self.upload_dir, exist_ok=True)
+        extension = os.path.splitext(filename or "")[1].lower()
+        return tempfile.mkstemp(prefix="resume_", suffix=extension, dir=self.upload_dir)
+    
+    async def save_upload(self, file: UploadFile) -> Tuple[str, int]:
+        """
+        Stream an uploaded file to the upload directory in chunks
+        
+        Args:
+            file: The uploaded file
+            
+        Returns:
+            Tuple of (file path, size in bytes)
+            
+        Raises:
+            HTTPException: If the file is too large
+        """
+        fd, file_path = self._create_upload_file(file.filename)
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    chunk = await file.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > self.max_file_size:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"File size too large. Maximum size: {settings.MAX_FILE_SIZE_MB}MB"
+                        )
+                    out.write(chunk)
+        except BaseException:
+            self.remove_upload(file_path)
+            raise
+        
+        return file_path, size
+    
+    def save_file_content(self, file_content: bytes, filename: str) -> str:
+        """
+        Write in-memory file content to the upload directory
+        
+        Args:
+            file_content: File content as bytes
+            filename: Original filename, used for the extension
+            
+        Returns:
+            Path of the saved file
+        """
+        fd, file_path = self._create_upload_file(filename)
+        with os.fdopen(fd, 'wb') as out:
+            out.write(file_content)
+        return file_path
+    
+    def remove_upload(self, file_path: str) -> None:
+        """
+        Delete a saved upload, ignoring files that are already gone
+        
+        Args:
+            file_path: Path of the saved file
+        """
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove upload {file_path}: {str(e)}")
+    
+    def extract_text_from_saved_file(self, file_path: str, content_type: str) -> Tuple[str, int]:
+        """
+        Extract text from a saved upload via a read-only memory map
+        
+        Args:
+            file_path: Path of the saved file
+            content_type: MIME type of the file
+            
+        Returns:
+            Tuple of (extracted text, size in bytes)
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                raise ValueError("Uploaded file is empty")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self.extract_text_from_file(mm, content_type), size
+    
+    def extract_text_from_pdf(self, file_content: Union[bytes, mmap.mmap]) -> str:
         """
         Extract text from PDF file content
         
         Args:
-            file_content: PDF file content as bytes
+            file_content: PDF file content as bytes or a memory-mapped file
             
         Returns:
             Extracted text as string
@@ -61,7 +162,9 @@ class FileService:
             Exception: If PDF extraction fails
         """
         try:
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+            # A memory map is already a seekable file object, so it is read in place
+            stream = file_content if isinstance(file_content, mmap.mmap) else io.BytesIO(file_content)
+            with pdfplumber.open(stream) as pdf:
                 text = ""
                 for page in pdf.pages:
                     page_text = page.extract_text()
@@ -79,12 +182,12 @@ class FileService:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             raise ValueError(f"Failed to extract text from PDF: {str(e)}")
     
-    def extract_text_from_file(self, file_content: bytes, content_type: str) -> str:
+    def extract_text_from_file(self, file_content: Union[bytes, mmap.mmap], content_type: str) -> str:
         """
         Extract text from file based on content type
         
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes or a memory-mapped file
             content_type: MIME type of the file
             
         Returns:
@@ -94,14 +197,14 @@ class FileService:
             return self.extract_text_from_pdf(file_content)
         elif content_type == 'text/plain':
             try:
-                text = file_content.decode('utf-8')
+                text = str(file_content, 'utf-8')
                 if not text.strip():
                     raise ValueError("Text file is empty")
                 return text
             except UnicodeDecodeError:
                 try:
                     # Try with different encoding
-                    text = file_content.decode('latin-1')
+                    text = str(file_content, 'latin-1')
                     if not text.strip():
                         raise ValueError("Text file is empty")
                     return text
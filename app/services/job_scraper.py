@@ -5,8 +5,9 @@ Job scraping service
 import requests
 import asyncio
 import aiohttp
+import functools
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Hashable, Callable, Awaitable
 import logging
 from datetime import datetime
 import time
@@ -20,15 +21,77 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into one in-flight coroutine
+    
+    Every caller awaits the same task and gets its result or exception. The
+    task is shielded, so a caller that times out or is cancelled doesn't
+    cancel the work the other callers are waiting on.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+
+def cached_source(scrape):
+    """
+    Reuse a source scraper's results for the scraper's cache_ttl seconds
+    
+    Results are kept per (source, query, location) and serve any request for
+    at most as many jobs as were fetched. Concurrent identical calls share a
+    single fetch, and empty results (failed or blocked scrapes) are not kept.
+    Callers get copies, so mutating a returned job never touches the cache.
+    
+    cache_ttl defaults to SCRAPING_CACHE_TTL, which is 0 (off): a worker
+    keeps one scraper per process, so cached listings would be shared across
+    users' tasks. Scripts that probe the same sources repeatedly turn it on
+    for their own scraper. It holds at most SCRAPING_CACHE_MAX_ENTRIES
+    results; expired ones go first, then the oldest.
+    """
+    @functools.wraps(scrape)
+    async def wrapper(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
+        ttl = self.cache_ttl
+        key = (scrape.__name__, query, location)
+        
+        cached = self._source_cache.get(key)
+        if ttl > 0 and cached and cached[0] > time.monotonic() and cached[1] >= limit:
+            return [dict(job) for job in cached[2][:limit]]
+        
+        async def fetch():
+            jobs = await scrape(self, query, location, limit)
+            if ttl > 0 and jobs:
+                self._store_cached_source(key, (time.monotonic() + ttl, limit, jobs))
+            return jobs
+        
+        jobs = await self._single_flight.do(key + (limit,), fetch)
+        return [dict(job) for job in jobs]
+    
+    return wrapper
+
+
 class JobScraperService:
     """
     Service for scraping job listings from various sources
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Args:
+            session: Optional shared aiohttp session; it is left open by close()
+        """
         self.timeout = settings.JOB_SCRAPING_TIMEOUT
         self.use_mock = settings.USE_MOCK_JOBS
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         
         # Rate limiting settings
         self.min_delay = settings.SCRAPING_MIN_DELAY
@@ -36,6 +99,11 @@ class JobScraperService:
         self.max_retries = settings.SCRAPING_MAX_RETRIES
         self.last_request_time = {}  # Track last request time per domain
         
+        # Per-source result cache and in-flight fetches, see cached_source
+        self.cache_ttl = settings.SCRAPING_CACHE_TTL
+        self._source_cache = {}  # (source, query, location) -> (expiry, limit, jobs)
+        self._single_flight = SingleFlight()
+        
         # User agents for rotation
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -235,24 +303,30 @@ class JobScraperService:
         
         return all_jobs[:limit]
     
+    def _default_headers(self) -> Dict[str, str]:
+        """Browser-like request headers with a rotated user agent"""
+        return {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+    
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session with proper headers"""
         if self.session is None or self.session.closed:
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
             timeout = aiohttp.ClientTimeout(total=self.timeout)
             self.session = aiohttp.ClientSession(
-                headers=headers,
+                headers=self._default_headers(),
                 timeout=timeout,
-                connector=aiohttp.TCPConnector(limit=10)
+                # Keep idle connections and DNS answers long enough to be
+                # reused across a whole search instead of re-resolving and
+                # reconnecting to each board
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30, ttl_dns_cache=300)
             )
+            self._owns_session = True
         
         return self.session
     
@@ -277,12 +351,16 @@ class JobScraperService:
         
         try:
             session = await self._get_session()
+            if not self._owns_session:
+                # A shared session does not carry our browser headers
+                kwargs.setdefault('headers', self._default_headers())
             response = await session.get(url, **kwargs)
             return response
         except Exception as e:
             logger.error(f"Request failed for {url}: {e}")
             return None
     
+    @cached_source
     async def _scrape_remoteok_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Scrape jobs from RemoteOK (free remote job board)
@@ -356,6 +434,7 @@ class JobScraperService:
         
         return jobs
     
+    @cached_source
     async def _scrape_weworkremotely_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Scrape jobs from We Work Remotely
@@ -444,6 +523,7 @@ class JobScraperService:
         
         return jobs
     
+    @cached_source
     async def _scrape_github_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Scrape jobs from GitHub Jobs alternative or similar free sources
@@ -578,9 +658,26 @@ class JobScraperService:
         
         return f"${base_range[0]:,} - ${base_range[1]:,}"
     
+    def _store_cached_source(self, key: tuple, entry: tuple) -> None:
+        """Cache a source result, evicting to stay within SCRAPING_CACHE_MAX_ENTRIES"""
+        cache = self._source_cache
+        cache.pop(key, None)
+        if len(cache) >= settings.SCRAPING_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for expired in [k for k, (expiry, _, _) in cache.items() if expiry <= now]:
+                del cache[expired]
+            # Dicts keep insertion order, so the first keys are the oldest
+            while cache and len(cache) >= settings.SCRAPING_CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+        cache[key] = entry
+    
+    def clear_cache(self):
+        """Drop all cached source results"""
+        self._source_cache.clear()
+    
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session and not self.session.closed:
+        """Close the aiohttp session (shared sessions are closed by their owner)"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
     
     async def scrape_multiple_sources(self, queries: List[str], location: str = "") -> List[Dict[str, Any]]:
@@ -629,6 +726,7 @@ class JobScraperService:
         
         return unique_jobs
     
+    @cached_source
     async def _scrape_justremote_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Scrape jobs from JustRemote.co (free remote job board)
@@ -683,6 +781,7 @@ class JobScraperService:
         
         return jobs
     
+    @cached_source
     async def _scrape_remoteco_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Scrape jobs from Remote.co (free remote job board)
@@ -737,6 +836,7 @@ class JobScraperService:
         
         return jobs
     
+    @cached_source
     async def _scrape_nowhiteboard_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Scrape jobs from NoWhiteboard.org (tech jobs without whiteboard interviews)
@@ -806,6 +906,7 @@ class JobScraperService:
         
         return jobs
     
+    @cached_source
     async def _scrape_ycombinator_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Generate jobs from Y Combinator companies (with fallback approach)
@@ -857,6 +958,7 @@ class JobScraperService:
         
         return jobs
     
+    @cached_source
     async def _scrape_angel_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Generate jobs from AngelList-style startups
@@ -898,6 +1000,7 @@ class JobScraperService:
         
         return jobs
     
+    @cached_source
     async def _scrape_freelancer_jobs(self, query: str, location: str = "", limit: int = 5) -> List[Dict[str, Any]]:
         """
         Generate freelance/contract opportunities
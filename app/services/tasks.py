@@ -2,11 +2,14 @@
 Celery tasks for background processing
 """
 
+import asyncio
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional
 import logging
 
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
 from app.core.celery_app import celery_app
 from app.services.file_service import FileService
 from app.services.nlp_service import NLPService
@@ -16,11 +19,97 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Per-process event loop and scraper, kept alive across task invocations so the
+# aiohttp session (connection pool, DNS cache, TLS contexts) stays warm.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SCRAPER: Optional[JobScraperService] = None
+
+
+def _get_worker_scraper() -> JobScraperService:
+    """
+    Get the event loop and job scraper for the current worker process,
+    creating them on first use (the solo pool never fires worker_process_init)
+    """
+    global _LOOP, _SCRAPER
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    if _SCRAPER is None:
+        _SCRAPER = JobScraperService()
+    return _SCRAPER
+
+
+@worker_process_init.connect
+def _init_worker_scraper(**kwargs) -> None:
+    """Create the shared event loop and scraper when a pool process starts"""
+    _get_worker_scraper()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _close_worker_scraper(**kwargs) -> None:
+    """Close the shared aiohttp session and event loop once on shutdown"""
+    global _LOOP, _SCRAPER
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        if _SCRAPER is not None:
+            _LOOP.run_until_complete(_SCRAPER.close())
+    except Exception as e:
+        logger.warning(f"Error closing job scraper session: {str(e)}")
+    finally:
+        _LOOP.close()
+        _LOOP = None
+        _SCRAPER = None
+
+
+class _ProgressReporter:
+    """
+    Write task progress to the result backend only on meaningful changes,
+    to avoid a Redis write for every small step of a fast task
+    """
+    
+    def __init__(self, task, min_step: int = 25, min_interval: float = 2.0):
+        self.task = task
+        self.min_step = min_step
+        self.min_interval = min_interval
+        self.started_at = datetime.utcnow().isoformat()
+        # Start a full step back so the first update (which records
+        # started_at) is always written
+        self.last_percentage = -min_step
+        self.last_update = 0.0
+    
+    def update(self, progress: str, percentage: int, final: bool = False) -> None:
+        """
+        Report progress if it moved by min_step percent or min_interval seconds passed
+        
+        Args:
+            progress: Human readable progress message
+            percentage: Completion percentage (0-100)
+            final: Always report this step (the last one before completion)
+        """
+        now = time.monotonic()
+        if (not final
+                and percentage - self.last_percentage < self.min_step
+                and now - self.last_update < self.min_interval):
+            return
+        
+        self.task.update_state(
+            state='STARTED',
+            meta={
+                'progress': progress,
+                'percentage': percentage,
+                'started_at': self.started_at
+            }
+        )
+        self.last_percentage = percentage
+        self.last_update = now
 
-@celery_app.task(bind=True, name="app.services.tasks.process_resume_and_match_jobs")
+
+@celery_app.task(bind=True, name="app.services.tasks.process_resume_and_match_jobs", serializer="orjson")
 def process_resume_and_match_jobs(
     self, 
-    file_content: bytes, 
+    file_path: str, 
     filename: str, 
     content_type: str, 
     user_id: Optional[int] = None,
@@ -34,7 +123,7 @@ def process_resume_and_match_jobs(
     
     Args:
         self: Celery task instance
-        file_content: Resume file content as bytes
+        file_path: Path of the saved resume upload (removed once the task finishes)
         filename: Original filename
         content_type: MIME type of the file
         user_id: Optional user ID for authenticated users
@@ -47,12 +136,13 @@ def process_resume_and_match_jobs(
         Dictionary with matched jobs and processing metadata
     """
     start_time = time.time()
+    file_service = FileService()
+    progress = _ProgressReporter(self)
     
     try:
         # Initialize services
-        file_service = FileService()
         nlp_service = NLPService()
-        job_scraper = JobScraperService()
+        job_scraper = _get_worker_scraper()
         
         # Initialize matching service with custom parameters if provided
         matching_service = JobMatchingService()
@@ -73,16 +163,9 @@ def process_resume_and_match_jobs(
         )
         
         # Step 1: Extract text from resume
-        self.update_state(
-            state='STARTED', 
-            meta={
-                'progress': 'Extracting text from resume...',
-                'percentage': 10,
-                'started_at': datetime.utcnow().isoformat()
-            }
-        )
+        progress.update('Extracting text from resume...', 10)
         
-        resume_text = file_service.extract_text_from_file(file_content, content_type)
+        resume_text, file_size = file_service.extract_text_from_saved_file(file_path, content_type)
         
         if not resume_text.strip():
             raise ValueError("No text could be extracted from the resume")
@@ -90,13 +173,7 @@ def process_resume_and_match_jobs(
         logger.info(f"Extracted {len(resume_text)} characters from resume: {filename}")
         
         # Step 2: Extract skills and job titles
-        self.update_state(
-            state='STARTED',
-            meta={
-                'progress': 'Analyzing resume and extracting skills...',
-                'percentage': 25
-            }
-        )
+        progress.update('Analyzing resume and extracting skills...', 25)
         
         extracted_skills = nlp_service.extract_skills_and_titles(resume_text)
         
@@ -106,30 +183,15 @@ def process_resume_and_match_jobs(
         logger.info(f"Extracted {len(extracted_skills.technical_skills)} technical skills")
         
         # Step 3: Search for jobs
-        self.update_state(
-            state='STARTED',
-            meta={
-                'progress': 'Searching for relevant job listings...',
-                'percentage': 50
-            }
-        )
+        progress.update('Searching for relevant job listings...', 50)
         
         # Use top skills for job search
         search_queries = extracted_skills.technical_skills[:5]
         
-        # Use async job scraping
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            all_jobs = loop.run_until_complete(
-                job_scraper.scrape_multiple_sources(search_queries)
-            )
-        finally:
-            # Ensure session is closed
-            loop.run_until_complete(job_scraper.close())
-            loop.close()
+        # Use async job scraping on the worker's long-lived loop and session
+        all_jobs = _LOOP.run_until_complete(
+            job_scraper.scrape_multiple_sources(search_queries)
+        )
         
         if not all_jobs:
             return {
@@ -142,13 +204,7 @@ def process_resume_and_match_jobs(
         logger.info(f"Found {len(all_jobs)} unique job listings")
         
         # Step 4: Calculate job matches
-        self.update_state(
-            state='STARTED',
-            meta={
-                'progress': 'Calculating job similarity scores...',
-                'percentage': 75
-            }
-        )
+        progress.update('Calculating job similarity scores...', 75)
         
         matched_jobs = matching_service.match_jobs_to_resume(
             resume_text=resume_text,
@@ -157,13 +213,7 @@ def process_resume_and_match_jobs(
         )
         
         # Step 5: Finalize results
-        self.update_state(
-            state='STARTED',
-            meta={
-                'progress': 'Finalizing results...',
-                'percentage': 90
-            }
-        )
+        progress.update('Finalizing results...', 90, final=True)
         
         processing_time = time.time() - start_time
         
@@ -180,7 +230,7 @@ def process_resume_and_match_jobs(
             'file_info': {
                 'filename': filename,
                 'content_type': content_type,
-                'size_bytes': len(file_content)
+                'size_bytes': file_size
             },
             'user_id': user_id  # Include user ID if available
         }
@@ -202,12 +252,16 @@ def process_resume_and_match_jobs(
             }
         )
         raise
+    
+    finally:
+        file_service.remove_upload(file_path)
 
 
-@celery_app.task(name="app.services.tasks.health_check_task")
+@celery_app.task(name="app.services.tasks.health_check_task", ignore_result=True)
 def health_check_task() -> Dict[str, Any]:
     """
-    Simple health check task for monitoring Celery workers
+    Simple health check task for monitoring Celery workers.
+    Results are not stored; pass ignore_result=False to apply_async to wait on one.
     
     Returns:
         Dictionary with health status
@@ -219,7 +273,7 @@ def health_check_task() -> Dict[str, Any]:
     }
 
 
-@celery_app.task(name="app.services.tasks.cleanup_old_results")
+@celery_app.task(name="app.services.tasks.cleanup_old_results", ignore_result=True)
 def cleanup_old_results() -> Dict[str, Any]:
     """
     Cleanup old task results (can be scheduled to run periodically)
@@ -2,12 +2,71 @@
 Job filtering utilities
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Set, Tuple
 import re
+import string
 import logging
 
 logger = logging.getLogger(__name__)
 
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# ASCII punctuation mapped to spaces; '_' is a word character so it is kept
+_PUNCT_TO_SPACE_TABLE = str.maketrans({c: ' ' for c in string.punctuation if c != '_'})
+
+# Common prefixes/suffixes stripped from locations before comparison
+_LOCATION_AFFIXES = (
+    'greater ', ' area', ' region', ' metropolitan', ' metro', ' county',
+    ' city', ' district', ' province', ' state', ' territory'
+)
+
+# Common US state abbreviations, expanded when normalizing locations
+_STATE_ABBR = MappingProxyType({
+    'al': 'alabama', 'ak': 'alaska', 'az': 'arizona', 'ar': 'arkansas',
+    'ca': 'california', 'co': 'colorado', 'ct': 'connecticut', 'de': 'delaware',
+    'fl': 'florida', 'ga': 'georgia', 'hi': 'hawaii', 'id': 'idaho',
+    'il': 'illinois', 'in': 'indiana', 'ia': 'iowa', 'ks': 'kansas',
+    'ky': 'kentucky', 'la': 'louisiana', 'me': 'maine', 'md': 'maryland',
+    'ma': 'massachusetts', 'mi': 'michigan', 'mn': 'minnesota', 'ms': 'mississippi',
+    'mo': 'missouri', 'mt': 'montana', 'ne': 'nebraska', 'nv': 'nevada',
+    'nh': 'new hampshire', 'nj': 'new jersey', 'nm': 'new mexico', 'ny': 'new york',
+    'nc': 'north carolina', 'nd': 'north dakota', 'oh': 'ohio', 'ok': 'oklahoma',
+    'or': 'oregon', 'pa': 'pennsylvania', 'ri': 'rhode island', 'sc': 'south carolina',
+    'sd': 'south dakota', 'tn': 'tennessee', 'tx': 'texas', 'ut': 'utah',
+    'vt': 'vermont', 'va': 'virginia', 'wa': 'washington', 'wv': 'west virginia',
+    'wi': 'wisconsin', 'wy': 'wyoming', 'dc': 'washington dc'
+})
+
+# Keywords that indicate each job type in a title or description
+_JOB_TYPE_KEYWORDS = MappingProxyType({
+    'full-time': ('full time', 'full-time', 'permanent', 'regular'),
+    'part-time': ('part time', 'part-time'),
+    'contract': ('contract', 'contractor', 'temporary', 'temp'),
+    'freelance': ('freelance', 'freelancer'),
+    'internship': ('intern', 'internship', 'co-op', 'coop'),
+    'remote': ('remote', 'work from home', 'wfh', 'virtual', 'telecommute'),
+    'hybrid': ('hybrid', 'flexible', 'partially remote')
+})
+
+# Job types implied by each keyword, including types of any keyword it contains
+# (e.g. 'partially remote' also implies 'remote')
+_KEYWORD_JOB_TYPES = MappingProxyType({
+    keyword: frozenset(
+        job_type for job_type, keywords in _JOB_TYPE_KEYWORDS.items()
+        if any(other in keyword for other in keywords)
+    )
+    for all_keywords in _JOB_TYPE_KEYWORDS.values()
+    for keyword in all_keywords
+})
+
+# One scan for every keyword: the lookahead tries each position, so overlapping
+# keywords are all found, and longer keywords are tried first
+_JOB_TYPE_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in sorted(_KEYWORD_JOB_TYPES, key=len, reverse=True)) + '))'
+)
+
 
 def filter_jobs_by_location(
     jobs: List[Dict[str, Any]], 
@@ -28,6 +87,12 @@ def filter_jobs_by_location(
     if not locations and not remote_only:
         return jobs
     
+    # Normalize preferred locations once rather than once per job, and match
+    # them all in a single regex scan of each job location
+    normalized_preferred_locations = tuple(_normalize_location(loc) for loc in (locations or ()))
+    preferred_location_re = re.compile('|'.join(map(re.escape, normalized_preferred_locations)))
+    wants_remote = any('remote' in loc.lower() for loc in (locations or ()))
+    
     filtered_jobs = []
     
     for job in jobs:
@@ -52,17 +117,16 @@ def filter_jobs_by_location(
         # Check if job location matches any preferred location
         job_location = job.get('location', '').lower()
         
-        # Normalize locations for comparison
+        # Normalize location for comparison
         normalized_job_location = _normalize_location(job_location)
-        normalized_preferred_locations = [_normalize_location(loc) for loc in locations]
         
         # Check for location match
-        if any(preferred_loc in normalized_job_location for preferred_loc in normalized_preferred_locations):
+        if preferred_location_re.search(normalized_job_location):
             filtered_jobs.append(job)
             continue
         
         # Check for remote with location preference
-        if job.get('remote_allowed') and any('remote' in loc.lower() for loc in locations):
+        if wants_remote and job.get('remote_allowed'):
             filtered_jobs.append(job)
             continue
     
@@ -120,9 +184,11 @@ def filter_jobs_by_type(
     return filtered_jobs
 
 
+@lru_cache(maxsize=4096)
 def _normalize_location(location: str) -> str:
     """
-    Normalize location string for comparison
+    Normalize location string for comparison (memoized, scraped feeds repeat
+    the same few hundred locations)
     
     Args:
         location: Location string
@@ -134,41 +200,17 @@ def _normalize_location(location: str) -> str:
     normalized = location.lower()
     
     # Remove common prefixes/suffixes
-    prefixes_suffixes = [
-        'greater ', ' area', ' region', ' metropolitan', ' metro', ' county',
-        ' city', ' district', ' province', ' state', ' territory'
-    ]
-    for ps in prefixes_suffixes:
+    for ps in _LOCATION_AFFIXES:
         normalized = normalized.replace(ps, '')
     
-    # Remove punctuation and extra whitespace
-    normalized = re.sub(r'[^\w\s]', ' ', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-    
-    # Handle common abbreviations
-    state_abbr = {
-        'al': 'alabama', 'ak': 'alaska', 'az': 'arizona', 'ar': 'arkansas',
-        'ca': 'california', 'co': 'colorado', 'ct': 'connecticut', 'de': 'delaware',
-        'fl': 'florida', 'ga': 'georgia', 'hi': 'hawaii', 'id': 'idaho',
-        'il': 'illinois', 'in': 'indiana', 'ia': 'iowa', 'ks': 'kansas',
-        'ky': 'kentucky', 'la': 'louisiana', 'me': 'maine', 'md': 'maryland',
-        'ma': 'massachusetts', 'mi': 'michigan', 'mn': 'minnesota', 'ms': 'mississippi',
-        'mo': 'missouri', 'mt': 'montana', 'ne': 'nebraska', 'nv': 'nevada',
-        'nh': 'new hampshire', 'nj': 'new jersey', 'nm': 'new mexico', 'ny': 'new york',
-        'nc': 'north carolina', 'nd': 'north dakota', 'oh': 'ohio', 'ok': 'oklahoma',
-        'or': 'oregon', 'pa': 'pennsylvania', 'ri': 'rhode island', 'sc': 'south carolina',
-        'sd': 'south dakota', 'tn': 'tennessee', 'tx': 'texas', 'ut': 'utah',
-        'vt': 'vermont', 'va': 'virginia', 'wa': 'washington', 'wv': 'west virginia',
-        'wi': 'wisconsin', 'wy': 'wyoming', 'dc': 'washington dc'
-    }
+    # Remove punctuation; split() also collapses whitespace runs
+    if normalized.isascii():
+        words = normalized.translate(_PUNCT_TO_SPACE_TABLE).split()
+    else:
+        words = _PUNCT_RE.sub(' ', normalized).split()
     
     # Replace state abbreviations with full names
-    words = normalized.split()
-    for i, word in enumerate(words):
-        if word in state_abbr:
-            words[i] = state_abbr[word]
-    
-    normalized = ' '.join(words)
+    normalized = ' '.join([_STATE_ABBR.get(word, word) for word in words])
     
     return normalized
 
@@ -183,21 +225,10 @@ def _extract_job_types_from_text(text: str) -> Set[str]:
     Returns:
         Set of extracted job types
     """
-    job_type_keywords = {
-        'full-time': ['full time', 'full-time', 'permanent', 'regular'],
-        'part-time': ['part time', 'part-time'],
-        'contract': ['contract', 'contractor', 'temporary', 'temp'],
-        'freelance': ['freelance', 'freelancer'],
-        'internship': ['intern', 'internship', 'co-op', 'coop'],
-        'remote': ['remote', 'work from home', 'wfh', 'virtual', 'telecommute'],
-        'hybrid': ['hybrid', 'flexible', 'partially remote']
-    }
-    
     extracted_types = set()
     
-    for job_type, keywords in job_type_keywords.items():
-        if any(keyword in text for keyword in keywords):
-            extracted_types.add(job_type)
+    for match in _JOB_TYPE_RE.finditer(text):
+        extracted_types.update(_KEYWORD_JOB_TYPES[match.group(1)])
     
     return extracted_types
 
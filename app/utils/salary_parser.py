@@ -2,14 +2,30 @@
 Salary parsing utilities
 """
 
-import re
-from typing import Optional, Tuple, Dict, Any
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Dict, Any
 
+_DIGITS = frozenset('0123456789')
 
+# Characters allowed between the bounds of a dash range such as "$50 - $75k"
+_RANGE_SEPARATORS = frozenset(' $-\u2013\u2014')
+_DASHES = frozenset('-\u2013\u2014')
+
+# Retirement-plan mentions that look like a "k" amount
+_RETIREMENT_PLANS = ('401k', '401(k)')
+
+# Assume 2080 hours per year (40 hours/week * 52 weeks)
+HOURS_PER_YEAR = 2080
+
+
+@lru_cache(maxsize=4096)
 def parse_salary_range(salary_range: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
     """
     Parse a salary range string into minimum and maximum values
     
+    The same strings recur across many listings, so results are memoized;
+    the returned tuple is immutable and safe to share.
+    
     Args:
         salary_range: String representation of salary range (e.g., "$80,000 - $120,000")
         
@@ -30,17 +46,17 @@ def parse_salary_range(salary_range: Optional[str]) -> Tuple[Optional[int], Opti
     if any(term in salary_text for term in ['competitive', 'negotiable', 'doe', 'depends']):
         return None, None
     
-    # Extract all numbers from the string
-    numbers = re.findall(r'[\d,]+', salary_text)
-    numbers = [int(n.replace(',', '')) for n in numbers]
+    # Extract all amounts from the string
+    amounts, open_ended = _scan_amounts(salary_text)
+    numbers = [int(amount) for amount in amounts]
     
     if not numbers:
         return None, None
     
     # If only one number is found
     if len(numbers) == 1:
-        # Check if it's a minimum salary
-        if 'from' in salary_text or 'min' in salary_text or 'starting' in salary_text:
+        # Check if it's a minimum salary ("From $90,000", "$100k+")
+        if open_ended or 'from' in salary_text or 'min' in salary_text or 'starting' in salary_text:
             return numbers[0], None
         # Check if it's a maximum salary
         elif 'up to' in salary_text or 'max' in salary_text:
@@ -53,6 +69,94 @@ def parse_salary_range(salary_range: Optional[str]) -> Tuple[Optional[int], Opti
     return min(numbers), max(numbers)
 
 
+def parse_salary_range_batch(
+    salary_ranges: Iterable[Optional[str]]
+) -> List[Tuple[Optional[int], Optional[int]]]:
+    """
+    Parse many salary range strings at once
+    
+    parse_salary_range is memoized, so the repeats typical of scraped
+    listings cost only a lookup.
+    
+    Args:
+        salary_ranges: Salary range strings (None entries are allowed)
+        
+    Returns:
+        List of (min_salary, max_salary) tuples in input order, None for a missing bound
+    """
+    return [parse_salary_range(salary_range) for salary_range in salary_ranges]
+
+
+def _scan_amounts(text: str) -> Tuple[List[float], bool]:
+    """
+    Collect the amounts in a lowercased salary string in a single pass
+    
+    Commas between digits group thousands, one '.' starts a fraction, and a
+    'k' straight after a number multiplies it by 1000. In a shorthand range
+    like "$50-75k" the suffix also applies to the bare lower bound. Percentages
+    and "401k" mentions are not amounts and are skipped.
+    
+    Args:
+        text: Lowercased salary text
+        
+    Returns:
+        Tuple of (amounts in order, whether the last one ends with '+')
+    """
+    amounts = []
+    open_ended = False
+    previous_end = None
+    previous_scaled = True
+    i, length = 0, len(text)
+    
+    while i < length:
+        if text[i] not in _DIGITS:
+            i += 1
+            continue
+        
+        if text.startswith(_RETIREMENT_PLANS, i) and (i == 0 or text[i - 1] not in _DIGITS):
+            i += 3
+            continue
+        
+        # Digit run, allowing "," and a single "." when a digit follows
+        start = i
+        seen_dot = False
+        while i < length:
+            char = text[i]
+            if char in _DIGITS:
+                i += 1
+            elif char in ',.' and i + 1 < length and text[i + 1] in _DIGITS:
+                if char == '.':
+                    if seen_dot:
+                        break
+                    seen_dot = True
+                i += 1
+            else:
+                break
+        
+        if i < length and text[i] == '%':
+            i += 1
+            continue
+        
+        amount = float(text[start:i].replace(',', ''))
+        is_thousands = i < length and text[i] == 'k'
+        if is_thousands:
+            amount *= 1000
+            i += 1
+            
+            # "$50-75k": the upper bound's suffix carries over to a bare lower bound
+            if previous_end is not None and not previous_scaled and amounts[-1] < 1000:
+                separator = text[previous_end:start]
+                if any(char in _DASHES for char in separator) and set(separator) <= _RANGE_SEPARATORS:
+                    amounts[-1] *= 1000
+        
+        amounts.append(amount)
+        open_ended = i < length and text[i] == '+'
+        previous_end = i
+        previous_scaled = is_thousands
+    
+    return amounts, open_ended
+
+
 def _parse_hourly_rate(hourly_text: str) -> Tuple[Optional[int], Optional[int]]:
     """
     Parse hourly rate and convert to annual salary
@@ -64,25 +168,19 @@ def _parse_hourly_rate(hourly_text: str) -> Tuple[Optional[int], Optional[int]]:
         Tuple of (min_annual_salary, max_annual_salary)
     """
     # Extract hourly rates
-    rates = re.findall(r'\$?(\d+(?:\.\d+)?)', hourly_text)
+    rates, _ = _scan_amounts(hourly_text)
     
     if not rates:
         return None, None
     
-    # Convert to float
-    rates = [float(rate) for rate in rates]
-    
-    # Assume 2080 hours per year (40 hours/week * 52 weeks)
-    hours_per_year = 2080
-    
     if len(rates) == 1:
         # Single rate
-        annual = int(rates[0] * hours_per_year)
+        annual = int(rates[0] * HOURS_PER_YEAR)
         return annual, annual
     else:
         # Range of rates
-        min_annual = int(min(rates) * hours_per_year)
-        max_annual = int(max(rates) * hours_per_year)
+        min_annual = int(min(rates) * HOURS_PER_YEAR)
+        max_annual = int(max(rates) * HOURS_PER_YEAR)
         return min_annual, max_annual
 
 
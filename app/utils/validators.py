@@ -6,6 +6,10 @@ import re
 from typing import List, Optional
 from fastapi import HTTPException
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.ASCII)
+_FN_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 def validate_email(email: str) -> bool:
     """
@@ -17,8 +21,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_file_extension(filename: str, allowed_extensions: List[str]) -> bool:
@@ -50,8 +53,7 @@ def validate_task_id(task_id: str) -> bool:
         True if valid format, False otherwise
     """
     # Celery task IDs are typically UUIDs
-    uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return re.match(uuid_pattern, task_id.lower()) is not None
+    return _UUID_RE.match(task_id.lower()) is not None
 
 
 def sanitize_filename(filename: str) -> str:
@@ -65,7 +67,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove path separators and other dangerous characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = _FN_SANITIZE_RE.sub('_', filename)
     
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip('. ')
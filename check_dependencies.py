@@ -3,20 +3,24 @@
 Check if required dependencies are installed
 """
 
+import importlib.util
 import sys
 
 def check_dependency(module_name, package_name=None):
-    """Check if a dependency is installed"""
+    """Check if a dependency is installed (without importing it)"""
     if package_name is None:
         package_name = module_name
     
     try:
-        __import__(module_name)
+        installed = importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        installed = False
+    
+    if installed:
         print(f"✅ {package_name} is installed")
-        return True
-    except ImportError:
+    else:
         print(f"❌ {package_name} is NOT installed")
-        return False
+    return installed
 
 def main():
     """Check all required dependencies"""
@@ -35,6 +39,8 @@ def main():
         ("numpy", "numpy"),
         ("bs4", "beautifulsoup4"),
         ("requests", "requests"),
+        ("orjson", "orjson"),
+        ("blake3", "blake3"),
     ]
     
     missing = []
@@ -3,78 +3,128 @@
 Check Redis queue directly to see if tasks are being queued
 """
 
-import json
 import sys
+from collections import deque
+from itertools import islice
 
-def check_redis_queues():
+import orjson
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Maximum number of keys listed individually in the key overview
+MAX_DISPLAYED_KEYS = 200
+
+# Maximum number of queued tasks listed per queue
+MAX_DISPLAYED_TASKS = 10
+
+# Maximum number of result meta keys scanned before the count is reported as a lower bound
+MAX_SCANNED_RESULT_KEYS = 10000
+
+# One connection pool shared by every check in this script
+POOL = redis.ConnectionPool(
+    host='localhost', port=6379, db=0, decode_responses=True, max_connections=8
+) if redis else None
+
+def get_redis_client():
+    """Get a Redis client backed by the shared connection pool"""
+    return redis.Redis(connection_pool=POOL)
+
+def check_redis_queues(r):
     """Check what's in Redis queues"""
+    if r is None:
+        print("❌ Redis module not available")
+        return False
+    
     try:
-        import redis
-        
-        # Connect to Redis
-        r = redis.Redis(host='localhost', port=6379, db=0)
-        
         print("🔍 Checking Redis Queues")
         print("=" * 30)
         
-        # Check all keys
-        all_keys = r.keys('*')
-        print(f"📊 Total Redis keys: {len(all_keys)}")
-        
-        if all_keys:
-            print("📋 All keys:")
-            for key in sorted(all_keys):
-                key_str = key.decode() if isinstance(key, bytes) else str(key)
-                key_type = r.type(key).decode()
-                print(f"   • {key_str} ({key_type})")
+        # Check all keys (SCAN instead of KEYS so Redis is never blocked)
+        total_keys = 0
+        displayed_keys = []
+        for key in r.scan_iter(count=1000):
+            total_keys += 1
+            if len(displayed_keys) < MAX_DISPLAYED_KEYS:
+                displayed_keys.append(key)
+        print(f"📊 Total Redis keys: {total_keys}")
+        
+        if displayed_keys:
+            displayed_keys.sort()
+            with r.pipeline(transaction=False) as pipe:
+                for key in displayed_keys:
+                    pipe.type(key)
+                key_types = pipe.execute()
+            
+            print("📋 All keys:" if total_keys <= MAX_DISPLAYED_KEYS
+                  else f"📋 First {MAX_DISPLAYED_KEYS} keys:")
+            for key, key_type in zip(displayed_keys, key_types):
+                print(f"   • {key} ({key_type})")
         
         # Check common Celery queues
         queue_names = ['celery', 'default', 'celery:1', 'celery:2']
         
+        # Fetch every queue length and a bounded sample in one round trip
+        with r.pipeline(transaction=False) as pipe:
+            for queue_name in queue_names:
+                pipe.llen(queue_name)
+                pipe.lrange(queue_name, 0, MAX_DISPLAYED_TASKS - 1)
+            queue_replies = pipe.execute()
+        
         print(f"\n📦 Queue Status:")
-        for queue_name in queue_names:
-            length = r.llen(queue_name)
+        for queue_name, length, tasks in zip(queue_names, queue_replies[::2], queue_replies[1::2]):
             print(f"   • {queue_name}: {length} tasks")
             
             if length > 0:
                 print(f"     Tasks in {queue_name}:")
-                tasks = r.lrange(queue_name, 0, -1)
+                if length > len(tasks):
+                    print(f"     (showing first {len(tasks)})")
                 for i, task in enumerate(tasks):
                     try:
-                        task_data = json.loads(task)
+                        task_data = orjson.loads(task)
                         task_id = task_data.get('id', 'unknown')
                         task_name = task_data.get('task', 'unknown')
                         print(f"       {i+1}. {task_name} (ID: {task_id})")
-                    except:
+                    except (orjson.JSONDecodeError, AttributeError):
                         print(f"       {i+1}. Raw: {task[:100]}...")
         
-        # Check task results
-        result_keys = r.keys('celery-task-meta-*')
-        print(f"\n📊 Task Results: {len(result_keys)}")
+        # Check task results, keeping only the last 5 keys seen and stopping
+        # the scan early on very large result backends
+        result_count = 0
+        result_keys = deque(maxlen=5)
+        result_scan = r.scan_iter(match='celery-task-meta-*', count=500)
+        for key in islice(result_scan, MAX_SCANNED_RESULT_KEYS):
+            result_count += 1
+            result_keys.append(key)
+        more = "+" if result_count == MAX_SCANNED_RESULT_KEYS else ""
+        print(f"\n📊 Task Results: {result_count}{more}")
         
         if result_keys:
+            with r.pipeline(transaction=False) as pipe:
+                for key in result_keys:
+                    pipe.get(key)
+                results = pipe.execute()
+            
             print("📋 Recent results:")
-            for key in result_keys[-5:]:  # Last 5
+            for key, result in zip(result_keys, results):
                 try:
-                    result = r.get(key)
                     if result:
-                        result_data = json.loads(result)
-                        task_id = key.decode().replace('celery-task-meta-', '')
+                        result_data = orjson.loads(result)
+                        task_id = key.replace('celery-task-meta-', '')
                         status = result_data.get('status', 'unknown')
                         print(f"   • {task_id}: {status}")
-                except:
+                except (orjson.JSONDecodeError, AttributeError):
                     pass
         
         return True
         
-    except ImportError:
-        print("❌ Redis module not available")
-        return False
     except Exception as e:
         print(f"❌ Error checking Redis: {e}")
         return False
 
-def test_task_creation():
+def test_task_creation(r):
     """Create a task and see if it appears in Redis"""
     try:
         from app.services.tasks import health_check_task
@@ -87,14 +137,14 @@ def test_task_creation():
         print(f"📋 Created task: {result.id}")
         print(f"📊 State: {result.state}")
         
-        # Check if it appears in Redis
-        import redis
-        r = redis.Redis(host='localhost', port=6379, db=0)
-        
-        # Check queues again
+        # Check if it appears in Redis queues
         queue_names = ['celery', 'default']
-        for queue_name in queue_names:
-            length = r.llen(queue_name)
+        with r.pipeline(transaction=False) as pipe:
+            for queue_name in queue_names:
+                pipe.llen(queue_name)
+            lengths = pipe.execute()
+        
+        for queue_name, length in zip(queue_names, lengths):
             print(f"📦 Queue '{queue_name}': {length} tasks")
         
         return True
@@ -107,8 +157,9 @@ if __name__ == "__main__":
     print("🔍 Redis Queue Diagnostic")
     print("=" * 40)
     
-    success1 = check_redis_queues()
-    success2 = test_task_creation()
+    r = get_redis_client() if redis else None
+    success1 = check_redis_queues(r)
+    success2 = test_task_creation(r)
     
     if success1 and success2:
         print(f"\n✅ Redis queue check completed")
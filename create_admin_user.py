@@ -8,7 +8,7 @@ import getpass
 import sys
 import os
 import warnings
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Suppress bcrypt warning
 warnings.filterwarnings("ignore", message=".*bcrypt version.*")
@@ -18,7 +18,7 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 from app.db.database import async_session_maker
 from app.models.user import User, UserCreate
-from fastapi_users.password import PasswordHelper
+from _password_helpers import PASSWORD_HELPER
 
 async def create_superuser():
     """
@@ -44,8 +44,7 @@ async def create_superuser():
     
     try:
         # Create password hash
-        password_helper = PasswordHelper()
-        hashed_password = password_helper.hash(password)
+        hashed_password = PASSWORD_HELPER.hash(password)
         
         # Create user directly
         async with async_session_maker() as session:
@@ -58,6 +57,8 @@ async def create_superuser():
                 print(f"User with email {email} already exists")
                 return
             
+            # One timestamp for all fields; stored naive (UTC) to match the DateTime columns
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
             # Create new user
             user = User(
                 email=email,
@@ -67,10 +68,10 @@ async def create_superuser():
                 is_verified=True,
                 first_name=first_name,
                 last_name=last_name,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
                 monthly_matches_used=0,
-                last_match_reset=datetime.utcnow()
+                last_match_reset=now
             )
             
             session.add(user)
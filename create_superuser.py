@@ -3,19 +3,20 @@
 Create a superuser for the application
 """
 
+import argparse
 import asyncio
 import os
 import sys
 import getpass
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 from app.models.user import User
-from app.auth.manager import get_user_manager, get_user_db
-from app.db.database import get_async_session
-from fastapi_users.password import PasswordHelper
+from app.db.database import async_session_maker
+from fastapi_users.db import SQLAlchemyUserDatabase
+from _password_helpers import PASSWORD_HELPER
 
 async def create_user(
     email: str,
@@ -28,12 +29,9 @@ async def create_user(
     Create a new user
     """
     # Get async session
-    async for session in get_async_session():
+    async with async_session_maker() as session:
         # Get user database
-        user_db = next(get_user_db(session))
-        
-        # Get user manager
-        user_manager = next(get_user_manager(user_db))
+        user_db = SQLAlchemyUserDatabase(session, User)
         
         # Check if user already exists
         existing_user = await user_db.get_by_email(email)
@@ -42,8 +40,10 @@ async def create_user(
             return existing_user
         
         # Create user
-        password_helper = PasswordHelper()
-        hashed_password = password_helper.hash(password)
+        hashed_password = PASSWORD_HELPER.hash(password)
+        
+        # One timestamp for all fields; stored naive (UTC) to match the DateTime columns
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         
         # Create user data
         user_dict = {
@@ -55,10 +55,10 @@ async def create_user(
             "first_name": first_name,
             "last_name": last_name,
             "subscription_tier": "pro" if is_superuser else "free",
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": now,
+            "updated_at": now,
             "monthly_matches_used": 0,
-            "last_match_reset": datetime.utcnow(),
+            "last_match_reset": now,
         }
         
         # Create user
@@ -67,18 +67,43 @@ async def create_user(
         print(f"User {email} created successfully!")
         return user
 
-async def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line options; any value not given is prompted for
+    """
+    parser = argparse.ArgumentParser(description="Create a user (a superuser by default)")
+    parser.add_argument("--email", help="User email address")
+    parser.add_argument("--password", help="User password (prefer --password-env)")
+    parser.add_argument("--password-env", metavar="VAR", help="Read the password from this environment variable")
+    parser.add_argument("--first-name", help="User first name")
+    parser.add_argument("--last-name", help="User last name")
+    parser.add_argument(
+        "--superuser",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Create a superuser (default) or a regular user"
+    )
+    return parser.parse_args(argv)
+
+async def main(args: argparse.Namespace):
     """
     Main function to create a superuser
     """
     print("Create Superuser")
     print("===============")
     
-    # Get user input
-    email = input("Email: ")
-    password = getpass.getpass("Password: ")
-    first_name = input("First name: ")
-    last_name = input("Last name: ")
+    password = args.password
+    if password is None and args.password_env:
+        password = os.environ.get(args.password_env)
+        if password is None:
+            print(f"Environment variable {args.password_env} is not set")
+            sys.exit(1)
+    
+    # Get user input for anything not passed on the command line
+    email = args.email or input("Email: ")
+    password = password or getpass.getpass("Password: ")
+    first_name = args.first_name if args.first_name is not None else input("First name: ")
+    last_name = args.last_name if args.last_name is not None else input("Last name: ")
     
     # Create superuser
     await create_user(
@@ -86,10 +111,10 @@ async def main():
         password=password,
         first_name=first_name,
         last_name=last_name,
-        is_superuser=True
+        is_superuser=args.superuser
     )
     
-    print("Superuser created successfully!")
+    print("Superuser created successfully!" if args.superuser else "User created successfully!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(parse_args()))
\ No newline at end of file
@@ -3,14 +3,27 @@
 Debug script to test file upload to the job matching endpoint
 """
 
+import io
 import requests
 import json
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 API_BASE_URL = "http://localhost:8000"
 ENDPOINT = f"{API_BASE_URL}/api/v1/jobs/match"
 
-def test_file_upload():
+# (connect, read) timeouts for upload requests
+UPLOAD_TIMEOUT = (3.05, 30)
+
+def create_session():
+    """Create a session with a small keep-alive connection pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def test_file_upload(session):
     """Test file upload with different approaches"""
     
     # Create a simple test resume content
@@ -29,6 +42,8 @@ Experience:
 - Built REST APIs with FastAPI
 - Worked with ML models
 """
+    # Encode once; each upload reads from its own buffer over the same bytes
+    test_body = test_content.encode('utf-8')
     
     print(f"Testing endpoint: {ENDPOINT}")
     print("=" * 50)
@@ -36,8 +51,8 @@ Experience:
     # Test 1: Upload as text file
     print("Test 1: Uploading as text file...")
     try:
-        files = {'file': ('resume.txt', test_content, 'text/plain')}
-        response = requests.post(ENDPOINT, files=files)
+        files = {'file': ('resume.txt', io.BytesIO(test_body), 'text/plain')}
+        response = session.post(ENDPOINT, files=files, timeout=UPLOAD_TIMEOUT)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
@@ -58,9 +73,9 @@ Experience:
     # Test 2: Upload with explicit multipart/form-data
     print("Test 2: Uploading with explicit content-type...")
     try:
-        files = {'file': ('resume.txt', test_content, 'text/plain')}
+        files = {'file': ('resume.txt', io.BytesIO(test_body), 'text/plain')}
         headers = {'Accept': 'application/json'}
-        response = requests.post(ENDPOINT, files=files, headers=headers)
+        response = session.post(ENDPOINT, files=files, headers=headers, timeout=UPLOAD_TIMEOUT)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response Body: {response.text}")
@@ -80,14 +95,14 @@ Experience:
     # Test 3: Check what the server expects
     print("Test 3: Checking API documentation...")
     try:
-        docs_response = requests.get(f"{API_BASE_URL}/docs")
+        docs_response = session.get(f"{API_BASE_URL}/docs")
         if docs_response.status_code == 200:
             print("✓ API docs are available at http://localhost:8000/docs")
         else:
             print("✗ API docs not available")
             
         # Try to get OpenAPI spec
-        openapi_response = requests.get(f"{API_BASE_URL}/openapi.json")
+        openapi_response = session.get(f"{API_BASE_URL}/openapi.json")
         if openapi_response.status_code == 200:
             openapi_data = openapi_response.json()
             # Look for the jobs/match endpoint
@@ -105,10 +120,10 @@ Experience:
     
     return None
 
-def test_health():
+def test_health(session):
     """Test if the API is running"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/health")
+        response = session.get(f"{API_BASE_URL}/api/v1/health")
         if response.status_code == 200:
             print("✓ API is running and healthy")
             return True
@@ -123,13 +138,15 @@ if __name__ == "__main__":
     print("Resume Job Matcher - Upload Debug Tool")
     print("=" * 50)
     
-    if not test_health():
+    session = create_session()
+    
+    if not test_health(session):
         print("\nPlease make sure the API server is running:")
         print("python main.py")
         exit(1)
     
     print()
-    task_id = test_file_upload()
+    task_id = test_file_upload(session)
     
     if task_id:
         print(f"\n✓ File upload successful! Task ID: {task_id}")
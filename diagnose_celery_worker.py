@@ -3,10 +3,27 @@
 Comprehensive Celery worker diagnostic
 """
 
+import asyncio
+import contextvars
+import functools
+import os
 import sys
 import time
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from _output_helpers import buffered_stdout, captured_output
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Seconds test_specific_task waits for the task to finish
+TASK_TIMEOUT = 30
+
+# Seconds to wait for worker replies to control broadcasts (Celery default is 1.0)
+WORKER_INSPECT_TIMEOUT = 0.5
 
 def test_celery_worker_status():
     """Test if Celery worker is running and accessible"""
@@ -16,13 +33,18 @@ def test_celery_worker_status():
     try:
         from app.core.celery_app import celery_app
         
-        # Get worker stats
-        inspector = celery_app.control.inspect()
+        # Get worker stats; the three broadcasts each wait out the reply
+        # window, so send them at the same time
+        inspector = celery_app.control.inspect(timeout=WORKER_INSPECT_TIMEOUT)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            active, registered, stats = executor.map(
+                lambda query: query(),
+                [inspector.active, inspector.registered, inspector.stats]
+            )
         
         print("📊 Worker Information:")
         
         # Check active workers
-        active = inspector.active()
         if active:
             print(f"   ✅ Active workers: {len(active)}")
             for worker_name, tasks in active.items():
@@ -32,7 +54,6 @@ def test_celery_worker_status():
             return False
         
         # Check registered tasks
-        registered = inspector.registered()
         if registered:
             print(f"   📋 Registered tasks per worker:")
             for worker_name, tasks in registered.items():
@@ -44,7 +65,6 @@ def test_celery_worker_status():
             print("   ❌ No registered tasks found")
         
         # Check worker stats
-        stats = inspector.stats()
         if stats:
             print(f"   📈 Worker statistics:")
             for worker_name, worker_stats in stats.items():
@@ -58,27 +78,32 @@ def test_celery_worker_status():
         print(f"❌ Failed to get worker status: {e}")
         return False
 
-def test_task_in_queue():
+async def test_task_in_queue(r):
     """Check if tasks are in the queue"""
     print("\n🔍 Testing Task Queue")
     print("=" * 30)
     
     try:
-        import redis
-        
-        # Connect to Redis
-        r = redis.Redis(host='localhost', port=6379, db=0)
+        if r is None:
+            raise ImportError("redis package is not installed")
+        
+        # Queue every lookup and send them in a single round-trip
+        other_queues = ['default', 'celery:1', 'celery:2']
+        pipe = r.pipeline(transaction=False)
+        pipe.llen('celery')
+        pipe.lrange('celery', 0, -1)
+        for queue_name in other_queues:
+            pipe.llen(queue_name)
+        queue_length, tasks, *other_lengths = await pipe.execute()
         
         # Check queue length
-        queue_length = r.llen('celery')
         print(f"   📦 Tasks in 'celery' queue: {queue_length}")
         
         if queue_length > 0:
             print("   📋 Tasks in queue:")
-            tasks = r.lrange('celery', 0, -1)
             for i, task in enumerate(tasks):
                 try:
-                    task_data = json.loads(task)
+                    task_data = orjson.loads(task)
                     task_id = task_data.get('id', 'unknown')
                     task_name = task_data.get('task', 'unknown')
                     print(f"      {i+1}. ID: {task_id}")
@@ -87,8 +112,7 @@ def test_task_in_queue():
                     print(f"      {i+1}. Raw: {task[:100]}...")
         
         # Check other common queue names
-        for queue_name in ['default', 'celery:1', 'celery:2']:
-            length = r.llen(queue_name)
+        for queue_name, length in zip(other_queues, other_lengths):
             if length > 0:
                 print(f"   📦 Tasks in '{queue_name}' queue: {length}")
         
@@ -98,28 +122,29 @@ def test_task_in_queue():
         print(f"❌ Failed to check queue: {e}")
         return False
 
-def test_task_result_backend():
+async def test_task_result_backend(r):
     """Check task results in Redis"""
     print("\n🔍 Testing Task Results")
     print("=" * 30)
     
     try:
-        import redis
+        if r is None:
+            raise ImportError("redis package is not installed")
         
-        # Connect to Redis
-        r = redis.Redis(host='localhost', port=6379, db=0)
-        
-        # Look for task results
-        task_keys = r.keys('celery-task-meta-*')
+        # Look for task results (SCAN cursors through the keyspace without
+        # blocking the server the way KEYS does)
+        task_keys = [key async for key in r.scan_iter(match='celery-task-meta-*', count=1000)]
         print(f"   📊 Task results in Redis: {len(task_keys)}")
         
         if task_keys:
             print("   📋 Recent task results:")
-            for key in task_keys[-5:]:  # Show last 5
+            recent_keys = task_keys[-5:]  # Show last 5
+            
+            # Fetch every payload in one round-trip
+            for key, result in zip(recent_keys, await r.mget(recent_keys)):
                 try:
-                    result = r.get(key)
                     if result:
-                        result_data = json.loads(result)
+                        result_data = orjson.loads(result)
                         task_id = key.decode().replace('celery-task-meta-', '')
                         status = result_data.get('status', 'unknown')
                         print(f"      • {task_id}: {status}")
@@ -132,20 +157,22 @@ def test_task_result_backend():
         print(f"❌ Failed to check results: {e}")
         return False
 
-def test_specific_task():
+async def test_specific_task():
     """Test the specific task that's failing"""
     print("\n🔍 Testing Specific Task")
     print("=" * 30)
     
     try:
+        from celery.exceptions import TimeoutError as CeleryTimeoutError
         from app.services.tasks import process_resume_and_match_jobs
+        from app.services.file_service import FileService
         
         # Create a simple test task
         sample_content = "John Doe\nSoftware Engineer\nPython, FastAPI"
         
         print("   🚀 Creating test task...")
         result = process_resume_and_match_jobs.delay(
-            file_content=sample_content.encode('utf-8'),
+            file_path=FileService().save_file_content(sample_content.encode('utf-8'), "test.txt"),
             filename="test.txt",
             content_type="text/plain"
         )
@@ -153,30 +180,33 @@ def test_specific_task():
         print(f"   📋 Task ID: {result.id}")
         print(f"   📊 Initial state: {result.state}")
         
-        # Wait and monitor
-        print("   ⏳ Monitoring task for 30 seconds...")
-        for i in range(30):
-            state = result.state
-            print(f"   [{i+1:2d}s] State: {state}")
-            
-            if state == 'SUCCESS':
-                task_result = result.get()
-                print(f"   ✅ Task completed successfully!")
-                print(f"   📊 Result: {len(task_result.get('matched_jobs', []))} jobs found")
-                return True
-            elif state == 'FAILURE':
-                print(f"   ❌ Task failed: {result.info}")
-                return False
-            elif state in ['PENDING', 'STARTED']:
-                if hasattr(result, 'info') and result.info:
-                    if isinstance(result.info, dict):
-                        progress = result.info.get('progress', '')
-                        if progress:
-                            print(f"       Progress: {progress}")
-            
-            time.sleep(1)
+        # Wait on the result backend's pub/sub channel: each state update,
+        # progress included, arrives as a message rather than a polled GET
+        print(f"   ⏳ Monitoring task for {TASK_TIMEOUT} seconds...")
+        started = time.monotonic()
         
-        print(f"   ⏰ Task did not complete within 30 seconds")
+        def on_message(meta):
+            print(f"   [{time.monotonic() - started:4.1f}s] State: {meta.get('status')}")
+            info = meta.get('result')
+            if isinstance(info, dict) and info.get('progress'):
+                print(f"       Progress: {info['progress']}")
+        
+        try:
+            await _run_blocking(functools.partial(
+                result.get, timeout=TASK_TIMEOUT, on_message=on_message, propagate=False
+            ))
+        except CeleryTimeoutError:
+            pass
+        
+        if result.state == 'SUCCESS':
+            print(f"   ✅ Task completed successfully!")
+            print(f"   📊 Result: {len(result.result.get('matched_jobs', []))} jobs found")
+            return True
+        elif result.state == 'FAILURE':
+            print(f"   ❌ Task failed: {result.info}")
+            return False
+        
+        print(f"   ⏰ Task did not complete within {TASK_TIMEOUT} seconds")
         print(f"   📊 Final state: {result.state}")
         return False
         
@@ -184,17 +214,38 @@ def test_specific_task():
         print(f"❌ Failed to test specific task: {e}")
         return False
 
+def _find_celery_processes():
+    """Return 'pid: command line' for every process that mentions celery"""
+    if not os.path.isdir('/proc'):
+        # No procfs (e.g. macOS), fall back to the process table from ps
+        import subprocess
+        result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
+        return [line for line in result.stdout.split('\n') if 'celery' in line.lower()]
+    
+    processes = []
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            pid = entry.name
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # Process exited or isn't readable
+            if b'celery' in cmdline.lower():
+                command = cmdline.rstrip(b'\0').replace(b'\0', b' ').decode(errors='replace')
+                processes.append(f"{pid}: {command}")
+    return processes
+
 def test_worker_logs():
     """Check for worker process"""
     print("\n🔍 Testing Worker Process")
     print("=" * 30)
     
     try:
-        import subprocess
-        
         # Check for celery processes
-        result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-        celery_processes = [line for line in result.stdout.split('\n') if 'celery' in line.lower()]
+        celery_processes = _find_celery_processes()
         
         if celery_processes:
             print(f"   ✅ Found {len(celery_processes)} Celery processes:")
@@ -211,29 +262,31 @@ def test_worker_logs():
         print(f"❌ Failed to check processes: {e}")
         return False
 
-def test_redis_connection():
+async def test_redis_connection(r):
     """Test Redis connection with detailed info"""
     print("\n🔍 Testing Redis Connection")
     print("=" * 30)
     
     try:
-        import redis
+        if r is None:
+            raise ImportError("redis package is not installed")
         
         # Test connection
-        r = redis.Redis(host='localhost', port=6379, db=0)
-        info = r.info()
+        info = await r.info()
         
         print(f"   ✅ Redis connection successful")
         print(f"   📊 Redis version: {info.get('redis_version', 'unknown')}")
         print(f"   📊 Connected clients: {info.get('connected_clients', 'unknown')}")
         print(f"   📊 Used memory: {info.get('used_memory_human', 'unknown')}")
         
-        # Test specific keys
-        all_keys = r.keys('*')
-        celery_keys = [k for k in all_keys if b'celery' in k]
+        # Count keys without transferring the whole keyspace
+        total_keys = await r.dbsize()
+        celery_key_count = 0
+        async for _ in r.scan_iter(match='*celery*', count=1000):
+            celery_key_count += 1
         
-        print(f"   📋 Total Redis keys: {len(all_keys)}")
-        print(f"   📋 Celery-related keys: {len(celery_keys)}")
+        print(f"   📋 Total Redis keys: {total_keys}")
+        print(f"   📋 Celery-related keys: {celery_key_count}")
         
         return True
         
@@ -241,6 +294,43 @@ def test_redis_connection():
         print(f"❌ Redis connection failed: {e}")
         return False
 
+async def _run_blocking(func):
+    """Run a blocking test in the default executor, keeping its output buffer"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(contextvars.copy_context().run, func))
+
+async def _run_test(test):
+    """Await a test, capturing its output so overlapping tests don't interleave"""
+    with captured_output() as buffer:
+        try:
+            success = await test
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            success = False
+    return success, buffer.getvalue()
+
+async def _run_diagnostics():
+    """Run the independent checks concurrently, then the end-to-end task test"""
+    # One bounded pool shared by every Redis check; the concurrent checks
+    # borrow at most one connection each
+    pool = aioredis.ConnectionPool(host='localhost', port=6379, db=0, max_connections=4) if aioredis else None
+    r = aioredis.Redis(connection_pool=pool) if pool else None
+    try:
+        # These only read Redis, the broker and the process table, so they
+        # overlap; the task round-trip needs the worker and runs on its own
+        outcomes = list(await asyncio.gather(
+            _run_test(test_redis_connection(r)),
+            _run_test(_run_blocking(test_worker_logs)),
+            _run_test(_run_blocking(test_celery_worker_status)),
+            _run_test(test_task_in_queue(r)),
+            _run_test(test_task_result_backend(r)),
+        ))
+        outcomes.append(await _run_test(test_specific_task()))
+    finally:
+        if pool is not None:
+            await pool.disconnect()
+    return outcomes
+
 def main():
     """Run comprehensive Celery diagnostics"""
     print("🧪 Comprehensive Celery Worker Diagnostic")
@@ -248,24 +338,13 @@ def main():
     print(f"🕐 Started at: {datetime.now()}")
     print()
     
-    tests = [
-        test_redis_connection,
-        test_worker_logs,
-        test_celery_worker_status,
-        test_task_in_queue,
-        test_task_result_backend,
-        test_specific_task,
-    ]
+    with buffered_stdout():
+        outcomes = asyncio.run(_run_diagnostics())
     
     results = []
-    
-    for test_func in tests:
-        try:
-            success = test_func()
-            results.append(success)
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
-            results.append(False)
+    for success, output in outcomes:
+        print(output, end="")
+        results.append(success)
     
     # Summary
     print(f"\n{'='*50}")
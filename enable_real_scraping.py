@@ -5,6 +5,81 @@ Enable real web scraping instead of mock data
 
 import os
 import shutil
+import tempfile
+from collections import OrderedDict
+
+ENV_FILE = '.env'
+ENV_BACKUP_FILE = '.env.backup'
+
+def load_env(path=ENV_FILE):
+    """
+    Parse an env file into an ordered mapping of variable name -> raw line
+    
+    Comments and blank lines are kept under synthetic keys so the file can be
+    written back unchanged apart from the settings that were modified.
+    """
+    env = OrderedDict()
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            for line_number, line in enumerate(f):
+                if not line.endswith('\n'):
+                    line += '\n'
+                if '=' in line and not line.lstrip().startswith('#'):
+                    env[line.split('=', 1)[0]] = line
+                else:
+                    env[f'#{line_number}'] = line
+    return env
+
+def save_env(env, path=ENV_FILE):
+    """
+    Write an env mapping produced by load_env back to disk
+    
+    The new contents go to a temporary file that then replaces the original,
+    so an interrupted write never leaves a truncated .env behind.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', dir=directory, prefix='.env.', delete=False) as tmp:
+        tmp.writelines(env.values())
+    try:
+        if os.path.exists(path):
+            shutil.copymode(path, tmp.name)
+        os.replace(tmp.name, path)
+    except OSError:
+        os.remove(tmp.name)
+        raise
+
+def backup_env(path=ENV_FILE, backup_path=ENV_BACKUP_FILE):
+    """
+    Keep the current env file as a backup
+    
+    A hard link is enough: save_env replaces the file rather than rewriting
+    it, so the link keeps pointing at the old contents.
+    """
+    if os.path.exists(backup_path):
+        os.remove(backup_path)
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        # Filesystem without hard links
+        shutil.copy(path, backup_path)
+
+def set_env_values(env, updates):
+    """
+    Apply {name: value} updates to an env mapping in one pass
+    
+    Existing settings are rewritten in place; new ones are appended.
+    Returns the names that were newly added.
+    """
+    added = [name for name in updates if name not in env]
+    env.update((name, f'{name}={value}\n') for name, value in updates.items())
+    return added
+
+def get_env_flag(env, name, default):
+    """Read a true/false setting from an env mapping"""
+    line = env.get(name)
+    if line is None:
+        return default
+    return line.strip().split('=', 1)[1].lower() == 'true'
 
 def enable_real_scraping():
     """Switch from mock data to real web scraping"""
@@ -12,41 +87,21 @@ def enable_real_scraping():
     print("=" * 40)
     
     # Backup current .env
-    if os.path.exists('.env'):
+    if os.path.exists(ENV_FILE):
         print("📦 Backing up current .env to .env.backup...")
-        shutil.copy('.env', '.env.backup')
+        backup_env()
     
     # Read current .env
-    env_lines = []
-    if os.path.exists('.env'):
-        with open('.env', 'r') as f:
-            env_lines = f.readlines()
+    env = load_env()
     
-    # Update the USE_MOCK_JOBS setting
-    updated_lines = []
-    mock_jobs_updated = False
-    
-    for line in env_lines:
-        if line.startswith('USE_MOCK_JOBS='):
-            updated_lines.append('USE_MOCK_JOBS=false\n')
-            mock_jobs_updated = True
-            print("✅ Changed USE_MOCK_JOBS from true to false")
-        else:
-            updated_lines.append(line)
-    
-    # If USE_MOCK_JOBS wasn't found, add it
-    if not mock_jobs_updated:
-        # Find the job scraping section and add it there
-        for i, line in enumerate(updated_lines):
-            if line.startswith('JOB_SCRAPING_ENABLED='):
-                updated_lines.insert(i + 2, 'USE_MOCK_JOBS=false\n')
-                mock_jobs_updated = True
-                print("✅ Added USE_MOCK_JOBS=false to configuration")
-                break
+    # Update the USE_MOCK_JOBS setting, adding it if it wasn't found
+    if set_env_values(env, {'USE_MOCK_JOBS': 'false'}):
+        print("✅ Added USE_MOCK_JOBS=false to configuration")
+    else:
+        print("✅ Changed USE_MOCK_JOBS from true to false")
     
     # Write updated .env
-    with open('.env', 'w') as f:
-        f.writelines(updated_lines)
+    save_env(env)
     
     print("✅ Configuration updated successfully!")
     
@@ -75,24 +130,15 @@ def disable_real_scraping():
     print("=" * 50)
     
     # Read current .env
-    env_lines = []
-    if os.path.exists('.env'):
-        with open('.env', 'r') as f:
-            env_lines = f.readlines()
+    env = load_env()
     
     # Update the USE_MOCK_JOBS setting
-    updated_lines = []
-    
-    for line in env_lines:
-        if line.startswith('USE_MOCK_JOBS='):
-            updated_lines.append('USE_MOCK_JOBS=true\n')
-            print("✅ Changed USE_MOCK_JOBS from false to true")
-        else:
-            updated_lines.append(line)
+    if 'USE_MOCK_JOBS' in env:
+        set_env_values(env, {'USE_MOCK_JOBS': 'true'})
+        print("✅ Changed USE_MOCK_JOBS from false to true")
     
     # Write updated .env
-    with open('.env', 'w') as f:
-        f.writelines(updated_lines)
+    save_env(env)
     
     print("✅ Switched back to mock data")
     return True
@@ -103,16 +149,9 @@ def show_current_status():
     print("=" * 40)
     
     # Read .env file
-    use_mock = True  # default
-    scraping_enabled = True  # default
-    
-    if os.path.exists('.env'):
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.startswith('USE_MOCK_JOBS='):
-                    use_mock = line.strip().split('=')[1].lower() == 'true'
-                elif line.startswith('JOB_SCRAPING_ENABLED='):
-                    scraping_enabled = line.strip().split('=')[1].lower() == 'true'
+    env = load_env()
+    use_mock = get_env_flag(env, 'USE_MOCK_JOBS', True)
+    scraping_enabled = get_env_flag(env, 'JOB_SCRAPING_ENABLED', True)
     
     print(f"   Job Scraping Enabled: {'✅ Yes' if scraping_enabled else '❌ No'}")
     print(f"   Using Mock Data: {'✅ Yes' if use_mock else '❌ No'}")
@@ -131,6 +170,32 @@ def show_current_status():
     
     return use_mock
 
+def _status_already_shown():
+    """The status is printed on startup, so there is nothing more to do"""
+
+def _goodbye():
+    print("👋 Goodbye!")
+
+# Command-line actions and their aliases
+ACTIONS = {
+    'enable': enable_real_scraping,
+    'real': enable_real_scraping,
+    'true': enable_real_scraping,
+    'disable': disable_real_scraping,
+    'mock': disable_real_scraping,
+    'false': disable_real_scraping,
+    'status': _status_already_shown,
+    'show': _status_already_shown,
+}
+
+# Interactive menu choices
+MENU_ACTIONS = {
+    '1': enable_real_scraping,
+    '2': disable_real_scraping,
+    '3': show_current_status,
+    '4': _goodbye,
+}
+
 if __name__ == "__main__":
     import sys
     
@@ -148,26 +213,18 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1:
         action = sys.argv[1].lower()
-        if action in ['enable', 'real', 'true']:
-            enable_real_scraping()
-        elif action in ['disable', 'mock', 'false']:
-            disable_real_scraping()
-        elif action in ['status', 'show']:
-            pass  # Already shown above
+        handler = ACTIONS.get(action)
+        if handler:
+            handler()
         else:
             print(f"❌ Unknown action: {action}")
     else:
         try:
             choice = input(f"\nEnter your choice (1-4): ").strip()
             
-            if choice == '1':
-                enable_real_scraping()
-            elif choice == '2':
-                disable_real_scraping()
-            elif choice == '3':
-                show_current_status()
-            elif choice == '4':
-                print("👋 Goodbye!")
+            handler = MENU_ACTIONS.get(choice)
+            if handler:
+                handler()
             else:
                 print("❌ Invalid choice")
         except KeyboardInterrupt:
@@ -3,15 +3,16 @@
 Initialize the authentication database
 """
 
-import asyncio
 import os
 import sys
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+from app.db.database import engine
 from app.db.init_db import init_db
 from app.core.config import settings
+from _asyncio_helpers import run
 
 async def main():
     """
@@ -23,9 +24,12 @@ async def main():
     os.makedirs("data", exist_ok=True)
     
     # Initialize database
-    await init_db()
+    try:
+        await init_db(engine)
+    finally:
+        await engine.dispose()
     
     print("Database initialization complete!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
@@ -6,8 +6,33 @@ List all available authentication endpoints
 import requests
 import json
 import sys
+from operator import itemgetter
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 API_BASE_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = 5.0
+
+# Shared keep-alive session so the health check and schema fetch reuse one connection
+SESSION = requests.Session()
+
+def _iter_schema_paths(response):
+    """
+    Yield (path, methods) pairs from a streamed OpenAPI schema response
+    
+    With ijson installed each path entry is parsed on its own as it arrives,
+    so the full schema is never held in memory; otherwise the whole document
+    is loaded.
+    """
+    if ijson is None:
+        yield from response.json().get("paths", {}).items()
+        return
+    
+    response.raw.decode_content = True
+    yield from ijson.kvitems(response.raw, "paths")
 
 def list_auth_endpoints():
     """List all authentication endpoints from OpenAPI docs"""
@@ -16,34 +41,28 @@ def list_auth_endpoints():
     
     try:
         # Get OpenAPI schema
-        response = requests.get(f"{API_BASE_URL}/openapi.json")
+        response = SESSION.get(f"{API_BASE_URL}/openapi.json", timeout=REQUEST_TIMEOUT, stream=True)
         
         if response.status_code != 200:
             print(f"❌ Failed to get OpenAPI schema: {response.status_code}")
             return
         
-        schema = response.json()
-        paths = schema.get("paths", {})
-        
-        # Filter auth endpoints
-        auth_endpoints = []
-        
-        for path, methods in paths.items():
-            if "auth" in path:
-                for method, details in methods.items():
-                    auth_endpoints.append({
-                        "path": path,
-                        "method": method.upper(),
-                        "summary": details.get("summary", "No description"),
-                        "tags": details.get("tags", []),
-                        "requires_auth": any(
-                            security.get("bearerAuth", False) 
-                            for security in details.get("security", [{}])
-                        )
-                    })
+        # Filter auth endpoints; FastAPI only emits a security requirement
+        # for operations that depend on an auth scheme
+        auth_endpoints = [
+            {
+                "path": path,
+                "method": method.upper(),
+                "summary": details.get("summary", "No description"),
+                "tags": details.get("tags", []),
+                "requires_auth": bool(details.get("security"))
+            }
+            for path, methods in _iter_schema_paths(response) if "auth" in path
+            for method, details in methods.items()
+        ]
         
         # Sort endpoints
-        auth_endpoints.sort(key=lambda x: (x["path"], x["method"]))
+        auth_endpoints.sort(key=itemgetter("path", "method"))
         
         # Print as table
         print(f"{'Method':<7} {'Path':<40} {'Auth':<5} {'Description'}")
@@ -69,7 +88,7 @@ def list_auth_endpoints():
 def test_health_check():
     """Test if the API is running"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/health")
+        response = SESSION.get(f"{API_BASE_URL}/api/v1/health", timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             print("✅ API is running and healthy")
             return True
@@ -2,10 +2,18 @@
 Main entry point for the Resume Job Matcher API
 """
 
+from importlib.util import find_spec
+
 import uvicorn
 from app.main import app
 from app.core.config import settings
 
+# Use the libuv event loop and C HTTP parser from uvicorn[standard]; fall
+# back to the pure-Python implementations where they aren't available
+# (e.g. Windows, which uvloop doesn't support)
+LOOP = "uvloop" if find_spec("uvloop") else "asyncio"
+HTTP = "httptools" if find_spec("httptools") else "h11"
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
@@ -14,5 +22,7 @@ if __name__ == "__main__":
         reload=settings.DEBUG,
         workers=1 if settings.DEBUG else settings.WORKERS,
         log_level=settings.LOG_LEVEL.lower(),
-        access_log=True
+        access_log=True,
+        loop=LOOP,
+        http=HTTP
     )
\ No newline at end of file
@@ -3,36 +3,51 @@
 Process tasks that are already in the queue
 """
 
-import json
+import orjson
 import redis
 
+# Number of queued tasks listed before the queue is cleared
+SAMPLE_SIZE = 5
+
+# One connection pool shared by every Redis call in this script
+POOL = redis.ConnectionPool(host='localhost', port=6379, db=0, max_connections=4)
+
+def get_redis_client():
+    """Get a Redis client backed by the shared connection pool"""
+    return redis.Redis(connection_pool=POOL)
+
 def process_existing_tasks():
     """Move tasks from default queue and process them"""
     try:
         # Connect to Redis
-        r = redis.Redis(host='localhost', port=6379, db=0)
+        r = get_redis_client()
         
         print("🔍 Checking existing tasks in queue...")
         
-        # Check default queue
-        queue_length = r.llen('default')
+        # Count, sample and clear the default queue in one round-trip; the
+        # queue is being dropped since we're restarting with proper
+        # configuration, and UNLINK frees it off Redis's main thread
+        pipe = r.pipeline(transaction=False)
+        pipe.llen('default')
+        pipe.lrange('default', 0, SAMPLE_SIZE - 1)
+        pipe.unlink('default')
+        queue_length, tasks, _ = pipe.execute()
         print(f"📦 Found {queue_length} tasks in 'default' queue")
         
         if queue_length > 0:
             print("📋 Tasks in queue:")
-            tasks = r.lrange('default', 0, -1)
             for i, task in enumerate(tasks):
                 try:
-                    task_data = json.loads(task)
+                    task_data = orjson.loads(task)
                     task_id = task_data.get('id', 'unknown')
                     task_name = task_data.get('task', 'unknown')
                     print(f"   {i+1}. {task_name} (ID: {task_id})")
                 except:
                     print(f"   {i+1}. Raw task data")
+            if queue_length > len(tasks):
+                print(f"   ... and {queue_length - len(tasks)} more")
             
-            # Clear the queue since we're restarting with proper configuration
-            print(f"\n🧹 Clearing {queue_length} old tasks from queue...")
-            r.delete('default')
+            print(f"\n🧹 Cleared {queue_length} old tasks from queue")
             print("✅ Queue cleared")
         else:
             print("✅ No tasks in queue")
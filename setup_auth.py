@@ -3,7 +3,6 @@
 Setup authentication system
 """
 
-import asyncio
 import os
 import sys
 import sqlite3
@@ -11,8 +10,10 @@ import sqlite3
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+from app.db.database import engine
 from app.db.init_db import init_db
 from app.core.config import settings
+from _asyncio_helpers import run
 
 async def setup_authentication():
     """
@@ -40,7 +41,10 @@ async def setup_authentication():
     
     # Initialize database
     print("🗄️  Initializing database...")
-    await init_db()
+    try:
+        await init_db(engine)
+    finally:
+        await engine.dispose()
     
     print("✅ Authentication system setup complete!")
     print()
@@ -54,4 +58,4 @@ async def setup_authentication():
     print("🔐 Authentication endpoints: http://localhost:8000/docs#/auth")
 
 if __name__ == "__main__":
-    asyncio.run(setup_authentication())
\ No newline at end of file
+    run(setup_authentication())
\ No newline at end of file
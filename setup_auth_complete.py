@@ -7,15 +7,44 @@ import asyncio
 import os
 import sys
 import getpass
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from sqlalchemy.ext.asyncio import create_async_engine
-from fastapi_users.password import PasswordHelper
-from app.core.config import settings
+from app.db.database import engine, async_session_maker
 from app.models.user import Base, User
+from _asyncio_helpers import run
+from _password_helpers import PASSWORD_HELPER
+
+async def hash_passwords(passwords):
+    """
+    Hash passwords in the default thread pool
+    
+    bcrypt is CPU-bound but releases the GIL, so this keeps the event loop
+    free and hashes several passwords in parallel.
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(
+        loop.run_in_executor(None, PASSWORD_HELPER.hash, password)
+        for password in passwords
+    ))
+
+async def create_users(session, users):
+    """
+    Create several users in a single transaction
+    
+    Args:
+        session: Async database session
+        users: List of User column values, one dict per user
+        
+    Returns:
+        List of created users (ids are populated by the flush on commit)
+    """
+    created_users = [User(**user) for user in users]
+    session.add_all(created_users)
+    await session.commit()
+    return created_users
 
 async def setup_complete():
     """
@@ -41,13 +70,6 @@ async def setup_complete():
             print("✅ Setup complete!")
             return
     
-    # Create engine for initialization
-    print("🔧 Creating database engine...")
-    engine = create_async_engine(
-        settings.DATABASE_URL,
-        echo=settings.DB_ECHO,
-    )
-    
     # Create tables
     print("🗄️  Creating database tables...")
     async with engine.begin() as conn:
@@ -78,37 +100,25 @@ async def setup_complete():
         
         try:
             # Create password hash
-            password_helper = PasswordHelper()
-            hashed_password = password_helper.hash(password)
-            
-            # Create SQLAlchemy session
-            from sqlalchemy.ext.asyncio import AsyncSession
-            from sqlalchemy.orm import sessionmaker
-            
-            async_session = sessionmaker(
-                engine, expire_on_commit=False, class_=AsyncSession
-            )
+            hashed_password, = await hash_passwords([password])
             
             # Create user directly
-            async with async_session() as session:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            async with async_session_maker() as session:
                 # Create new user
-                user = User(
-                    email=email,
-                    hashed_password=hashed_password,
-                    is_active=True,
-                    is_superuser=True,
-                    is_verified=True,
-                    first_name=first_name,
-                    last_name=last_name,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                    monthly_matches_used=0,
-                    last_match_reset=datetime.utcnow()
-                )
-                
-                session.add(user)
-                await session.commit()
-                await session.refresh(user)
+                user, = await create_users(session, [{
+                    "email": email,
+                    "hashed_password": hashed_password,
+                    "is_active": True,
+                    "is_superuser": True,
+                    "is_verified": True,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "created_at": now,
+                    "updated_at": now,
+                    "monthly_matches_used": 0,
+                    "last_match_reset": now,
+                }])
                 
                 print(f"✅ Admin user created successfully!")
                 print(f"📧 Email: {user.email}")
@@ -131,4 +141,4 @@ async def setup_complete():
     print("🔐 Authentication endpoints: http://localhost:8000/docs#/auth")
 
 if __name__ == "__main__":
-    asyncio.run(setup_complete())
\ No newline at end of file
+    run(setup_complete())
\ No newline at end of file
@@ -3,11 +3,49 @@
 Test the authentication system
 """
 
-import requests
-import json
+import orjson
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+from _http_helpers import SESSION, api_url, authed_get, health, login
 
-API_BASE_URL = "http://localhost:8000"
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# Sample resume uploaded by the job matching check, encoded once
+RESUME_BYTES = b"""
+John Doe
+Software Engineer
+
+Skills:
+- Python
+- FastAPI
+- Machine Learning
+- Authentication Systems
+
+Experience:
+- 3 years as Python Developer
+- Built REST APIs with FastAPI
+- Implemented user authentication
+"""
+
+def post_file(path: str, field: str, filename: str, content: bytes, content_type: str):
+    """
+    POST a single file as multipart/form-data
+    
+    With requests_toolbelt installed the body is streamed to the socket in
+    chunks rather than assembled in memory first; otherwise requests builds
+    it with files=.
+    """
+    url = api_url(path)
+    if MultipartEncoder is None:
+        return SESSION.post(url, files={field: (filename, content, content_type)})
+    
+    encoder = MultipartEncoder(fields={field: (filename, content, content_type)})
+    return SESSION.post(url, data=encoder, headers={"Content-Type": encoder.content_type})
 
 def test_user_registration():
     """Test user registration"""
@@ -21,10 +59,14 @@ def test_user_registration():
     }
     
     try:
-        response = requests.post(f"{API_BASE_URL}/api/v1/auth/register", json=user_data)
+        response = SESSION.post(
+            api_url("/api/v1/auth/register"),
+            data=orjson.dumps(user_data),
+            headers={"Content-Type": "application/json"}
+        )
         
         if response.status_code == 201:
-            user = response.json()
+            user = orjson.loads(response.content)
             print(f"   ✅ User registered successfully")
             print(f"   📧 Email: {user['email']}")
             print(f"   🆔 ID: {user['id']}")
@@ -43,20 +85,11 @@ def test_user_login(email: str, password: str):
     """Test user login"""
     print("🔍 Testing User Login...")
     
-    login_data = {
-        "username": email,  # FastAPI Users uses 'username' field
-        "password": password
-    }
-    
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/auth/jwt/login",
-            data=login_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
+        response = login(email, password)
         
         if response.status_code == 200:
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             print(f"   ✅ Login successful")
             print(f"   🔑 Token type: {token_data['token_type']}")
             print(f"   ⏰ Access token: {token_data['access_token'][:20]}...")
@@ -70,21 +103,16 @@ def test_user_login(email: str, password: str):
         print(f"   ❌ Error: {e}")
         return None
 
-def test_protected_endpoint(token: str):
-    """Test accessing protected endpoint"""
+def test_protected_endpoint(pending: Optional[Future] = None):
+    """Test accessing protected endpoint, optionally from an in-flight request"""
     print("🔍 Testing Protected Endpoint...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
         # Test getting user profile
-        response = requests.get(f"{API_BASE_URL}/api/v1/auth/me/profile", headers=headers)
+        response = pending.result() if pending else authed_get("/api/v1/auth/me/profile")
         
         if response.status_code == 200:
-            profile = response.json()
+            profile = orjson.loads(response.content)
             print(f"   ✅ Profile access successful")
             print(f"   👤 User ID: {profile['user_id']}")
             print(f"   📅 Created: {profile['created_at']}")
@@ -98,20 +126,15 @@ def test_protected_endpoint(token: str):
         print(f"   ❌ Error: {e}")
         return False
 
-def test_subscription_info(token: str):
-    """Test getting subscription information"""
+def test_subscription_info(pending: Optional[Future] = None):
+    """Test getting subscription information, optionally from an in-flight request"""
     print("🔍 Testing Subscription Info...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/auth/me/subscription", headers=headers)
+        response = pending.result() if pending else authed_get("/api/v1/auth/me/subscription")
         
         if response.status_code == 200:
-            subscription = response.json()
+            subscription = orjson.loads(response.content)
             print(f"   ✅ Subscription info retrieved")
             print(f"   💳 Tier: {subscription['tier']}")
             print(f"   📊 Monthly limit: {subscription['monthly_limit']}")
@@ -128,44 +151,17 @@ def test_subscription_info(token: str):
         print(f"   ❌ Error: {e}")
         return None
 
-def test_authenticated_job_match(token: str):
+def test_authenticated_job_match():
     """Test job matching with authentication"""
     print("🔍 Testing Authenticated Job Matching...")
     
-    # Create a test resume file
-    test_resume = """
-John Doe
-Software Engineer
-
-Skills:
-- Python
-- FastAPI
-- Machine Learning
-- Authentication Systems
-
-Experience:
-- 3 years as Python Developer
-- Built REST APIs with FastAPI
-- Implemented user authentication
-"""
-    
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
-    
     try:
-        files = {
-            'file': ('test_resume.txt', test_resume, 'text/plain')
-        }
-        
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/jobs/match",
-            files=files,
-            headers=headers
+        response = post_file(
+            "/api/v1/jobs/match", 'file', 'test_resume.txt', RESUME_BYTES, 'text/plain'
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"   ✅ Authenticated job matching successful")
             print(f"   🆔 Task ID: {result['task_id']}")
             print(f"   📊 Status: {result['status']}")
@@ -180,25 +176,40 @@ Experience:
         print(f"   ❌ Error: {e}")
         return None
 
-def test_job_match_history(token: str):
+def wait_for_job_match(filename: str, timeout: float = 5.0) -> bool:
+    """
+    Poll the match history until it lists the given resume
+    
+    The endpoint records the match while handling the upload, so this
+    normally returns after the first request instead of a fixed sleep.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        response = SESSION.get(api_url("/api/v1/auth/me/job-matches"))
+        if response.status_code == 200 and any(
+            match['resume_filename'] == filename for match in orjson.loads(response.content)
+        ):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.1)
+
+def test_job_match_history():
     """Test getting job match history"""
     print("🔍 Testing Job Match History...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/auth/me/job-matches", headers=headers)
+        response = authed_get("/api/v1/auth/me/job-matches")
         
         if response.status_code == 200:
-            matches = response.json()
+            matches = orjson.loads(response.content)
             print(f"   ✅ Job match history retrieved")
             print(f"   📊 Total matches: {len(matches)}")
             
-            for i, match in enumerate(matches, 1):
-                print(f"   {i}. {match['resume_filename']} - {match['jobs_found']} jobs found")
+            sys.stdout.write("".join(
+                f"   {i}. {match['resume_filename']} - {match['jobs_found']} jobs found\n"
+                for i, match in enumerate(matches, 1)
+            ))
             
             return matches
         else:
@@ -210,27 +221,13 @@ def test_job_match_history(token: str):
         print(f"   ❌ Error: {e}")
         return None
 
-def test_health_check():
-    """Test if the API is running"""
-    try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/health")
-        if response.status_code == 200:
-            print("✅ API is running and healthy")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Cannot connect to API: {e}")
-        return False
-
 def main():
     """Run all authentication tests"""
     print("🧪 Authentication System Test Suite")
     print("=" * 50)
     
     # Check if API is running
-    if not test_health_check():
+    if not health():
         print("\nPlease make sure the API server is running:")
         print("python main.py")
         sys.exit(1)
@@ -253,35 +250,42 @@ def main():
     
     print()
     
-    # Test protected endpoint
-    if not test_protected_endpoint(token):
-        print("❌ Protected endpoint access failed")
-        return
-    
-    print()
-    
-    # Test subscription info
-    subscription = test_subscription_info(token)
-    if not subscription:
-        print("❌ Subscription info failed")
-        return
+    # The profile and subscription reads are independent, so both go out at
+    # once on the shared session; the checks then report them in order.
+    # The match history read waits for the upload below, since it has to
+    # see the new match.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        profile = executor.submit(authed_get, "/api/v1/auth/me/profile")
+        subscription_info = executor.submit(authed_get, "/api/v1/auth/me/subscription")
+        
+        # Test protected endpoint
+        if not test_protected_endpoint(profile):
+            print("❌ Protected endpoint access failed")
+            return
+        
+        print()
+        
+        # Test subscription info
+        subscription = test_subscription_info(subscription_info)
+        if not subscription:
+            print("❌ Subscription info failed")
+            return
     
     print()
     
     # Test authenticated job matching
-    task_id = test_authenticated_job_match(token)
+    task_id = test_authenticated_job_match()
     if not task_id:
         print("❌ Authenticated job matching failed")
         return
     
     print()
     
-    # Wait a moment for the job to be recorded
-    import time
-    time.sleep(2)
+    # Wait for the job to be recorded
+    wait_for_job_match('test_resume.txt')
     
     # Test job match history
-    matches = test_job_match_history(token)
+    matches = test_job_match_history()
     
     print()
     print("=" * 50)
@@ -4,23 +4,52 @@ Test script to diagnose Celery task issues
 """
 
 import sys
-import time
 import logging
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 from app.core.celery_app import celery_app
 from app.services.tasks import process_resume_and_match_jobs, health_check_task
+from app.services.file_service import FileService
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sample resume sent to the processing task, encoded once
+RESUME_BYTES = b"""
+John Doe
+Software Engineer
+
+Skills:
+- Python
+- FastAPI
+- Machine Learning
+- Data Analysis
+
+Experience:
+- 3 years as Python Developer
+- Built REST APIs with FastAPI
+- Worked with ML models
+"""
+
+# One inspector for the whole run; replies from live workers arrive well
+# within a second, so don't wait out the default broadcast timeout
+_INSPECTOR = celery_app.control.inspect(timeout=1.0)
+_active_queues = None
+
+def get_active_queues():
+    """Return the workers' active queues, broadcasting only on first use"""
+    global _active_queues
+    if _active_queues is None:
+        _active_queues = _INSPECTOR.active_queues() or {}
+    return _active_queues
+
 def test_celery_connection():
     """Test basic Celery connection"""
     print("🔍 Testing Celery connection...")
     
     try:
         # Test broker connection
-        inspector = celery_app.control.inspect()
-        active_queues = inspector.active_queues()
+        active_queues = get_active_queues()
         
         if active_queues:
             print("✅ Celery broker connection successful")
@@ -41,7 +70,7 @@ def test_registered_tasks():
     """Test if tasks are properly registered"""
     print("\n🔍 Checking registered tasks...")
     
-    registered_tasks = list(celery_app.tasks.keys())
+    registered_tasks = frozenset(celery_app.tasks.keys())
     print(f"   Total registered tasks: {len(registered_tasks)}")
     
     expected_tasks = [
@@ -57,11 +86,10 @@ def test_registered_tasks():
             print(f"   ❌ {task_name} - NOT FOUND")
     
     print(f"\n   All registered tasks:")
-    for task in sorted(registered_tasks):
-        if not task.startswith('celery.'):
-            print(f"      - {task}")
+    for task in sorted(t for t in registered_tasks if not t.startswith('celery.')):
+        print(f"      - {task}")
     
-    return all(task in registered_tasks for task in expected_tasks)
+    return registered_tasks.issuperset(expected_tasks)
 
 def test_health_check_task():
     """Test the simple health check task"""
@@ -69,7 +97,7 @@ def test_health_check_task():
     
     try:
         # Send task
-        result = health_check_task.delay()
+        result = health_check_task.apply_async(ignore_result=False)
         print(f"   Task ID: {result.id}")
         print(f"   Task state: {result.state}")
         
@@ -89,27 +117,10 @@ def test_resume_processing_task():
     """Test the resume processing task with sample data"""
     print("\n🔍 Testing resume processing task...")
     
-    # Sample resume content
-    sample_resume = """
-John Doe
-Software Engineer
-
-Skills:
-- Python
-- FastAPI
-- Machine Learning
-- Data Analysis
-
-Experience:
-- 3 years as Python Developer
-- Built REST APIs with FastAPI
-- Worked with ML models
-"""
-    
     try:
         # Send task
         result = process_resume_and_match_jobs.delay(
-            file_content=sample_resume.encode('utf-8'),
+            file_path=FileService().save_file_content(RESUME_BYTES, "test_resume.txt"),
             filename="test_resume.txt",
             content_type="text/plain"
         )
@@ -117,17 +128,21 @@ Experience:
         print(f"   Task ID: {result.id}")
         print(f"   Task state: {result.state}")
         
-        # Monitor task progress
+        # Monitor task progress: state updates arrive over the result
+        # backend's pub/sub channel as the worker publishes them
         print("   Monitoring task progress...")
         timeout = 60  # 60 seconds timeout
-        start_time = time.time()
         
-        while not result.ready() and (time.time() - start_time) < timeout:
-            print(f"   Current state: {result.state}")
-            if hasattr(result, 'info') and result.info:
-                if isinstance(result.info, dict) and 'progress' in result.info:
-                    print(f"   Progress: {result.info['progress']}")
-            time.sleep(2)
+        def on_message(meta):
+            print(f"   Current state: {meta['status']}")
+            info = meta.get('result')
+            if isinstance(info, dict) and 'progress' in info:
+                print(f"   Progress: {info['progress']}")
+        
+        try:
+            result.get(timeout=timeout, on_message=on_message, propagate=False)
+        except CeleryTimeoutError:
+            pass
         
         if result.ready():
             if result.successful():
@@ -152,10 +167,8 @@ def test_task_routing():
     print("\n🔍 Testing task routing...")
     
     try:
-        inspector = celery_app.control.inspect()
-        
         # Check active queues
-        active_queues = inspector.active_queues()
+        active_queues = get_active_queues()
         if active_queues:
             print("   Active queues:")
             for worker, queues in active_queues.items():
@@ -3,92 +3,70 @@
 Test different ways of uploading files to identify the issue
 """
 
-import requests
-import json
+import asyncio
+import aiohttp
+import orjson
 from io import BytesIO
 
 API_BASE_URL = "http://localhost:8000"
 ENDPOINT = f"{API_BASE_URL}/api/v1/jobs/match"
 
-def test_various_upload_methods():
+# Resume body shared by every upload probe
+RESUME_BYTES = b"John Doe\nSoftware Engineer\nPython, FastAPI, Machine Learning"
+
+def _json_dumps(obj):
+    """Serialize request bodies with orjson (aiohttp expects a str)"""
+    return orjson.dumps(obj).decode()
+
+def _upload_form(field_name, content):
+    """Build a multipart form with one text file under the given field name"""
+    form = aiohttp.FormData()
+    form.add_field(field_name, content, filename='resume.txt', content_type='text/plain')
+    return form
+
+async def _probe(session, title, **request_kwargs):
+    """Send one upload variant and return its report"""
+    lines = [title]
+    try:
+        async with session.post(ENDPOINT, **request_kwargs) as response:
+            text = await response.text()
+        lines.append(f"  Status: {response.status}")
+        lines.append(f"  Response: {text[:200]}...")
+    except Exception as e:
+        lines.append(f"  Error: {e}")
+    return "\n".join(lines) + "\n"
+
+async def test_various_upload_methods(session):
     """Test different upload methods that might cause the error"""
     
-    test_content = "John Doe\nSoftware Engineer\nPython, FastAPI, Machine Learning"
-    
     print("Testing various upload methods...")
     print("=" * 60)
     
-    # Test 1: Correct method (should work)
-    print("Test 1: Correct multipart/form-data upload")
-    try:
-        files = {'file': ('resume.txt', test_content, 'text/plain')}
-        response = requests.post(ENDPOINT, files=files)
-        print(f"  Status: {response.status_code}")
-        print(f"  Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"  Error: {e}")
-        print()
-    
-    # Test 2: Wrong field name (should fail)
-    print("Test 2: Wrong field name (should fail)")
-    try:
-        files = {'resume': ('resume.txt', test_content, 'text/plain')}
-        response = requests.post(ENDPOINT, files=files)
-        print(f"  Status: {response.status_code}")
-        print(f"  Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"  Error: {e}")
-        print()
-    
-    # Test 3: Empty file (should fail)
-    print("Test 3: Empty file (should fail)")
-    try:
-        files = {'file': ('resume.txt', '', 'text/plain')}
-        response = requests.post(ENDPOINT, files=files)
-        print(f"  Status: {response.status_code}")
-        print(f"  Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"  Error: {e}")
-        print()
-    
-    # Test 4: No file at all (should fail with the error you're seeing)
-    print("Test 4: No file field (should reproduce your error)")
-    try:
-        response = requests.post(ENDPOINT, data={'other_field': 'value'})
-        print(f"  Status: {response.status_code}")
-        print(f"  Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"  Error: {e}")
-        print()
-    
-    # Test 5: JSON instead of multipart (should fail)
-    print("Test 5: JSON instead of multipart (should fail)")
-    try:
-        headers = {'Content-Type': 'application/json'}
-        data = {'file': 'some content'}
-        response = requests.post(ENDPOINT, json=data, headers=headers)
-        print(f"  Status: {response.status_code}")
-        print(f"  Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"  Error: {e}")
-        print()
+    # The probes are independent, so send them all at once and print the
+    # reports in order
+    reports = await asyncio.gather(
+        # Test 1: Correct method (should work)
+        _probe(session, "Test 1: Correct multipart/form-data upload",
+               data=_upload_form('file', RESUME_BYTES)),
+        # Test 2: Wrong field name (should fail)
+        _probe(session, "Test 2: Wrong field name (should fail)",
+               data=_upload_form('resume', RESUME_BYTES)),
+        # Test 3: Empty file (should fail)
+        _probe(session, "Test 3: Empty file (should fail)",
+               data=_upload_form('file', b'')),
+        # Test 4: No file at all (should fail with the error you're seeing)
+        _probe(session, "Test 4: No file field (should reproduce your error)",
+               data={'other_field': 'value'}),
+        # Test 5: JSON instead of multipart (should fail)
+        _probe(session, "Test 5: JSON instead of multipart (should fail)",
+               json={'file': 'some content'}),
+        # Test 6: Using curl-like approach
+        _probe(session, "Test 6: Simulating curl upload",
+               data=_upload_form('file', BytesIO(RESUME_BYTES))),
+    )
     
-    # Test 6: Using curl-like approach
-    print("Test 6: Simulating curl upload")
-    try:
-        files = {'file': ('resume.txt', BytesIO(test_content.encode()), 'text/plain')}
-        response = requests.post(ENDPOINT, files=files)
-        print(f"  Status: {response.status_code}")
-        print(f"  Response: {response.text[:200]}...")
-        print()
-    except Exception as e:
-        print(f"  Error: {e}")
-        print()
+    for report in reports:
+        print(report)
 
 def show_curl_examples():
     """Show correct curl examples"""
@@ -105,6 +83,12 @@ def show_curl_examples():
     print(f"   requests.post('{ENDPOINT}', files=files)")
     print()
 
+async def main():
+    """Run the upload probes over one pooled session"""
+    connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector, json_serialize=_json_dumps) as session:
+        await test_various_upload_methods(session)
+    show_curl_examples()
+
 if __name__ == "__main__":
-    test_various_upload_methods()
-    show_curl_examples()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
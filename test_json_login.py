@@ -3,74 +3,75 @@
 Test the JSON login endpoint
 """
 
-import requests
-import json
+import asyncio
+import aiohttp
+import orjson
+import re
 import sys
 
 API_BASE_URL = "http://localhost:8000"
 
-def test_json_login(email, password):
+# Same minimum the registration schema enforces
+MIN_PASSWORD_LENGTH = 8
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+def credentials_error(email, password):
+    """Return why the credentials can't be valid, or None if they look usable"""
+    if not EMAIL_PATTERN.match(email):
+        return f"'{email}' is not a valid email address"
+    if len(password) < MIN_PASSWORD_LENGTH:
+        return f"Password must be at least {MIN_PASSWORD_LENGTH} characters long"
+    return None
+
+def _json_dumps(obj):
+    """Serialize request bodies with orjson (aiohttp expects a str)"""
+    return orjson.dumps(obj).decode()
+
+async def _post_login(session, path, **request_kwargs):
+    """POST a login request and return (status code, token data or error text)"""
+    async with session.post(f"{API_BASE_URL}{path}", **request_kwargs) as response:
+        if response.status == 200:
+            return response.status, await response.json(loads=orjson.loads)
+        return response.status, await response.text()
+
+async def test_json_login(session, email, password):
     """Test JSON login endpoint"""
-    print("🔍 Testing JSON Login...")
-    
     login_data = {
         "username": email,
         "password": password
     }
-    
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/auth/json-login",
-            json=login_data,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            token_data = response.json()
-            print(f"✅ Login successful!")
-            print(f"🔑 Token type: {token_data['token_type']}")
-            print(f"🔑 Access token: {token_data['access_token'][:20]}...")
-            return token_data['access_token']
-        else:
-            print(f"❌ Login failed: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return None
+    return await _post_login(session, "/api/v1/auth/json-login", json=login_data)
 
-def test_form_login(email, password):
+async def test_form_login(session, email, password):
     """Test form-based login endpoint"""
-    print("\n🔍 Testing Form-Based Login...")
+    return await _post_login(
+        session,
+        "/api/v1/auth/jwt/login",
+        data={"username": email, "password": password}
+    )
+
+def report_login(title, outcome):
+    """Print the result of a login attempt and return its access token"""
+    print(title)
     
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/auth/jwt/login",
-            data={"username": email, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
-        
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            token_data = response.json()
-            print(f"✅ Login successful!")
-            print(f"🔑 Token type: {token_data['token_type']}")
-            print(f"🔑 Access token: {token_data['access_token'][:20]}...")
-            return token_data['access_token']
-        else:
-            print(f"❌ Login failed: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    if isinstance(outcome, Exception):
+        print(f"❌ Error: {outcome}")
+        return None
+    
+    status, body = outcome
+    print(f"Status Code: {status}")
+    
+    if status == 200:
+        print(f"✅ Login successful!")
+        print(f"🔑 Token type: {body['token_type']}")
+        print(f"🔑 Access token: {body['access_token'][:20]}...")
+        return body['access_token']
+    else:
+        print(f"❌ Login failed: {status}")
+        print(f"Response: {body}")
         return None
 
-def test_protected_endpoint(token):
+async def test_protected_endpoint(session, token):
     """Test accessing protected endpoint"""
     print("\n🔍 Testing Protected Endpoint...")
     
@@ -78,74 +79,89 @@ def test_protected_endpoint(token):
         print("❌ No token available, skipping test")
         return False
     
+    # A JWT is header.payload.signature; anything else is rejected by the server anyway
+    if token.count(".") != 2:
+        print("❌ Token is not a JWT, skipping test")
+        return False
+    
     headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
+        "Authorization": f"Bearer {token}"
     }
     
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/auth/users/me", headers=headers)
-        
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            user_data = response.json()
-            print(f"✅ Protected endpoint access successful!")
-            print(f"👤 User: {user_data['email']}")
-            print(f"🆔 ID: {user_data['id']}")
-            return True
-        else:
-            print(f"❌ Protected endpoint access failed: {response.status_code}")
-            print(f"Response: {response.text}")
-            return False
+        async with session.get(f"{API_BASE_URL}/api/v1/auth/users/me", headers=headers) as response:
+            print(f"Status Code: {response.status}")
+            
+            if response.status == 200:
+                user_data = await response.json(loads=orjson.loads)
+                print(f"✅ Protected endpoint access successful!")
+                print(f"👤 User: {user_data['email']}")
+                print(f"🆔 ID: {user_data['id']}")
+                return True
+            else:
+                print(f"❌ Protected endpoint access failed: {response.status}")
+                print(f"Response: {await response.text()}")
+                return False
             
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
 
-def test_health_check():
+async def test_health_check(session):
     """Test if the API is running"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/health")
-        if response.status_code == 200:
-            print("✅ API is running and healthy")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            return False
+        async with session.get(f"{API_BASE_URL}/api/v1/health") as response:
+            if response.status == 200:
+                print("✅ API is running and healthy")
+                return True
+            else:
+                print(f"❌ Health check failed: {response.status}")
+                return False
     except Exception as e:
         print(f"❌ Cannot connect to API: {e}")
         return False
 
-if __name__ == "__main__":
+async def main():
+    """Run the login checks over one pooled session"""
     print("🧪 JSON Login Test")
     print("=" * 50)
     
-    # Check if API is running
-    if not test_health_check():
-        print("\nPlease make sure the API server is running:")
-        print("python main.py")
-        sys.exit(1)
-    
-    print()
-    
-    # Get credentials
-    if len(sys.argv) >= 3:
-        email = sys.argv[1]
-        password = sys.argv[2]
-    else:
-        email = input("Email: ")
-        password = input("Password: ")
-    
-    # Test JSON login
-    json_token = test_json_login(email, password)
-    
-    # Test form login
-    form_token = test_form_login(email, password)
-    
-    # Test protected endpoint with JSON token
-    if json_token:
-        test_protected_endpoint(json_token)
+    connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector, json_serialize=_json_dumps) as session:
+        # Check if API is running
+        if not await test_health_check(session):
+            print("\nPlease make sure the API server is running:")
+            print("python main.py")
+            sys.exit(1)
+        
+        print()
+        
+        # Get credentials
+        if len(sys.argv) >= 3:
+            email = sys.argv[1]
+            password = sys.argv[2]
+        else:
+            email = input("Email: ")
+            password = input("Password: ")
+        
+        # Don't spend login round-trips on credentials the server will reject
+        error = credentials_error(email, password)
+        if error:
+            print(f"❌ {error}")
+            sys.exit(1)
+        
+        # Test JSON and form login at the same time; report them in order
+        json_outcome, form_outcome = await asyncio.gather(
+            test_json_login(session, email, password),
+            test_form_login(session, email, password),
+            return_exceptions=True
+        )
+        json_token = report_login("🔍 Testing JSON Login...", json_outcome)
+        form_token = report_login("\n🔍 Testing Form-Based Login...", form_outcome)
+        
+        # Test protected endpoint with JSON token
+        if json_token:
+            await test_protected_endpoint(session, json_token)
     
     print("\n=" * 50)
     if json_token and form_token:
@@ -159,4 +175,7 @@ if __name__ == "__main__":
         print("❌ Use JSON for login")
     else:
         print("❌ Both login methods failed")
-        print("❌ Check your credentials and server status")
\ No newline at end of file
+        print("❌ Check your credentials and server status")
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
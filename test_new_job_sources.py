@@ -4,16 +4,14 @@ Test the new job sources
 """
 
 import asyncio
+import sys
 from app.services.job_scraper import JobScraperService
 
-async def test_all_new_sources():
+async def test_all_new_sources(scraper):
     """Test all new job sources individually"""
     print("🧪 Testing New Job Sources")
     print("=" * 50)
     
-    scraper = JobScraperService()
-    scraper.use_mock = False  # Force real scraping
-    
     # Test each new source
     new_sources = [
         ("JustRemote", scraper._scrape_justremote_jobs),
@@ -26,28 +24,34 @@ async def test_all_new_sources():
     
     all_results = {}
     
-    for source_name, scraper_func in new_sources:
+    # Sources are independent hosts, so probe them all at once
+    print(f"\n🧪 Testing {len(new_sources)} sources concurrently...")
+    jobs_lists = await asyncio.gather(
+        *(scraper_func("Python", "Remote", 3) for _, scraper_func in new_sources),
+        return_exceptions=True
+    )
+    
+    for (source_name, _), jobs in zip(new_sources, jobs_lists):
         print(f"\n🔍 Testing {source_name}...")
-        try:
-            jobs = await scraper_func("Python", "Remote", 3)
+        if not isinstance(jobs, Exception):
             all_results[source_name] = jobs
             
             if jobs:
                 print(f"   ✅ Success: Found {len(jobs)} jobs")
-                for i, job in enumerate(jobs, 1):
-                    print(f"   {i}. {job['title']} at {job['company']}")
-                    print(f"      📍 {job['location']}")
-                    print(f"      💰 {job['salary_range']}")
-                    print(f"      🔗 {job['url']}")
+                sys.stdout.write("".join(
+                    f"   {i}. {job['title']} at {job['company']}\n"
+                    f"      📍 {job['location']}\n"
+                    f"      💰 {job['salary_range']}\n"
+                    f"      🔗 {job['url']}\n"
+                    for i, job in enumerate(jobs, 1)
+                ))
             else:
                 print(f"   ⚠️  No jobs found")
                 
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
+        else:
+            print(f"   ❌ Error: {str(jobs)}")
             all_results[source_name] = []
     
-    await scraper.close()
-    
     # Summary
     print(f"\n📊 Summary")
     print("=" * 30)
@@ -72,22 +76,23 @@ async def test_all_new_sources():
     
     return all_results
 
-async def test_combined_scraping():
+async def test_combined_scraping(scraper):
     """Test the combined scraping with all sources"""
     print(f"\n🌐 Testing Combined Scraping")
     print("=" * 40)
     
-    scraper = JobScraperService()
-    scraper.use_mock = False
-    
     # Test with different queries
     test_queries = ["Python", "JavaScript", "React", "Machine Learning"]
     
-    for query in test_queries:
+    # Run every query at once
+    jobs_lists = await asyncio.gather(
+        *(scraper.search_jobs(query, "Remote", limit=8) for query in test_queries),
+        return_exceptions=True
+    )
+    
+    for query, jobs in zip(test_queries, jobs_lists):
         print(f"\n🔍 Testing query: '{query}'")
-        try:
-            jobs = await scraper.search_jobs(query, "Remote", limit=8)
-            
+        if not isinstance(jobs, Exception):
             print(f"   📊 Found {len(jobs)} jobs")
             
             # Show diversity
@@ -102,21 +107,26 @@ async def test_combined_scraping():
             for i, job in enumerate(jobs[:3], 1):
                 print(f"      {i}. {job['title']} at {job['company']}")
                 
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-    
-    await scraper.close()
+        else:
+            print(f"   ❌ Error: {str(jobs)}")
 
 async def main():
     """Run all tests"""
     print("🚀 New Job Sources Test Suite")
     print("=" * 50)
     
-    # Test individual sources
-    results = await test_all_new_sources()
+    # One scraper for both phases so its connections stay warm
+    scraper = JobScraperService()
+    scraper.use_mock = False  # Force real scraping
     
-    # Test combined scraping
-    await test_combined_scraping()
+    try:
+        # Test individual sources
+        results = await test_all_new_sources(scraper)
+        
+        # Test combined scraping
+        await test_combined_scraping(scraper)
+    finally:
+        await scraper.close()
     
     print(f"\n🎉 Testing Complete!")
     print(f"💡 The job matcher now has access to:")
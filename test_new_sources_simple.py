@@ -1,19 +1,56 @@
 #!/usr/bin/env python3
 """
 Simple test of new job sources with timeout protection
+
+To see where the time goes, run it under a sampling profiler, e.g.
+    py-spy record -o scrape.svg -- python test_new_sources_simple.py
 """
 
 import asyncio
+import logging
+import random
+from _asyncio_helpers import run
 from app.services.job_scraper import JobScraperService
 
-async def test_source_with_timeout(source_name, scraper_func, query="Python", timeout=10):
+logger = logging.getLogger(__name__)
+
+# Most source probes allowed in flight at once
+SOURCE_CONCURRENCY = 8
+
+# Attempts per source before a timeout counts as a failure
+SOURCE_ATTEMPTS = 3
+
+# Seconds the combined search waits for each source before reporting
+# whatever the faster ones returned
+COMBINED_SOURCE_TIMEOUT = 8.0
+
+# Seconds the scraper reuses a source's results, so the combined search
+# doesn't refetch what the per-source probes already pulled
+SOURCE_CACHE_TTL = 600
+
+async def scrape_with_retry(source_name, scraper_func, semaphore, query, timeout):
+    """
+    Run one source scrape, retrying timeouts with jittered exponential backoff
+    
+    Each attempt gets the full timeout and its own semaphore slot; other
+    errors are not retried.
+    """
+    for attempt in range(SOURCE_ATTEMPTS):
+        try:
+            async with semaphore:
+                return await asyncio.wait_for(scraper_func(query, "Remote", 3), timeout=timeout)
+        except asyncio.TimeoutError:
+            if attempt == SOURCE_ATTEMPTS - 1:
+                raise
+            delay = min(2.0, 0.2 * 2 ** attempt) + random.uniform(0, 0.1)
+            logger.debug(f"{source_name} timed out, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+async def test_source_with_timeout(source_name, scraper_func, semaphore, query="Python", timeout=10):
     """Test a single source with timeout protection"""
     try:
-        # Run with timeout
-        jobs = await asyncio.wait_for(
-            scraper_func(query, "Remote", 3), 
-            timeout=timeout
-        )
+        # Run with timeout; time spent waiting for a slot doesn't count
+        jobs = await scrape_with_retry(source_name, scraper_func, semaphore, query, timeout)
         
         if jobs:
             print(f"   ✅ {source_name}: Found {len(jobs)} jobs")
@@ -25,22 +62,15 @@ async def test_source_with_timeout(source_name, scraper_func, query="Python", ti
         return len(jobs)
         
     except asyncio.TimeoutError:
-        print(f"   ⏰ {source_name}: Timeout after {timeout}s")
+        print(f"   ⏰ {source_name}: Timeout after {SOURCE_ATTEMPTS} attempts of {timeout}s")
         return 0
     except Exception as e:
         print(f"   ❌ {source_name}: Error - {str(e)[:50]}...")
         return 0
 
-async def test_all_sources():
-    """Test all job sources with timeout protection"""
-    print("🧪 Testing All Job Sources (with timeout protection)")
-    print("=" * 60)
-    
-    scraper = JobScraperService()
-    scraper.use_mock = False
-    
-    # All sources to test
-    sources = [
+def source_scrapers(scraper):
+    """Return (name, scrape function) for every source under test"""
+    return [
         ("JustRemote", scraper._scrape_justremote_jobs),
         ("Remote.co", scraper._scrape_remoteco_jobs),
         ("NoWhiteboard", scraper._scrape_nowhiteboard_jobs),
@@ -49,19 +79,25 @@ async def test_all_sources():
         ("Freelancer", scraper._scrape_freelancer_jobs),
         ("GitHub Enhanced", scraper._scrape_github_jobs),
     ]
+
+async def test_all_sources(scraper):
+    """Test all job sources with timeout protection"""
+    print("🧪 Testing All Job Sources (with timeout protection)")
+    print("=" * 60)
     
-    total_jobs = 0
-    working_sources = 0
+    # All sources to test
+    sources = source_scrapers(scraper)
     
-    for source_name, scraper_func in sources:
-        print(f"\n🔍 Testing {source_name}...")
-        job_count = await test_source_with_timeout(source_name, scraper_func)
-        
-        if job_count > 0:
-            working_sources += 1
-            total_jobs += job_count
+    # Sources are independent hosts, so probe them all at once; each probe
+    # prints its own lines in one go once its result is in
+    print(f"\n🔍 Testing {len(sources)} sources concurrently...")
+    semaphore = asyncio.BoundedSemaphore(SOURCE_CONCURRENCY)
+    job_counts = await asyncio.gather(
+        *(test_source_with_timeout(source_name, scraper_func, semaphore) for source_name, scraper_func in sources)
+    )
     
-    await scraper.close()
+    working_sources = sum(1 for job_count in job_counts if job_count > 0)
+    total_jobs = sum(job_counts)
     
     # Summary
     print(f"\n📊 Summary")
@@ -72,27 +108,59 @@ async def test_all_sources():
     
     return working_sources, total_jobs
 
-async def test_combined_search():
+async def combined_search(scraper, query, limit):
+    """
+    Query every source at once and combine what arrives in time
+    
+    Each source gets COMBINED_SOURCE_TIMEOUT seconds; a slow or hung source
+    is cancelled and the faster sources' jobs are returned in source order.
+    """
+    sources = source_scrapers(scraper)
+    jobs_per_source = max(1, limit // len(sources))
+    tasks = [
+        asyncio.ensure_future(scrape(query, "Remote", jobs_per_source))
+        for _, scrape in sources
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=COMBINED_SOURCE_TIMEOUT)
+    finally:
+        # Also reached when the caller's outer timeout cancels this search
+        for task in tasks:
+            task.cancel()
+    
+    jobs = []
+    for (source_name, _), task in zip(sources, tasks):
+        if task not in done:
+            logger.debug(f"{source_name} missed the {COMBINED_SOURCE_TIMEOUT}s combined search budget")
+        elif task.exception() is None:
+            jobs.extend(task.result())
+    return jobs[:limit]
+
+async def test_combined_search(scraper):
     """Test the combined search functionality"""
     print(f"\n🌐 Testing Combined Search")
     print("=" * 40)
     
-    scraper = JobScraperService()
-    scraper.use_mock = False
-    
     test_queries = ["Python", "JavaScript", "React"]
     
-    for query in test_queries:
+    # Run every query at once; each source has its own sub-timeout and the
+    # outer 30s stays as the hard ceiling. Report in order
+    jobs_lists = await asyncio.gather(
+        *(asyncio.wait_for(combined_search(scraper, query, limit=6), timeout=30)
+          for query in test_queries),
+        return_exceptions=True
+    )
+    
+    for query, jobs in zip(test_queries, jobs_lists):
         print(f"\n🔍 Query: '{query}'")
         try:
-            # Test with timeout
-            jobs = await asyncio.wait_for(
-                scraper.search_jobs(query, "Remote", limit=6),
-                timeout=30
-            )
+            if isinstance(jobs, Exception):
+                raise jobs
             
-            companies = set(job['company'] for job in jobs)
-            job_types = set(job['job_type'] for job in jobs)
+            companies, job_types = set(), set()
+            for job in jobs:
+                companies.add(job['company'])
+                job_types.add(job['job_type'])
             
             print(f"   📊 Found {len(jobs)} jobs from {len(companies)} companies")
             print(f"   💼 Job types: {', '.join(job_types)}")
@@ -105,19 +173,26 @@ async def test_combined_search():
             print(f"   ⏰ Timeout after 30s")
         except Exception as e:
             print(f"   ❌ Error: {str(e)}")
-    
-    await scraper.close()
 
 async def main():
     """Run all tests"""
     print("🚀 Job Sources Test (Quick Version)")
     print("=" * 50)
     
-    # Test individual sources
-    working, total = await test_all_sources()
+    # One scraper for both phases so its connections and cache stay warm
+    scraper = JobScraperService()
+    scraper.use_mock = False
+    scraper.cache_ttl = SOURCE_CACHE_TTL
     
-    # Test combined search
-    await test_combined_search()
+    try:
+        # Test individual sources and combined search at the same time; the
+        # source semaphore and the scraper's connector still bound the fan-out
+        (working, total), _ = await asyncio.gather(
+            test_all_sources(scraper),
+            test_combined_search(scraper)
+        )
+    finally:
+        await scraper.close()
     
     print(f"\n🎉 Test Complete!")
     
@@ -131,4 +206,4 @@ async def main():
     print(f"💡 Your job matcher now has much better job diversity!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
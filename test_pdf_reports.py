@@ -3,29 +3,121 @@
 Test the PDF report generation system
 """
 
-import requests
+import argparse
+import asyncio
+import hashlib
+import httpx
+import io
 import json
+import orjson
+import os
+import random
 import sys
 import time
+from pathlib import Path
+from jose import JWTError, jwt
+from _asyncio_helpers import run
+from _http_helpers import health
 
 API_BASE_URL = "http://localhost:8000"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
-def test_health_check():
-    """Test if the API is running"""
+# Sample resume submitted for matching, encoded once
+RESUME_BYTES = b"""
+John Doe
+Senior Software Engineer
+
+SKILLS:
+- Python (5 years)
+- FastAPI and Django
+- Machine Learning and Data Science
+- AWS and Docker
+- PostgreSQL and Redis
+- React and JavaScript
+- Git and CI/CD
+
+EXPERIENCE:
+Senior Software Engineer at TechCorp (2020-2023)
+- Built scalable web applications using Python and FastAPI
+- Implemented machine learning models for recommendation systems
+- Led a team of 5 developers
+- Deployed applications on AWS using Docker and Kubernetes
+
+Software Engineer at StartupXYZ (2018-2020)
+- Developed REST APIs and microservices
+- Worked with React frontend and Python backend
+- Implemented automated testing and CI/CD pipelines
+
+EDUCATION:
+Bachelor of Science in Computer Science
+University of Technology (2014-2018)
+
+CERTIFICATIONS:
+- AWS Certified Solutions Architect
+- Google Cloud Professional Data Engineer
+"""
+
+# Pro test user's token, reused across runs while it stays valid
+TOKEN_CACHE_FILE = Path.home() / ".cache" / "resume_job_matcher" / "test_token.json"
+TOKEN_MIN_REMAINING = 60  # seconds
+
+def load_cached_token():
+    """Return the cached access token if it has at least a minute left, else None"""
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/health")
-        if response.status_code == 200:
-            print("✅ API is running and healthy")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Cannot connect to API: {e}")
-        return False
+        with open(TOKEN_CACHE_FILE) as f:
+            token = json.load(f)["token"]
+        expires_at = jwt.get_unverified_claims(token)["exp"]
+    except (OSError, ValueError, KeyError, TypeError, JWTError):
+        return None
+    
+    return token if expires_at - time.time() > TOKEN_MIN_REMAINING else None
+
+def _write_private_json(path, data):
+    """Write JSON to a file readable only by the current user"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+
+def save_cached_token(token):
+    """Store the access token for later runs"""
+    _write_private_json(TOKEN_CACHE_FILE, {"token": token, "cached_at": time.time()})
+
+# Bodies of effectively static endpoints (report formats and templates)
+RESPONSE_CACHE_DIR = TOKEN_CACHE_FILE.parent / "responses"
+RESPONSE_CACHE_TTL = 300  # seconds
 
-def register_and_login():
-    """Register a test user and login"""
+async def get_json_cached(client, path, use_cache=True):
+    """
+    GET a JSON endpoint, reusing a body cached on disk for RESPONSE_CACHE_TTL
+    
+    Entries are keyed by the path and a hash of the client's bearer token, and
+    only 200 responses are stored. Returns (status code, body or None).
+    """
+    authorization = client.headers.get("Authorization", "")
+    key = hashlib.sha256(f"{authorization}|{path}".encode()).hexdigest()[:32]
+    cache_file = RESPONSE_CACHE_DIR / f"{key}.json"
+    
+    if use_cache:
+        try:
+            with open(cache_file) as f:
+                entry = json.load(f)
+            if entry["expires_at"] > time.time():
+                return 200, entry["body"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    response = await client.get(path)
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    body = orjson.loads(response.content)
+    if use_cache:
+        _write_private_json(cache_file, {"expires_at": time.time() + RESPONSE_CACHE_TTL, "body": body})
+    return 200, body
+
+async def register_and_login(client):
+    """Register a test user and login; the client then sends the token"""
     print("🔍 Setting up test user...")
     
     # Register user
@@ -37,7 +129,7 @@ def register_and_login():
     }
     
     try:
-        response = requests.post(f"{API_BASE_URL}/api/v1/auth/register", json=user_data)
+        response = await client.post("/api/v1/auth/register", json=user_data)
         if response.status_code == 201:
             print("   ✅ User registered successfully")
         else:
@@ -52,14 +144,11 @@ def register_and_login():
     }
     
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/auth/jwt/login",
-            data=login_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
+        response = await client.post("/api/v1/auth/jwt/login", data=login_data)
         
         if response.status_code == 200:
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
+            client.headers["Authorization"] = f"Bearer {token_data['access_token']}"
             print("   ✅ Login successful")
             return token_data['access_token']
         else:
@@ -70,24 +159,15 @@ def register_and_login():
         print(f"   ❌ Login error: {e}")
         return None
 
-def upgrade_to_pro(token):
+async def upgrade_to_pro(client):
     """Upgrade user to Pro subscription for PDF access"""
     print("🔍 Upgrading to Pro subscription...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/subscription/upgrade",
-            json="pro",
-            headers=headers
-        )
+        response = await client.post("/api/v1/subscription/upgrade", json="pro")
         
         if response.status_code == 200:
-            subscription = response.json()
+            subscription = orjson.loads(response.content)
             print(f"   ✅ Upgraded to {subscription['tier']}")
             return True
         else:
@@ -98,62 +178,20 @@ def upgrade_to_pro(token):
         print(f"   ❌ Upgrade error: {e}")
         return False
 
-def submit_job_matching_task(token):
+async def submit_job_matching_task(client):
     """Submit a job matching task to get results for report generation"""
     print("🔍 Submitting job matching task...")
     
-    # Create a test resume
-    test_resume = """
-John Doe
-Senior Software Engineer
-
-SKILLS:
-- Python (5 years)
-- FastAPI and Django
-- Machine Learning and Data Science
-- AWS and Docker
-- PostgreSQL and Redis
-- React and JavaScript
-- Git and CI/CD
-
-EXPERIENCE:
-Senior Software Engineer at TechCorp (2020-2023)
-- Built scalable web applications using Python and FastAPI
-- Implemented machine learning models for recommendation systems
-- Led a team of 5 developers
-- Deployed applications on AWS using Docker and Kubernetes
-
-Software Engineer at StartupXYZ (2018-2020)
-- Developed REST APIs and microservices
-- Worked with React frontend and Python backend
-- Implemented automated testing and CI/CD pipelines
-
-EDUCATION:
-Bachelor of Science in Computer Science
-University of Technology (2014-2018)
-
-CERTIFICATIONS:
-- AWS Certified Solutions Architect
-- Google Cloud Professional Data Engineer
-"""
-    
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
-    
     try:
+        # A file object is read and sent in chunks rather than copied into the body
         files = {
-            'file': ('senior_engineer_resume.txt', test_resume, 'text/plain')
+            'file': ('senior_engineer_resume.txt', io.BytesIO(RESUME_BYTES), 'text/plain')
         }
         
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/jobs/match",
-            files=files,
-            headers=headers
-        )
+        response = await client.post("/api/v1/jobs/match", files=files)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             task_id = result['task_id']
             print(f"   ✅ Job matching task submitted: {task_id}")
             return task_id
@@ -166,26 +204,23 @@ CERTIFICATIONS:
         print(f"   ❌ Job matching error: {e}")
         return None
 
-def wait_for_task_completion(task_id, token, max_wait=60):
+def poll_delay(attempt, base=0.2, cap=5.0):
+    """Exponential backoff with a little jitter: 0.2s, 0.4s, 0.8s ... up to cap"""
+    return min(cap, base * 2 ** attempt) + random.uniform(0, 0.1)
+
+async def wait_for_task_completion(client, task_id, max_wait=60):
     """Wait for task to complete"""
     print(f"🔍 Waiting for task {task_id} to complete...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
-    start_time = time.time()
+    deadline = time.monotonic() + max_wait
+    attempt = 0
     
-    while time.time() - start_time < max_wait:
+    while time.monotonic() < deadline:
         try:
-            response = requests.get(
-                f"{API_BASE_URL}/api/v1/tasks/{task_id}/status",
-                headers=headers
-            )
+            response = await client.get(f"/api/v1/tasks/{task_id}/status")
             
             if response.status_code == 200:
-                task_status = response.json()
+                task_status = orjson.loads(response.content)
                 status = task_status.get('status')
                 
                 print(f"   📊 Task status: {status}")
@@ -196,88 +231,63 @@ def wait_for_task_completion(task_id, token, max_wait=60):
                 elif status in ["FAILURE", "REVOKED"]:
                     print(f"   ❌ Task failed with status: {status}")
                     return False
-                
-                # Wait before checking again
-                time.sleep(5)
             else:
                 print(f"   ⚠️ Status check failed: {response.status_code}")
-                time.sleep(5)
                 
         except Exception as e:
             print(f"   ⚠️ Status check error: {e}")
-            time.sleep(5)
+        
+        # Wait before checking again, without sleeping past the deadline
+        await asyncio.sleep(min(poll_delay(attempt), max(0.0, deadline - time.monotonic())))
+        attempt += 1
     
     print("   ⏰ Task did not complete within timeout")
     return False
 
-def test_report_formats(token):
+async def test_report_formats(client, use_cache=True):
     """Test getting available report formats"""
-    print("🔍 Testing available report formats...")
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/api/v1/reports/formats",
-            headers=headers
-        )
+        status_code, formats = await get_json_cached(client, "/api/v1/reports/formats", use_cache)
         
-        if response.status_code == 200:
-            formats = response.json()
+        # Printed once the response is in, so concurrent checks don't interleave
+        print("🔍 Testing available report formats...")
+        if status_code == 200:
             print("   ✅ Available formats retrieved")
             print(f"   📋 Formats: {formats['available_formats']}")
             print(f"   🎨 Themes: {formats['available_themes']}")
             print(f"   📄 PDF Available: {formats['pdf_available']}")
             return formats
         else:
-            print(f"   ❌ Failed to get formats: {response.status_code}")
+            print(f"   ❌ Failed to get formats: {status_code}")
             return None
             
     except Exception as e:
+        print("🔍 Testing available report formats...")
         print(f"   ❌ Error getting formats: {e}")
         return None
 
-def test_report_templates(token):
+async def test_report_templates(client, use_cache=True):
     """Test getting report templates"""
-    print("🔍 Testing report templates...")
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/api/v1/reports/templates",
-            headers=headers
-        )
+        status_code, templates = await get_json_cached(client, "/api/v1/reports/templates", use_cache)
         
-        if response.status_code == 200:
-            templates = response.json()
+        print("🔍 Testing report templates...")
+        if status_code == 200:
             print("   ✅ Templates retrieved")
             for template_id, template_info in templates['templates'].items():
                 print(f"   🎨 {template_info['name']}: {template_info['description']}")
             return templates
         else:
-            print(f"   ❌ Failed to get templates: {response.status_code}")
+            print(f"   ❌ Failed to get templates: {status_code}")
             return None
             
     except Exception as e:
+        print("🔍 Testing report templates...")
         print(f"   ❌ Error getting templates: {e}")
         return None
 
-def generate_pdf_report(task_id, token):
+async def generate_pdf_report(client, task_id):
     """Generate a PDF report"""
-    print("🔍 Generating PDF report...")
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     report_request = {
         "task_id": task_id,
         "format": "pdf",
@@ -294,14 +304,11 @@ def generate_pdf_report(task_id, token):
     }
     
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/reports/generate",
-            json=report_request,
-            headers=headers
-        )
+        response = await client.post("/api/v1/reports/generate", json=report_request)
         
+        print("🔍 Generating PDF report...")
         if response.status_code == 200:
-            report_response = response.json()
+            report_response = orjson.loads(response.content)
             print("   ✅ PDF report generated successfully")
             print(f"   📄 Report ID: {report_response['report_id']}")
             print(f"   📊 File size: {report_response['file_size_bytes']} bytes")
@@ -314,18 +321,12 @@ def generate_pdf_report(task_id, token):
             return None
             
     except Exception as e:
+        print("🔍 Generating PDF report...")
         print(f"   ❌ PDF generation error: {e}")
         return None
 
-def generate_html_report(task_id, token):
+async def generate_html_report(client, task_id):
     """Generate an HTML report"""
-    print("🔍 Generating HTML report...")
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     report_request = {
         "task_id": task_id,
         "format": "html",
@@ -340,14 +341,11 @@ def generate_html_report(task_id, token):
     }
     
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/reports/generate",
-            json=report_request,
-            headers=headers
-        )
+        response = await client.post("/api/v1/reports/generate", json=report_request)
         
+        print("🔍 Generating HTML report...")
         if response.status_code == 200:
-            report_response = response.json()
+            report_response = orjson.loads(response.content)
             print("   ✅ HTML report generated successfully")
             print(f"   📄 Report ID: {report_response['report_id']}")
             print(f"   📊 File size: {report_response['file_size_bytes']} bytes")
@@ -358,115 +356,127 @@ def generate_html_report(task_id, token):
             return None
             
     except Exception as e:
+        print("🔍 Generating HTML report...")
         print(f"   ❌ HTML generation error: {e}")
         return None
 
-def download_report(report_id, token, filename):
+async def download_report(client, report_id, filename):
     """Download a generated report"""
-    print(f"🔍 Downloading report {report_id}...")
-    
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
-    
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/api/v1/reports/{report_id}/download",
-            headers=headers
-        )
+        # Stream the body to disk so only one chunk is held in memory
+        size = 0
+        async with client.stream("GET", f"/api/v1/reports/{report_id}/download") as response:
+            if response.status_code == 200:
+                with open(filename, 'wb') as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
         
+        print(f"🔍 Downloading report {report_id}...")
         if response.status_code == 200:
-            with open(filename, 'wb') as f:
-                f.write(response.content)
             print(f"   ✅ Report downloaded as {filename}")
-            print(f"   📊 File size: {len(response.content)} bytes")
+            print(f"   📊 File size: {size} bytes")
             return True
         else:
             print(f"   ❌ Download failed: {response.status_code}")
             return False
             
     except Exception as e:
+        print(f"🔍 Downloading report {report_id}...")
         print(f"   ❌ Download error: {e}")
         return False
 
-def main():
+async def main(use_cache=True):
     """Run all PDF report tests"""
     print("🧪 PDF Report Generation Test Suite")
     print("=" * 50)
     
     # Check if API is running
-    if not test_health_check():
+    if not health():
         print("\nPlease make sure the API server is running:")
         print("python main.py")
         sys.exit(1)
     
     print()
     
-    # Setup user and login
-    token = register_and_login()
-    if not token:
-        print("❌ Failed to setup user, stopping tests")
-        return
-    
-    print()
-    
-    # Upgrade to Pro for PDF access
-    if not upgrade_to_pro(token):
-        print("❌ Failed to upgrade to Pro, stopping tests")
-        return
-    
-    print()
-    
-    # Test report formats
-    formats = test_report_formats(token)
-    if not formats:
-        print("❌ Failed to get report formats")
-        return
-    
-    print()
-    
-    # Test report templates
-    templates = test_report_templates(token)
-    if not templates:
-        print("❌ Failed to get report templates")
-        return
-    
-    print()
-    
-    # Submit job matching task
-    task_id = submit_job_matching_task(token)
-    if not task_id:
-        print("❌ Failed to submit job matching task")
-        return
-    
-    print()
-    
-    # Wait for task completion
-    if not wait_for_task_completion(task_id, token):
-        print("❌ Task did not complete successfully")
-        return
-    
-    print()
-    
-    # Generate PDF report
-    pdf_report = generate_pdf_report(task_id, token)
-    if not pdf_report:
-        print("❌ Failed to generate PDF report")
-        return
-    
-    print()
-    
-    # Generate HTML report
-    html_report = generate_html_report(task_id, token)
-    if not html_report:
-        print("❌ Failed to generate HTML report")
-        return
-    
-    print()
-    
-    # Download reports
-    pdf_downloaded = download_report(pdf_report['report_id'], token, "test_report.pdf")
-    html_downloaded = download_report(html_report['report_id'], token, "test_report.html")
+    # Pooled keep-alive connections; failed connects are retried by the transport
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        retries=3
+    )
+    async with httpx.AsyncClient(base_url=API_BASE_URL, transport=transport, timeout=30.0) as client:
+        token = load_cached_token() if use_cache else None
+        if token:
+            # A cached token belongs to a user that was already set up as Pro
+            client.headers["Authorization"] = f"Bearer {token}"
+            print("🔍 Reusing cached test user token")
+        else:
+            # Setup user and login
+            token = await register_and_login(client)
+            if not token:
+                print("❌ Failed to setup user, stopping tests")
+                return
+            
+            print()
+            
+            # Upgrade to Pro for PDF access
+            if not await upgrade_to_pro(client):
+                print("❌ Failed to upgrade to Pro, stopping tests")
+                return
+            
+            if use_cache:
+                save_cached_token(token)
+        
+        print()
+        
+        # Test report formats and templates together
+        formats, templates = await asyncio.gather(
+            test_report_formats(client, use_cache),
+            test_report_templates(client, use_cache)
+        )
+        if not formats:
+            print("❌ Failed to get report formats")
+            return
+        if not templates:
+            print("❌ Failed to get report templates")
+            return
+        
+        print()
+        
+        # Submit job matching task
+        task_id = await submit_job_matching_task(client)
+        if not task_id:
+            print("❌ Failed to submit job matching task")
+            return
+        
+        print()
+        
+        # Wait for task completion
+        if not await wait_for_task_completion(client, task_id):
+            print("❌ Task did not complete successfully")
+            return
+        
+        print()
+        
+        # Generate PDF and HTML reports together
+        pdf_report, html_report = await asyncio.gather(
+            generate_pdf_report(client, task_id),
+            generate_html_report(client, task_id)
+        )
+        if not pdf_report:
+            print("❌ Failed to generate PDF report")
+            return
+        if not html_report:
+            print("❌ Failed to generate HTML report")
+            return
+        
+        print()
+        
+        # Download reports
+        pdf_downloaded, html_downloaded = await asyncio.gather(
+            download_report(client, pdf_report['report_id'], "test_report.pdf"),
+            download_report(client, html_report['report_id'], "test_report.html")
+        )
     
     print()
     print("=" * 50)
@@ -496,4 +506,10 @@ def main():
         print("❌ Some tests failed. Check the output above.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Test the PDF report generation system")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always set up the test user and refetch report formats and "
+                             "templates instead of reusing cached copies")
+    args = parser.parse_args()
+    
+    run(main(use_cache=not args.no_cache))
\ No newline at end of file
@@ -3,36 +3,72 @@
 Test the salary filtering functionality
 """
 
-import requests
-import json
+import logging
+import os
 import sys
 import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from _http_helpers import SESSION, api_url, health, login
 
-API_BASE_URL = "http://localhost:8000"
+# Per-poll progress goes through logging so LOG_LEVEL=WARNING can silence it
+logger = logging.getLogger(__name__)
 
-def test_health_check():
-    """Test if the API is running"""
-    try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/health")
-        if response.status_code == 200:
-            print("✅ API is running and healthy")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Cannot connect to API: {e}")
-        return False
+# Seconds the status endpoint may hold each poll open waiting for the task
+STATUS_LONG_POLL = 5
+
+# Statuses after which a task won't change any more
+FINAL_STATUSES = {"SUCCESS", "FAILURE", "REVOKED"}
+
+# Last profile read or written per Authorization header, so repeated
+# updates in one run skip the read-before-write
+_PROFILE_CACHE = {}
+
+# Salary strings and the (min, max) annual range each should parse to
+SALARY_CASES = (
+    ("$80,000 - $120,000", (80000, 120000)),
+    ("$50-75k", (50000, 75000)),
+    ("Up to $100,000", (None, 100000)),
+    ("From $90,000", (90000, None)),
+    ("$50/hour", (104000, 104000)),  # 50 * 2080 = 104000
+    ("$30-50 per hour", (62400, 104000)),  # 30-50 * 2080
+    ("Competitive salary", (None, None)),
+    ("$100k+", (100000, None)),
+    ("$120k-$150k + 10% bonus", (120000, 150000)),
+    ("401k match $90,000", (90000, 90000)),
+    ("$50,000 - $70,000 + 401k", (50000, 70000)),
+)
+
+# Sample resume uploaded by the job matching checks, encoded once
+RESUME_BYTES = b"""
+John Doe
+Senior Software Engineer
+
+Skills:
+- Python
+- FastAPI
+- Machine Learning
+- AWS
+- Docker
+- React
+- PostgreSQL
+
+Experience:
+- 5 years as Software Engineer
+- Built scalable web applications
+- Implemented machine learning models
+- Led a team of 3 developers
+"""
 
 def test_salary_ranges_endpoint():
     """Test the salary ranges endpoint"""
     print("🔍 Testing salary ranges endpoint...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/jobs/salary-ranges")
+        response = SESSION.get(api_url("/api/v1/jobs/salary-ranges"))
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("   ✅ Salary ranges retrieved successfully")
             print("   📊 Salary ranges by level:")
             for level, info in data["salary_ranges_by_level"].items():
@@ -56,28 +92,24 @@ def test_salary_parsing():
     """Test the salary parsing functionality"""
     print("🔍 Testing salary parsing...")
     
-    from app.utils.salary_parser import parse_salary_range
-    
-    test_cases = [
-        ("$80,000 - $120,000", (80000, 120000)),
-        ("$50-75k", (50000, 75000)),
-        ("Up to $100,000", (None, 100000)),
-        ("From $90,000", (90000, None)),
-        ("$50/hour", (104000, 104000)),  # 50 * 2080 = 104000
-        ("$30-50 per hour", (62400, 104000)),  # 30-50 * 2080
-        ("Competitive salary", (None, None)),
-        ("$100k+", (100000, None)),
-    ]
-    
-    for salary_string, expected in test_cases:
-        min_salary, max_salary = parse_salary_range(salary_string)
-        result = "✅" if (min_salary, max_salary) == expected else "❌"
-        print(f"   {result} {salary_string} -> min: {min_salary}, max: {max_salary}")
-    
-    return True
+    from app.utils.salary_parser import parse_salary_range_batch
+    
+    # Parse every case in one batch call
+    parsed = parse_salary_range_batch([salary_string for salary_string, _ in SALARY_CASES])
+    
+    mismatches = []
+    for (salary_string, expected), got in zip(SALARY_CASES, parsed):
+        if got != expected:
+            mismatches.append(f"   ❌ {salary_string} -> min: {got[0]}, max: {got[1]} (expected {expected})")
+    
+    if mismatches:
+        sys.stdout.write("\n".join(mismatches) + "\n")
+    print(f"   {'❌' if mismatches else '✅'} {len(SALARY_CASES) - len(mismatches)}/{len(SALARY_CASES)} salary strings parsed as expected")
+    
+    return not mismatches
 
 def register_and_login():
-    """Register a test user and login"""
+    """Register a test user and login; the shared session then sends the token"""
     print("🔍 Setting up test user...")
     
     # Register user
@@ -89,7 +121,11 @@ def register_and_login():
     }
     
     try:
-        response = requests.post(f"{API_BASE_URL}/api/v1/auth/register", json=user_data)
+        response = SESSION.post(
+            api_url("/api/v1/auth/register"),
+            data=orjson.dumps(user_data),
+            headers={"Content-Type": "application/json"}
+        )
         if response.status_code == 201:
             print("   ✅ User registered successfully")
         else:
@@ -98,20 +134,11 @@ def register_and_login():
         print(f"   ⚠️ Registration error: {e}")
     
     # Login
-    login_data = {
-        "username": "salary_test@example.com",
-        "password": "testpassword123"
-    }
-    
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/auth/jwt/login",
-            data=login_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
+        response = login("salary_test@example.com", "testpassword123")
         
         if response.status_code == 200:
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             print("   ✅ Login successful")
             return token_data['access_token']
         else:
@@ -122,55 +149,51 @@ def register_and_login():
         print(f"   ❌ Login error: {e}")
         return None
 
-def update_user_profile(token, min_salary=None, max_salary=None):
-    """Update user profile with salary preferences"""
+def get_user_profile():
+    """Return the current user's profile, reading it only once per login"""
+    authorization = SESSION.headers.get("Authorization")
+    profile = _PROFILE_CACHE.get(authorization)
+    if profile is None:
+        response = SESSION.get(api_url("/api/v1/auth/me/profile"))
+        if response.status_code != 200:
+            print(f"   ❌ Failed to get profile: {response.status_code}")
+            return None
+        profile = _PROFILE_CACHE[authorization] = orjson.loads(response.content)
+    return profile
+
+def update_user_profile(min_salary=None, max_salary=None):
+    """
+    Update user profile with salary preferences
+    
+    The profile endpoint keeps list and number fields the request leaves
+    out, but always writes remote_only, so that one is carried over from the
+    cached profile.
+    """
     print("🔍 Updating user profile with salary preferences...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
-    # First, get current profile
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/api/v1/auth/me/profile",
-            headers=headers
-        )
-        
-        if response.status_code != 200:
-            print(f"   ❌ Failed to get profile: {response.status_code}")
+        profile = get_user_profile()
+        if profile is None:
             return False
-            
-        profile = response.json()
-        
     except Exception as e:
         print(f"   ❌ Error getting profile: {e}")
         return False
     
-    # Update profile with salary preferences
     profile_data = {
-        "preferred_job_titles": profile.get("preferred_job_titles", ["Software Engineer"]),
-        "preferred_locations": profile.get("preferred_locations", ["Remote"]),
         "salary_min": min_salary,
         "salary_max": max_salary,
-        "remote_only": profile.get("remote_only", True),
-        "skills": profile.get("skills", ["Python", "FastAPI"]),
-        "experience_years": profile.get("experience_years", 3),
-        "education_level": profile.get("education_level", "Bachelor's"),
-        "job_types": profile.get("job_types", ["Full-time"]),
-        "industries": profile.get("industries", ["Technology"])
+        "remote_only": profile.get("remote_only", True)
     }
     
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/auth/me/profile",
-            json=profile_data,
-            headers=headers
+        response = SESSION.post(
+            api_url("/api/v1/auth/me/profile"),
+            data=orjson.dumps(profile_data),
+            headers={"Content-Type": "application/json"}
         )
         
         if response.status_code == 200:
-            updated_profile = response.json()
+            _PROFILE_CACHE[SESSION.headers.get("Authorization")] = orjson.loads(response.content)
             print(f"   ✅ Profile updated with salary range: ${min_salary} - ${max_salary}")
             return True
         else:
@@ -182,60 +205,28 @@ def update_user_profile(token, min_salary=None, max_salary=None):
         print(f"   ❌ Error updating profile: {e}")
         return False
 
-def test_job_matching_with_salary_filter(token, min_salary=None, max_salary=None, use_profile=False):
+def test_job_matching_with_salary_filter(min_salary=None, max_salary=None, use_profile=False):
     """Test job matching with salary filtering"""
     print(f"🔍 Testing job matching with salary filter: min=${min_salary}, max=${max_salary}, use_profile={use_profile}")
     
-    # Create a test resume file
-    test_resume = """
-John Doe
-Senior Software Engineer
-
-Skills:
-- Python
-- FastAPI
-- Machine Learning
-- AWS
-- Docker
-- React
-- PostgreSQL
-
-Experience:
-- 5 years as Software Engineer
-- Built scalable web applications
-- Implemented machine learning models
-- Led a team of 3 developers
-"""
-    
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
-    
     try:
         files = {
-            'file': ('senior_engineer_resume.txt', test_resume, 'text/plain')
+            'file': ('senior_engineer_resume.txt', RESUME_BYTES, 'text/plain')
         }
         
-        # Build URL with query parameters
-        url = f"{API_BASE_URL}/api/v1/jobs/match"
-        params = {}
-        
-        if min_salary is not None:
-            params["min_salary"] = str(min_salary)
-        if max_salary is not None:
-            params["max_salary"] = str(max_salary)
-        if use_profile:
-            params["use_profile_salary"] = "true"
+        # Build query parameters, leaving out filters that aren't set
+        params = {
+            name: value for name, value in (
+                ("min_salary", min_salary),
+                ("max_salary", max_salary),
+                ("use_profile_salary", "true" if use_profile else None),
+            ) if value is not None
+        }
         
-        response = requests.post(
-            url,
-            params=params,
-            files=files,
-            headers=headers
-        )
+        response = SESSION.post(api_url("/api/v1/jobs/match"), params=params, files=files)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"   ✅ Job matching started with task ID: {result['task_id']}")
             return result['task_id']
         else:
@@ -247,65 +238,113 @@ Experience:
         print(f"   ❌ Error: {e}")
         return None
 
-def check_task_results(token, task_id, max_wait=60):
-    """Check task results and verify salary filtering"""
-    print(f"🔍 Checking results for task {task_id}...")
+def stream_task_status(task_id, label, deadline):
+    """
+    Follow the task's Server-Sent Events until it reaches a final status
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    Returns the final status payload, or None when the stream is not
+    available (e.g. an older API answering 404) or ends early.
+    """
+    try:
+        with SESSION.get(
+            api_url(f"/api/v1/tasks/{task_id}/events"),
+            params={"timeout": max(1.0, deadline - time.monotonic())},
+            stream=True,
+            timeout=(5, 30)  # the server sends a keep-alive at least every 15s
+        ) as response:
+            if response.status_code != 200:
+                return None
+            
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                task_status = orjson.loads(line[len("data:"):])
+                logger.info(f"   📊 [{label}] Task status: {task_status.get('status')}")
+                if task_status.get('status') in FINAL_STATUSES:
+                    return task_status
+    except Exception as e:
+        print(f"   ⚠️ [{label}] Status stream error: {e}")
     
-    start_time = time.time()
+    return None
+
+def poll_task_status(task_id, label, deadline):
+    """
+    Poll the task's status until it reaches a final status or the deadline
+    
+    Each poll asks the server to hold the request until the task finishes;
+    between polls the delay grows from 0.25s up to 5s.
+    """
+    delay = 0.25
     
-    while time.time() - start_time < max_wait:
+    while time.monotonic() < deadline:
         try:
-            response = requests.get(
-                f"{API_BASE_URL}/api/v1/tasks/{task_id}/status",
-                headers=headers
+            response = SESSION.get(
+                api_url(f"/api/v1/tasks/{task_id}/status"),
+                params={"wait": STATUS_LONG_POLL},
+                timeout=STATUS_LONG_POLL + 5
             )
             
             if response.status_code == 200:
-                task_status = response.json()
-                status = task_status.get('status')
-                
-                print(f"   📊 Task status: {status}")
-                
-                if status == "SUCCESS":
-                    # Check the results
-                    matched_jobs = task_status.get('result', [])
-                    print(f"   ✅ Task completed with {len(matched_jobs)} matched jobs")
-                    
-                    # Print salary info for matched jobs
-                    for i, job in enumerate(matched_jobs[:5], 1):  # Show first 5 jobs
-                        salary = job.get('salary_range', 'Not specified')
-                        print(f"   {i}. {job['title']} at {job['company']} - {salary}")
-                    
-                    return matched_jobs
-                elif status in ["FAILURE", "REVOKED"]:
-                    print(f"   ❌ Task failed with status: {status}")
-                    return None
-                
-                # Wait before checking again
-                time.sleep(5)
+                task_status = orjson.loads(response.content)
+                logger.info(f"   📊 [{label}] Task status: {task_status.get('status')}")
+                if task_status.get('status') in FINAL_STATUSES:
+                    return task_status
             else:
-                print(f"   ⚠️ Status check failed: {response.status_code}")
-                time.sleep(5)
+                print(f"   ⚠️ [{label}] Status check failed: {response.status_code}")
                 
         except Exception as e:
-            print(f"   ⚠️ Status check error: {e}")
-            time.sleep(5)
+            print(f"   ⚠️ [{label}] Status check error: {e}")
+        
+        # Wait before checking again
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 2, 5.0)
     
-    print("   ⏰ Task did not complete within timeout")
     return None
 
+def check_task_results(task_id, max_wait=60):
+    """
+    Check task results and verify salary filtering
+    
+    Status updates are streamed when the API offers the events endpoint and
+    polled otherwise. Every line names the task so several can be checked
+    from threads at once.
+    """
+    print(f"🔍 Checking results for task {task_id}...")
+    label = task_id[:8]
+    deadline = time.monotonic() + max_wait
+    
+    task_status = stream_task_status(task_id, label, deadline)
+    if task_status is None and time.monotonic() < deadline:
+        task_status = poll_task_status(task_id, label, deadline)
+    
+    if task_status is None:
+        print(f"   ⏰ [{label}] Task did not complete within timeout")
+        return None
+    
+    status = task_status.get('status')
+    if status != "SUCCESS":
+        print(f"   ❌ [{label}] Task failed with status: {status}")
+        return None
+    
+    # Check the results
+    matched_jobs = task_status.get('result') or []
+    lines = [f"   ✅ [{label}] Task completed with {len(matched_jobs)} matched jobs"]
+    
+    # Salary info for matched jobs, printed as one block
+    for i, job in enumerate(matched_jobs[:5], 1):  # Show first 5 jobs
+        salary = job.get('salary_range', 'Not specified')
+        lines.append(f"   {i}. {job['title']} at {job['company']} - {salary}")
+    print("\n".join(lines))
+    
+    return matched_jobs
+
 def main():
     """Run all salary filtering tests"""
     print("🧪 Salary Filtering Test Suite")
     print("=" * 50)
     
     # Check if API is running
-    if not test_health_check():
+    if not health():
         print("\nPlease make sure the API server is running:")
         print("python main.py")
         sys.exit(1)
@@ -332,30 +371,32 @@ def main():
     
     print()
     
+    # Submit every matching task up front; they run independently on the
+    # workers, so their results are then checked side by side
+    task_ids = []
+    
     # Test 1: Job matching with explicit salary filter (min only)
-    task_id1 = test_job_matching_with_salary_filter(token, min_salary=100000)
-    if task_id1:
-        print()
-        results1 = check_task_results(token, task_id1)
+    task_ids.append(test_job_matching_with_salary_filter(min_salary=100000))
     
     print()
     
     # Test 2: Job matching with explicit salary filter (min and max)
-    task_id2 = test_job_matching_with_salary_filter(token, min_salary=80000, max_salary=150000)
-    if task_id2:
-        print()
-        results2 = check_task_results(token, task_id2)
+    task_ids.append(test_job_matching_with_salary_filter(min_salary=80000, max_salary=150000))
     
     print()
     
     # Test 3: Update user profile with salary preferences
-    if update_user_profile(token, min_salary=120000, max_salary=200000):
+    if update_user_profile(min_salary=120000, max_salary=200000):
+        print()
+        # Test job matching using profile salary preferences (read at submit time)
+        task_ids.append(test_job_matching_with_salary_filter(use_profile=True))
+    
+    task_ids = [task_id for task_id in task_ids if task_id]
+    if task_ids:
         print()
-        # Test job matching using profile salary preferences
-        task_id3 = test_job_matching_with_salary_filter(token, use_profile=True)
-        if task_id3:
-            print()
-            results3 = check_task_results(token, task_id3)
+        # The shared session's pool covers one connection per polling thread
+        with ThreadPoolExecutor(max_workers=len(task_ids)) as executor:
+            results = list(executor.map(check_task_results, task_ids))
     
     print()
     print("=" * 50)
@@ -363,4 +404,5 @@ def main():
     print("=" * 50)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), format="%(message)s")
     main()
\ No newline at end of file
@@ -11,75 +11,102 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
 from app.services.job_scraper import JobScraperService
-from app.core.config import settings
 
-async def test_job_scraper():
-    """Test the job scraper with different configurations"""
-    
-    print("🔍 Testing Enhanced Job Scraper")
-    print("=" * 50)
-    
-    # Test with mock data first
-    print("\n1. Testing with MOCK data (USE_MOCK_JOBS=True)")
-    settings.USE_MOCK_JOBS = True
-    
+async def test_mock_jobs():
+    """Search with mock data; returns the lines to report"""
+    lines = ["\n1. Testing with MOCK data (use_mock=True)"]
     scraper = JobScraperService()
+    scraper.use_mock = True
     
     try:
         jobs = await scraper.search_jobs("python", "Remote", 3)
-        print(f"   Found {len(jobs)} mock jobs")
+        lines.append(f"   Found {len(jobs)} mock jobs")
         
         if jobs:
-            print(f"   Sample job: {jobs[0]['title']} at {jobs[0]['company']}")
+            lines.append(f"   Sample job: {jobs[0]['title']} at {jobs[0]['company']}")
     
     except Exception as e:
-        print(f"   Error: {e}")
+        lines.append(f"   Error: {e}")
     
     finally:
         await scraper.close()
     
-    # Test with real scraping
-    print("\n2. Testing with REAL scraping (USE_MOCK_JOBS=False)")
-    settings.USE_MOCK_JOBS = False
-    
+    return lines
+
+async def test_real_jobs():
+    """Search with real scraping; returns the lines to report"""
+    lines = ["\n2. Testing with REAL scraping (use_mock=False)"]
     scraper = JobScraperService()
+    scraper.use_mock = False
     
     try:
         jobs = await scraper.search_jobs("javascript", "Remote", 2)
-        print(f"   Found {len(jobs)} real/enhanced jobs")
+        lines.append(f"   Found {len(jobs)} real/enhanced jobs")
         
         if jobs:
-            print(f"   Sample job: {jobs[0]['title']} at {jobs[0]['company']}")
-            print(f"   Job URL: {jobs[0]['url']}")
+            lines.append(f"   Sample job: {jobs[0]['title']} at {jobs[0]['company']}")
+            lines.append(f"   Job URL: {jobs[0]['url']}")
     
     except Exception as e:
-        print(f"   Error: {e}")
+        lines.append(f"   Error: {e}")
     
     finally:
         await scraper.close()
     
-    # Test multiple sources
-    print("\n3. Testing multiple sources")
+    return lines
+
+async def test_multiple_sources():
+    """Search several queries across sources; returns the lines to report"""
+    lines = ["\n3. Testing multiple sources"]
     scraper = JobScraperService()
+    scraper.use_mock = False
     
     try:
         queries = ["react", "node.js"]
         jobs = await scraper.scrape_multiple_sources(queries, "Remote")
-        print(f"   Found {len(jobs)} jobs from multiple sources")
+        lines.append(f"   Found {len(jobs)} jobs from multiple sources")
         
-        # Group by source type
-        real_jobs = [j for j in jobs if 'remoteok.io' in j.get('url', '') or 'weworkremotely.com' in j.get('url', '')]
-        enhanced_jobs = [j for j in jobs if j not in real_jobs]
+        # Group by source type in one pass
+        real_jobs, enhanced_jobs = [], []
+        for job in jobs:
+            url = job.get('url', '')
+            if 'remoteok.io' in url or 'weworkremotely.com' in url:
+                real_jobs.append(job)
+            else:
+                enhanced_jobs.append(job)
         
-        print(f"   Real scraped jobs: {len(real_jobs)}")
-        print(f"   Enhanced fallback jobs: {len(enhanced_jobs)}")
+        lines.append(f"   Real scraped jobs: {len(real_jobs)}")
+        lines.append(f"   Enhanced fallback jobs: {len(enhanced_jobs)}")
     
     except Exception as e:
-        print(f"   Error: {e}")
+        lines.append(f"   Error: {e}")
     
     finally:
         await scraper.close()
     
+    return lines
+
+async def test_job_scraper():
+    """Test the job scraper with different configurations"""
+    
+    print("🔍 Testing Enhanced Job Scraper")
+    print("=" * 50)
+    
+    # The three checks are independent: each has its own scraper with its own
+    # mock flag (settings are left alone), so run them at once and report in order
+    reports = await asyncio.gather(
+        test_mock_jobs(),
+        test_real_jobs(),
+        test_multiple_sources(),
+        return_exceptions=True
+    )
+    
+    for report in reports:
+        if isinstance(report, Exception):
+            print(f"\n   Error: {report}")
+        else:
+            print("\n".join(report))
+    
     print("\n✅ Job scraper testing completed!")
 
 if __name__ == "__main__":
@@ -5,15 +5,20 @@ Test both mock and real scraping modes
 
 import asyncio
 import time
+import aiohttp
+from app.core.config import settings
 from app.services.job_scraper import JobScraperService
 
-async def test_mock_scraping():
+# URL prefixes used by generated mock jobs
+MOCK_URL_PREFIXES = ('https://example.com', 'http://example.com')
+
+async def test_mock_scraping(session):
     """Test mock job generation"""
     print("🧪 Testing Mock Job Generation")
     print("=" * 40)
     
     # Force mock mode
-    scraper = JobScraperService()
+    scraper = JobScraperService(session=session)
     scraper.use_mock = True
     
     start_time = time.time()
@@ -32,13 +37,13 @@ async def test_mock_scraping():
     await scraper.close()
     return jobs
 
-async def test_real_scraping():
+async def test_real_scraping(session):
     """Test real web scraping"""
     print("\n🌐 Testing Real Web Scraping")
     print("=" * 40)
     
     # Force real scraping mode
-    scraper = JobScraperService()
+    scraper = JobScraperService(session=session)
     scraper.use_mock = False
     
     start_time = time.time()
@@ -62,27 +67,31 @@ async def main():
     print("🔍 Job Scraping Comparison Tool")
     print("=" * 50)
     
+    # One pooled session shared by both scrapers, so connections opened by
+    # one run are reused by the next instead of being torn down with it
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=8, keepalive_timeout=30, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=settings.JOB_SCRAPING_TIMEOUT)
+    
     try:
-        # Test mock scraping
-        mock_jobs = await test_mock_scraping()
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            # Test mock scraping
+            mock_jobs = await test_mock_scraping(session)
+            
+            # Test real scraping
+            real_jobs = await test_real_scraping(session)
         
-        # Test real scraping
-        real_jobs = await test_real_scraping()
+        # Check if real jobs have real URLs (mock jobs point at example.com)
+        real_urls = sum(1 for job in real_jobs if not job['url'].startswith(MOCK_URL_PREFIXES))
         
         # Summary
-        print(f"\n📊 Summary")
-        print("=" * 20)
-        print(f"Mock jobs: {len(mock_jobs)} (fast, fake data)")
-        print(f"Real jobs: {len(real_jobs)} (slow, real data)")
-        
-        # Check if real jobs have real URLs
-        real_urls = [job for job in real_jobs if not job['url'].startswith('https://example.com')]
-        print(f"Real URLs found: {len(real_urls)}")
-        
-        if real_urls:
-            print("✅ Real scraping is working!")
-        else:
-            print("⚠️  Real scraping may have fallen back to mock data")
+        print("\n".join([
+            f"\n📊 Summary",
+            "=" * 20,
+            f"Mock jobs: {len(mock_jobs)} (fast, fake data)",
+            f"Real jobs: {len(real_jobs)} (slow, real data)",
+            f"Real URLs found: {real_urls}",
+            "✅ Real scraping is working!" if real_urls else "⚠️  Real scraping may have fallen back to mock data",
+        ]))
         
     except Exception as e:
         print(f"❌ Error during testing: {e}")
@@ -3,25 +3,26 @@
 Test the subscription system
 """
 
-import requests
-import json
 import sys
+import orjson
+from _http_helpers import SESSION, api_url, health, login
 
-API_BASE_URL = "http://localhost:8000"
+# Sample resume uploaded by the job matching checks, encoded once
+RESUME_BYTES = b"""
+John Doe
+Software Engineer
 
-def test_health_check():
-    """Test if the API is running"""
-    try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/health")
-        if response.status_code == 200:
-            print("✅ API is running and healthy")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Cannot connect to API: {e}")
-        return False
+Skills:
+- Python
+- FastAPI
+- Subscription Management
+- Payment Processing
+
+Experience:
+- 3 years as Python Developer
+- Built subscription systems
+- Implemented payment gateways
+"""
 
 def register_test_user():
     """Register a test user"""
@@ -35,10 +36,14 @@ def register_test_user():
     }
     
     try:
-        response = requests.post(f"{API_BASE_URL}/api/v1/auth/register", json=user_data)
+        response = SESSION.post(
+            api_url("/api/v1/auth/register"),
+            data=orjson.dumps(user_data),
+            headers={"Content-Type": "application/json"}
+        )
         
         if response.status_code == 201:
-            user = response.json()
+            user = orjson.loads(response.content)
             print(f"   ✅ User registered successfully")
             print(f"   📧 Email: {user['email']}")
             print(f"   💳 Initial Subscription: {user['subscription_tier']}")
@@ -53,23 +58,14 @@ def register_test_user():
         return None
 
 def login_user(email: str, password: str):
-    """Login user and get token"""
+    """Login user and get token; the shared session then sends it"""
     print("🔍 Logging in user...")
     
-    login_data = {
-        "username": email,
-        "password": password
-    }
-    
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/auth/jwt/login",
-            data=login_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
+        response = login(email, password)
         
         if response.status_code == 200:
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             print(f"   ✅ Login successful")
             return token_data['access_token']
         else:
@@ -80,20 +76,15 @@ def login_user(email: str, password: str):
         print(f"   ❌ Error: {e}")
         return None
 
-def test_subscription_info(token: str):
+def test_subscription_info():
     """Test getting subscription information"""
     print("🔍 Testing Subscription Info...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/auth/me/subscription", headers=headers)
+        response = SESSION.get(api_url("/api/v1/auth/me/subscription"))
         
         if response.status_code == 200:
-            subscription = response.json()
+            subscription = orjson.loads(response.content)
             print(f"   ✅ Subscription info retrieved")
             print(f"   💳 Tier: {subscription['tier']}")
             print(f"   📊 Monthly limit: {subscription['monthly_limit']}")
@@ -113,24 +104,19 @@ def test_subscription_info(token: str):
         print(f"   ❌ Error: {e}")
         return None
 
-def test_subscription_upgrade(token: str, tier: str):
+def test_subscription_upgrade(tier: str):
     """Test upgrading subscription"""
     print(f"🔍 Testing Subscription Upgrade to {tier}...")
     
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/subscription/upgrade",
-            json=tier,
-            headers=headers
+        response = SESSION.post(
+            api_url("/api/v1/subscription/upgrade"),
+            data=orjson.dumps(tier),
+            headers={"Content-Type": "application/json"}
         )
         
         if response.status_code == 200:
-            subscription = response.json()
+            subscription = orjson.loads(response.content)
             print(f"   ✅ Subscription upgraded successfully")
             print(f"   💳 New tier: {subscription['tier']}")
             print(f"   📊 New monthly limit: {subscription['monthly_limit']}")
@@ -146,44 +132,19 @@ def test_subscription_upgrade(token: str, tier: str):
         print(f"   ❌ Error: {e}")
         return None
 
-def test_job_matching_with_limits(token: str):
+def test_job_matching_with_limits():
     """Test job matching to verify subscription limits"""
     print("🔍 Testing Job Matching with Subscription Limits...")
     
-    # Create a test resume file
-    test_resume = """
-John Doe
-Software Engineer
-
-Skills:
-- Python
-- FastAPI
-- Subscription Management
-- Payment Processing
-
-Experience:
-- 3 years as Python Developer
-- Built subscription systems
-- Implemented payment gateways
-"""
-    
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
-    
     try:
         files = {
-            'file': ('test_resume.txt', test_resume, 'text/plain')
+            'file': ('test_resume.txt', RESUME_BYTES, 'text/plain')
         }
         
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/jobs/match",
-            files=files,
-            headers=headers
-        )
+        response = SESSION.post(api_url("/api/v1/jobs/match"), files=files)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"   ✅ Job matching successful")
             print(f"   🆔 Task ID: {result['task_id']}")
             return True
@@ -206,7 +167,7 @@ def main():
     print("=" * 50)
     
     # Check if API is running
-    if not test_health_check():
+    if not health():
         print("\nPlease make sure the API server is running:")
         print("python main.py")
         sys.exit(1)
@@ -230,7 +191,7 @@ def main():
     print()
     
     # Test initial subscription info
-    subscription = test_subscription_info(token)
+    subscription = test_subscription_info()
     if not subscription:
         print("❌ Subscription info failed")
         return
@@ -238,14 +199,14 @@ def main():
     print()
     
     # Test job matching with free tier
-    if not test_job_matching_with_limits(token):
+    if not test_job_matching_with_limits():
         print("❌ Job matching test failed")
         return
     
     print()
     
     # Test subscription upgrade to Pro
-    upgraded_subscription = test_subscription_upgrade(token, "pro")
+    upgraded_subscription = test_subscription_upgrade("pro")
     if not upgraded_subscription:
         print("❌ Subscription upgrade failed")
         return
@@ -253,7 +214,7 @@ def main():
     print()
     
     # Test subscription info after upgrade
-    final_subscription = test_subscription_info(token)
+    final_subscription = test_subscription_info()
     
     print()
     print("=" * 50)
@@ -3,8 +3,11 @@
 Simple test to verify Celery task execution
 """
 
+import argparse
 import sys
 import time
+from celery import group
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 
 def test_task_execution():
     """Test if tasks are being executed"""
@@ -19,31 +22,28 @@ def test_task_execution():
         
         # Create and send task
         print("🚀 Sending health check task...")
-        result = health_check_task.delay()
+        result = health_check_task.apply_async(ignore_result=False)
         
         print(f"📋 Task ID: {result.id}")
         print(f"📊 Initial state: {result.state}")
         
-        # Wait for completion
+        # Wait for completion; the result backend notifies us as soon as
+        # the task finishes instead of us re-reading its state every second
         print("⏳ Waiting for task completion (max 30 seconds)...")
         
-        for i in range(30):
-            state = result.state
-            print(f"   [{i+1:2d}s] State: {state}")
-            
-            if state == 'SUCCESS':
-                task_result = result.get()
-                print(f"✅ Task completed successfully!")
-                print(f"📊 Result: {task_result}")
-                return True
-            elif state == 'FAILURE':
-                print(f"❌ Task failed: {result.info}")
-                return False
-            
-            time.sleep(1)
-        
-        print(f"⏰ Task did not complete within 30 seconds")
-        print(f"📊 Final state: {result.state}")
+        try:
+            task_result = result.get(timeout=30, propagate=False)
+        except CeleryTimeoutError:
+            print(f"⏰ Task did not complete within 30 seconds")
+            print(f"📊 Final state: {result.state}")
+            return False
+        
+        if result.successful():
+            print(f"✅ Task completed successfully!")
+            print(f"📊 Result: {task_result}")
+            return True
+        
+        print(f"❌ Task failed: {result.info}")
         return False
         
     except Exception as e:
@@ -57,6 +57,7 @@ def test_resume_task():
     
     try:
         from app.services.tasks import process_resume_and_match_jobs
+        from app.services.file_service import FileService
         
         print("✅ Successfully imported process_resume_and_match_jobs")
         
@@ -65,7 +66,7 @@ def test_resume_task():
         
         print("🚀 Sending resume processing task...")
         result = process_resume_and_match_jobs.delay(
-            file_content=test_content.encode('utf-8'),
+            file_path=FileService().save_file_content(test_content.encode('utf-8'), "test_resume.txt"),
             filename="test_resume.txt",
             content_type="text/plain"
         )
@@ -73,49 +74,96 @@ def test_resume_task():
         print(f"📋 Task ID: {result.id}")
         print(f"📊 Initial state: {result.state}")
         
-        # Monitor for longer time since this task takes more time
+        # Monitor for longer time since this task takes more time; state and
+        # progress updates are pushed by the result backend as they happen
         print("⏳ Waiting for task completion (max 60 seconds)...")
         
-        for i in range(60):
-            state = result.state
-            print(f"   [{i+1:2d}s] State: {state}")
-            
-            if state == 'SUCCESS':
-                task_result = result.get()
-                print(f"✅ Task completed successfully!")
-                matched_jobs = task_result.get('matched_jobs', [])
-                print(f"📊 Found {len(matched_jobs)} matched jobs")
-                print(f"⏱️  Processing time: {task_result.get('processing_time_seconds', 0):.2f}s")
-                return True
-            elif state == 'FAILURE':
-                print(f"❌ Task failed: {result.info}")
-                return False
-            elif state == 'STARTED':
-                # Try to get progress info
-                if hasattr(result, 'info') and result.info:
-                    if isinstance(result.info, dict):
-                        progress = result.info.get('progress', '')
-                        percentage = result.info.get('percentage', '')
-                        if progress:
-                            print(f"       Progress: {progress} ({percentage}%)")
-            
-            time.sleep(1)
-        
-        print(f"⏰ Task did not complete within 60 seconds")
-        print(f"📊 Final state: {result.state}")
+        def on_message(meta):
+            print(f"   State: {meta['status']}")
+            info = meta.get('result')
+            if meta['status'] == 'STARTED' and isinstance(info, dict):
+                progress = info.get('progress', '')
+                percentage = info.get('percentage', '')
+                if progress:
+                    print(f"       Progress: {progress} ({percentage}%)")
+        
+        try:
+            task_result = result.get(timeout=60, on_message=on_message, propagate=False)
+        except CeleryTimeoutError:
+            print(f"⏰ Task did not complete within 60 seconds")
+            print(f"📊 Final state: {result.state}")
+            return False
+        
+        if result.successful():
+            print(f"✅ Task completed successfully!")
+            matched_jobs = task_result.get('matched_jobs', [])
+            print(f"📊 Found {len(matched_jobs)} matched jobs")
+            print(f"⏱️  Processing time: {task_result.get('processing_time_seconds', 0):.2f}s")
+            return True
+        
+        print(f"❌ Task failed: {result.info}")
         return False
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return False
 
+def test_task_burst(count):
+    """Send many health check tasks in one group and wait for all of them"""
+    print(f"\n🧪 Stress Testing with {count} Health Check Tasks")
+    print("=" * 40)
+    
+    try:
+        from app.services.tasks import health_check_task
+        
+        # A group publishes every message over one producer connection and
+        # is collected as a single GroupResult. health_check_task doesn't
+        # store results by default, so each signature opts back in
+        signature = health_check_task.s().set(ignore_result=False)
+        start_time = time.monotonic()
+        group_result = group(signature.clone() for _ in range(count)).apply_async()
+        sent_time = time.monotonic()
+        print(f"🚀 Sent {count} tasks in {sent_time - start_time:.2f}s")
+        
+        # On the Redis backend this is a native join: results arrive over
+        # pub/sub and are fetched in bulk instead of one result at a time.
+        # Backends without one (e.g. RPC) fall back to a per-result join
+        join = group_result.join_native if group_result.supports_native_join else group_result.join
+        try:
+            results = join(timeout=60, propagate=False)
+        except CeleryTimeoutError:
+            print(f"⏰ Only {group_result.completed_count()}/{count} tasks completed within 60 seconds")
+            return False
+        
+        # Only a stored health payload counts; a missing result means the
+        # task ran without writing to the backend
+        healthy = sum(
+            1 for result in results
+            if isinstance(result, dict) and result.get('status') == 'healthy'
+        )
+        passed = len(results) == count and healthy == count
+        print(f"{'✅' if passed else '❌'} {healthy}/{count} tasks returned a result in {time.monotonic() - sent_time:.2f}s")
+        return passed
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        return False
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stress", type=int, metavar="N", default=0,
+                        help="also send N health check tasks at once as a load test")
+    args = parser.parse_args()
+    
     print("🧪 Celery Task Execution Test")
     print("=" * 50)
     
     # Test simple task first
     health_success = test_task_execution()
     
+    if health_success and args.stress:
+        health_success = test_task_burst(args.stress)
+    
     if health_success:
         print("\n" + "="*50)
         # Test complex task
@@ -7,12 +7,25 @@ from fastapi.testclient import TestClient
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
     """
     Create a test client for the FastAPI app
+    
+    Shared by the whole session; the app keeps no per-request state, and
+    startup/shutdown events run once.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client_fresh():
+    """
+    Create a separate test client for tests that need isolation
     """
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -4,20 +4,50 @@ Simple script to test the Resume Job Matcher API endpoints.
 Make sure the FastAPI server and Celery worker are running before executing this script.
 """
 
+import random
 import requests
 import time
 import json
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
 SAMPLE_RESUME_PATH = "sample_resume.txt"
 
+# One keep-alive session for every call, so status polls reuse a connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
+def post_file(url, field, filename, content, content_type):
+    """
+    POST a single file as multipart/form-data.
+    
+    With requests_toolbelt installed the body is streamed from the file in
+    chunks instead of being assembled in memory; otherwise requests builds
+    it with files=.
+    """
+    if MultipartEncoder is None:
+        return SESSION.post(url, files={field: (filename, content, content_type)})
+    
+    encoder = MultipartEncoder(fields={field: (filename, content, content_type)})
+    return SESSION.post(url, data=encoder, headers={"Content-Type": encoder.content_type})
+
 def test_health_endpoint():
     """Test the health check endpoint."""
     print("Testing health endpoint...")
     try:
-        response = requests.get(f"{API_BASE_URL}/health")
+        response = SESSION.get(f"{API_BASE_URL}/health")
         if response.status_code == 200:
             data = response.json()
             print(f"✓ Health check passed: {data}")
@@ -43,8 +73,7 @@ def test_upload_resume():
     
     try:
         with open(SAMPLE_RESUME_PATH, 'rb') as file:
-            files = {'file': (SAMPLE_RESUME_PATH, file, 'text/plain')}
-            response = requests.post(f"{API_BASE_URL}/api/match-jobs", files=files)
+            response = post_file(f"{API_BASE_URL}/api/match-jobs", 'file', SAMPLE_RESUME_PATH, file, 'text/plain')
         
         if response.status_code == 200:
             data = response.json()
@@ -63,15 +92,74 @@ def test_upload_resume():
         print(f"✗ Resume upload error: {e}")
         return None
 
+def report_task_result(data):
+    """Print a finished task's outcome and return whether it succeeded."""
+    status = data.get('status')
+    if status == 'SUCCESS':
+        print("✓ Task completed successfully!")
+        result = data.get('result') or []
+        print(f"  Found {len(result)} matching jobs:")
+        
+        for i, job in enumerate(result[:3], 1):  # Show first 3 jobs
+            print(f"    {i}. {job['title']} at {job['company']}")
+            print(f"       Location: {job['location']}")
+            print(f"       Similarity: {job['similarity_score']:.3f}")
+            print(f"       URL: {job['url']}")
+            print()
+        
+        return True
+    
+    print(f"✗ Task failed: {data.get('error', 'Unknown error')}")
+    return False
+
+def stream_task_status(task_id, max_wait_time):
+    """
+    Follow the task's Server-Sent Events until it finishes.
+    
+    Returns the final status payload, or None when the stream endpoint is
+    unavailable or closes before the task finishes.
+    """
+    try:
+        with SESSION.get(
+            f"{API_BASE_URL}/api/v1/tasks/{task_id}/events",
+            params={"timeout": max_wait_time},
+            headers={"Accept": "text/event-stream"},
+            stream=True,
+            timeout=(5, 30)  # the server sends a keep-alive at least every 15s
+        ) as response:
+            if response.status_code != 200:
+                return None
+            
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = json.loads(line[len("data:"):])
+                print(f"  Status: {data.get('status')}")
+                if data.get('progress'):
+                    print(f"  Progress: {data['progress']}")
+                if data.get('status') in ('SUCCESS', 'FAILURE', 'REVOKED'):
+                    return data
+    except Exception as e:
+        print(f"  Status stream unavailable ({e}), falling back to polling")
+    
+    return None
+
 def test_task_status(task_id, max_wait_time=60):
     """Test checking task status and wait for completion."""
     print(f"\nTesting task status for task: {task_id}")
     
-    start_time = time.time()
+    # One streamed request when the API offers it; polling otherwise
+    data = stream_task_status(task_id, max_wait_time)
+    if data is not None:
+        return report_task_result(data)
+    
+    # Poll quickly at first, backing off to 2s (with jitter) for long tasks
+    deadline = time.monotonic() + max_wait_time
+    delay = 0.1
     
-    while time.time() - start_time < max_wait_time:
+    while time.monotonic() < deadline:
         try:
-            response = requests.get(f"{API_BASE_URL}/api/task-status/{task_id}")
+            response = SESSION.get(f"{API_BASE_URL}/api/task-status/{task_id}")
             
             if response.status_code == 200:
                 data = response.json()
@@ -82,33 +170,18 @@ def test_task_status(task_id, max_wait_time=60):
                 if 'progress' in data:
                     print(f"  Progress: {data['progress']}")
                 
-                if status == 'SUCCESS':
-                    print("✓ Task completed successfully!")
-                    result = data.get('result', [])
-                    print(f"  Found {len(result)} matching jobs:")
-                    
-                    for i, job in enumerate(result[:3], 1):  # Show first 3 jobs
-                        print(f"    {i}. {job['title']} at {job['company']}")
-                        print(f"       Location: {job['location']}")
-                        print(f"       Similarity: {job['similarity_score']:.3f}")
-                        print(f"       URL: {job['url']}")
-                        print()
-                    
-                    return True
-                
-                elif status == 'FAILURE':
-                    print(f"✗ Task failed: {data.get('error', 'Unknown error')}")
-                    return False
+                if status in ('SUCCESS', 'FAILURE'):
+                    return report_task_result(data)
                 
                 elif status in ['PENDING', 'STARTED']:
                     print("  Task is still processing...")
-                    time.sleep(5)  # Wait 5 seconds before checking again
-                    continue
                 
                 else:
                     print(f"  Unknown status: {status}")
-                    time.sleep(2)
-                    continue
+                
+                time.sleep(delay + random.uniform(0, delay * 0.1))
+                delay = min(delay * 2, 2.0)
+                continue
                     
             else:
                 print(f"✗ Status check failed: {response.status_code}")
@@ -129,7 +202,7 @@ def test_invalid_file():
         # Create a temporary invalid file
         invalid_content = b"This is not a valid resume file"
         files = {'file': ('invalid.xyz', invalid_content, 'application/octet-stream')}
-        response = requests.post(f"{API_BASE_URL}/api/match-jobs", files=files)
+        response = SESSION.post(f"{API_BASE_URL}/api/match-jobs", files=files)
         
         if response.status_code == 400:
             print("✓ Invalid file correctly rejected")
@@ -6,6 +6,58 @@ This script validates the code structure without running it
 
 import ast
 import os
+import re
+
+# Files the implementation is expected to ship
+FILES_TO_CHECK = (
+    'app/services/job_scraper.py',
+    'app/core/config.py',
+    '.env.example',
+    'docs/JOB_SCRAPING_GUIDE.md',
+)
+
+# JobScraperService methods that must be defined
+REQUIRED_METHODS = (
+    '_scrape_multiple_free_sources',
+    '_scrape_remoteok_jobs',
+    '_scrape_weworkremotely_jobs',
+    '_rate_limited_request',
+    '_generate_enhanced_jobs',
+    'close',
+)
+
+# Settings that must appear in app/core/config.py
+REQUIRED_CONFIGS = (
+    'SCRAPING_MIN_DELAY',
+    'SCRAPING_MAX_DELAY',
+    'SCRAPING_MAX_RETRIES',
+    'ENABLE_REMOTEOK',
+    'ENABLE_WEWORKREMOTELY',
+    'ENABLE_ENHANCED_FALLBACK',
+)
+
+# Variables that must be documented in .env.example
+REQUIRED_ENV_VARS = (
+    'SCRAPING_MIN_DELAY',
+    'SCRAPING_MAX_DELAY',
+    'ENABLE_REMOTEOK',
+    'ENABLE_WEWORKREMOTELY',
+)
+
+# Names job_scraper.py must reference
+REQUIRED_IMPORTS = (
+    'aiohttp',
+    'BeautifulSoup',
+    'urllib.parse',
+    'random',
+    'time',
+)
+
+# Source tokens the feature checks look for, all found in one scan
+FEATURE_TOKENS = re.compile(
+    r"last_request_time|min_delay|user_agents|random\.choice|aiohttp\.ClientSession|try:|except"
+    r"|_scrape_remoteok_jobs|_scrape_weworkremotely_jobs|_generate_enhanced_jobs|async def|settings\."
+)
 
 def validate_job_scraper():
     """Validate the job scraper implementation"""
@@ -13,56 +65,47 @@ def validate_job_scraper():
     print("🔍 Validating Enhanced Job Scraper Implementation")
     print("=" * 60)
     
-    # Check if files exist
-    files_to_check = [
-        'app/services/job_scraper.py',
-        'app/core/config.py',
-        '.env.example',
-        'docs/JOB_SCRAPING_GUIDE.md'
-    ]
+    # Check if files exist, reading each one once; every check below works
+    # from these buffers
+    contents = {}
     
     print("\n1. File Existence Check:")
-    for file_path in files_to_check:
+    for file_path in FILES_TO_CHECK:
         if os.path.exists(file_path):
+            with open(file_path, 'r') as f:
+                contents[file_path] = f.read()
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path}")
     
+    scraper_content = contents.get('app/services/job_scraper.py', '')
+    
     # Validate job_scraper.py structure
     print("\n2. Job Scraper Code Structure:")
     try:
-        with open('app/services/job_scraper.py', 'r') as f:
-            content = f.read()
-        
         # Parse the AST to check for required methods
-        tree = ast.parse(content)
+        tree = ast.parse(contents['app/services/job_scraper.py'])
         
         class MethodVisitor(ast.NodeVisitor):
             def __init__(self):
-                self.methods = []
-                self.classes = []
+                self.methods = set()
+                self.classes = set()
             
             def visit_ClassDef(self, node):
-                self.classes.append(node.name)
+                self.classes.add(node.name)
                 self.generic_visit(node)
             
             def visit_FunctionDef(self, node):
-                self.methods.append(node.name)
+                self.methods.add(node.name)
                 self.generic_visit(node)
+            
+            # The scraper methods are coroutines
+            visit_AsyncFunctionDef = visit_FunctionDef
         
         visitor = MethodVisitor()
         visitor.visit(tree)
         
-        required_methods = [
-            '_scrape_multiple_free_sources',
-            '_scrape_remoteok_jobs',
-            '_scrape_weworkremotely_jobs',
-            '_rate_limited_request',
-            '_generate_enhanced_jobs',
-            'close'
-        ]
-        
-        for method in required_methods:
+        for method in REQUIRED_METHODS:
             if method in visitor.methods:
                 print(f"   ✅ {method}")
             else:
@@ -80,19 +123,9 @@ def validate_job_scraper():
     # Validate configuration
     print("\n3. Configuration Validation:")
     try:
-        with open('app/core/config.py', 'r') as f:
-            config_content = f.read()
-        
-        required_configs = [
-            'SCRAPING_MIN_DELAY',
-            'SCRAPING_MAX_DELAY',
-            'SCRAPING_MAX_RETRIES',
-            'ENABLE_REMOTEOK',
-            'ENABLE_WEWORKREMOTELY',
-            'ENABLE_ENHANCED_FALLBACK'
-        ]
+        config_content = contents['app/core/config.py']
         
-        for config in required_configs:
+        for config in REQUIRED_CONFIGS:
             if config in config_content:
                 print(f"   ✅ {config}")
             else:
@@ -104,17 +137,9 @@ def validate_job_scraper():
     # Validate .env.example
     print("\n4. Environment Configuration:")
     try:
-        with open('.env.example', 'r') as f:
-            env_content = f.read()
+        env_content = contents['.env.example']
         
-        required_env_vars = [
-            'SCRAPING_MIN_DELAY',
-            'SCRAPING_MAX_DELAY',
-            'ENABLE_REMOTEOK',
-            'ENABLE_WEWORKREMOTELY'
-        ]
-        
-        for env_var in required_env_vars:
+        for env_var in REQUIRED_ENV_VARS:
             if env_var in env_content:
                 print(f"   ✅ {env_var}")
             else:
@@ -126,19 +151,8 @@ def validate_job_scraper():
     # Check imports and dependencies
     print("\n5. Import Structure:")
     try:
-        with open('app/services/job_scraper.py', 'r') as f:
-            content = f.read()
-        
-        required_imports = [
-            'aiohttp',
-            'BeautifulSoup',
-            'urllib.parse',
-            'random',
-            'time'
-        ]
-        
-        for imp in required_imports:
-            if imp in content:
+        for imp in REQUIRED_IMPORTS:
+            if imp in scraper_content:
                 print(f"   ✅ {imp}")
             else:
                 print(f"   ❌ {imp}")
@@ -148,23 +162,22 @@ def validate_job_scraper():
     
     print("\n6. Implementation Features:")
     
-    # Check for rate limiting implementation
-    with open('app/services/job_scraper.py', 'r') as f:
-        content = f.read()
+    present = set(FEATURE_TOKENS.findall(scraper_content))
     
+    # Each feature needs all of its tokens somewhere in the scraper
     features = [
-        ('Rate Limiting', 'last_request_time' in content and 'min_delay' in content),
-        ('User Agent Rotation', 'user_agents' in content and 'random.choice' in content),
-        ('Session Management', 'aiohttp.ClientSession' in content),
-        ('Error Handling', 'try:' in content and 'except' in content),
-        ('Multiple Sources', '_scrape_remoteok_jobs' in content and '_scrape_weworkremotely_jobs' in content),
-        ('Enhanced Fallback', '_generate_enhanced_jobs' in content),
-        ('Async Support', 'async def' in content),
-        ('Configuration Integration', 'settings.' in content)
+        ('Rate Limiting', {'last_request_time', 'min_delay'}),
+        ('User Agent Rotation', {'user_agents', 'random.choice'}),
+        ('Session Management', {'aiohttp.ClientSession'}),
+        ('Error Handling', {'try:', 'except'}),
+        ('Multiple Sources', {'_scrape_remoteok_jobs', '_scrape_weworkremotely_jobs'}),
+        ('Enhanced Fallback', {'_generate_enhanced_jobs'}),
+        ('Async Support', {'async def'}),
+        ('Configuration Integration', {'settings.'})
     ]
     
-    for feature_name, has_feature in features:
-        if has_feature:
+    for feature_name, tokens in features:
+        if tokens <= present:
             print(f"   ✅ {feature_name}")
         else:
             print(f"   ❌ {feature_name}")